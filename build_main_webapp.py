@@ -22,6 +22,8 @@ pyi_args = ['main_webapp_launcher.py',
             # '--add-data', './hlrules;.',
             # '--add-data', './hlrules_sm;.',
             # '--add-data', './llrules;.',
+            # loaded dynamically by plotly for faster JSON serialization
+            '--hidden-import=orjson',
             '--collect-data=dash_daq',
             '--collect-data=scipy']
 
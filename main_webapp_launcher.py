@@ -1,9 +1,19 @@
+import argparse
 from datetime import datetime
+import hashlib
 import logging
 import os
+import pathlib
+import pickle
+import socket
 import sys
+import time
+from typing import TYPE_CHECKING, FrozenSet, Iterable, Optional
 
-from waitress import serve
+if TYPE_CHECKING:
+    # only needed for annotations: the heavy imports are deferred to the functions using them
+    from pcgsepy.lsystem.lsystem import LSystem
+    from pcgsepy.mapelites.map import MAPElites
 
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     os.chdir(sys._MEIPASS)
@@ -11,26 +21,9 @@ if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
 else:
     curr_folder = sys.path[0]
 
-import argparse
-import webbrowser
-
-from pcgsepy.config import ACTIVE_LOGGERS, BIN_N
-from pcgsepy.evo.fitness import (Fitness, box_filling_fitness,
-                                 func_blocks_fitness, mame_fitness,
-                                 mami_fitness)
-from pcgsepy.evo.genops import expander
-from pcgsepy.guis.main_webapp.webapp import app, serve_layout, app_settings
-from pcgsepy.mapelites.behaviors import (BehaviorCharacterization, avg_ma,
-                                         mame, mami, symmetry)
-from pcgsepy.setup_utils import get_default_lsystem, setup_matplotlib
-from pcgsepy.mapelites.buffer import Buffer, mean_merge
-from pcgsepy.nn.estimators import GaussianEstimator
-from pcgsepy.mapelites.map import MAPElites
-from pcgsepy.mapelites.emitters import ContextualBanditEmitter, RandomEmitter
-from sklearn.gaussian_process.kernels import DotProduct, WhiteKernel
 
 parser = argparse.ArgumentParser()
-parser.add_argument("--mapelites_file", help="Location of the MAP-Elites object",
+parser.add_argument("--mapelites_file", help="Location of the pickled MAP-Elites object (rebuilt if missing or outdated)",
                     type=str, default=None)
 parser.add_argument("--dev_mode", help="Launch the webapp in developer mode",
                     action='store_true')
@@ -40,122 +33,321 @@ parser.add_argument("--host", help="Specify host address",
                     type=str, default='127.0.0.1')
 parser.add_argument("--port", help="Specify port",
                     type=int, default=8050)
+parser.add_argument("--threads", help="Number of threads serving the webapp (defaults to $WAITRESS_THREADS, or twice the number of CPUs)",
+                    type=int, default=None)
+
+
+def _get_n_threads(threads: Optional[int] = None) -> int:
+    """Get the number of threads the webapp should be served with.
+
+    Args:
+        threads (Optional[int], optional): The number of threads requested. Defaults to None.
+
+    Returns:
+        int: The number of threads.
+    """
+    if threads is None and os.environ.get('WAITRESS_THREADS'):
+        threads = int(os.environ['WAITRESS_THREADS'])
+    if threads is None:
+        threads = max(4, min(32, (os.cpu_count() or 2) * 2))
+    return threads
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """A `logging.Formatter` that formats the record time at most once per second."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, s = self._cached_time
+        if second != cached_second:
+            s = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, s)
+        if datefmt:
+            return s
+        return self.default_msec_format % (s, record.msecs)
+
+
+def _set_active_loggers(logger_names: Iterable[str]) -> None:
+    """Log at `DEBUG` level on the given loggers. Loggers not yet created get the level when they are first requested.
+
+    Args:
+        logger_names (Iterable[str]): The names of the loggers.
+    """
+    active_loggers = frozenset(logger_names)
+
+    class _ActiveLogger(logging.getLoggerClass()):
+        def __init__(self, name: str, level: int = logging.NOTSET) -> None:
+            super().__init__(name, logging.DEBUG if name in active_loggers else level)
+
+    logging.setLoggerClass(_ActiveLogger)
+    for name, logger in list(logging.Logger.manager.loggerDict.items()):
+        if name in active_loggers and isinstance(logger, logging.Logger):
+            logger.setLevel(logging.DEBUG)
+
+
+def _load_lsystem(used_ll_blocks: FrozenSet[str]) -> 'LSystem':
+    """Get the default L-system, reusing the on-disk cache if available.
+    The cache is invalidated whenever `pcgsepy.setup_utils`, the `pcgsepy.lsystem` sources,
+    the rulesets or the atoms files are modified.
+
+    Args:
+        used_ll_blocks (FrozenSet[str]): Set of game blocks used.
+
+    Returns:
+        LSystem: The default L-system.
+    """
+    import pcgsepy.setup_utils as setup_utils
+    from pcgsepy.config import COMMON_ATOMS, HL_ATOMS
+
+    key = hashlib.sha1(repr(sorted(used_ll_blocks)).encode()).hexdigest()
+    cache_file = os.path.join(curr_folder, f'.lsystem_cache_{key}.pkl')
+    try:
+        stamp = tuple(os.path.getmtime(f) for f in [setup_utils.__file__,
+                                                     *sorted(pathlib.Path(setup_utils.__file__).parent.joinpath('lsystem').glob('*.py')),
+                                                     os.path.join(curr_folder, 'hlrules_sm'),
+                                                     os.path.join(curr_folder, 'llrules'),
+                                                     os.path.join(curr_folder, COMMON_ATOMS),
+                                                     os.path.join(curr_folder, HL_ATOMS)])
+    except OSError:
+        # e.g. frozen executable: no source files to check the cache against
+        return setup_utils.get_default_lsystem(used_ll_blocks=used_ll_blocks)
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_stamp, lsystem = pickle.load(f)
+        if cached_stamp == stamp:
+            return lsystem
+    except Exception:
+        pass
+    lsystem = setup_utils.get_default_lsystem(used_ll_blocks=used_ll_blocks)
+    try:
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((stamp, lsystem), f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logging.getLogger('webapp').warning(f'Could not cache the L-system ({e}).')
+    return lsystem
+
+
+def _build_mapelites() -> 'MAPElites':
+    """Create the MAP-Elites object used by the webapp.
+    All the heavy scientific imports are deferred to this function.
+
+    Returns:
+        MAPElites: The MAP-Elites object.
+    """
+    from pcgsepy.config import BIN_N
+    from pcgsepy.evo.fitness import (Fitness, box_filling_fitness,
+                                     func_blocks_fitness, mame_fitness,
+                                     mami_fitness)
+    from pcgsepy.evo.genops import expander
+    from pcgsepy.mapelites.behaviors import (BehaviorCharacterization, avg_ma,
+                                             mame, mami, symmetry)
+    from pcgsepy.mapelites.buffer import Buffer, mean_merge
+    from pcgsepy.nn.estimators import GaussianEstimator
+    from pcgsepy.hullbuilder import HullBuilder
+    from pcgsepy.mapelites.map import MAPElites
+    from pcgsepy.mapelites.emitters import ContextualBanditEmitter
+    from sklearn.gaussian_process.kernels import DotProduct, WhiteKernel
+
+    used_ll_blocks = frozenset(sys.intern(block_type) for block_type in (
+        #usable blocks
+        #Cockpits
+        'MyObjectBuilder_Cockpit_OpenCockpitLarge',
+        #Energy Generation
+        'MyObjectBuilder_Reactor_LargeBlockSmallGenerator',
+        #Ship Control
+        'MyObjectBuilder_Gyro_LargeBlockGyro',
+        #Storage
+        'MyObjectBuilder_CargoContainer_LargeBlockSmallContainer',
+        #Thrusters
+        'MyObjectBuilder_Thrust_LargeBlockSmallThrust',
+        #Lights
+        'MyObjectBuilder_InteriorLight_SmallLight',
+        'MyObjectBuilder_InteriorLight_LargeBlockLight_1corner',
+        #Integrity Blocks
+        'MyObjectBuilder_CubeBlock_LargeBlockArmorCornerInv',
+        'MyObjectBuilder_CubeBlock_LargeBlockArmorCorner',
+        'MyObjectBuilder_CubeBlock_LargeBlockArmorSlope',
+        'MyObjectBuilder_CubeBlock_LargeBlockArmorBlock',
+        'MyObjectBuilder_CubeBlock_Window1x1Slope',
+        'MyObjectBuilder_CubeBlock_Window1x1Flat',
+    ))
+
+    lsystem = _load_lsystem(used_ll_blocks=used_ll_blocks)
+
+    expander.initialize(rules=lsystem.hl_solver.parser.rules)
+
+    feasible_fitnesses = [
+        Fitness(name='BoxFilling',
+                f=box_filling_fitness,
+                bounds=(0, 1)),
+        Fitness(name='FuncionalBlocks',
+                f=func_blocks_fitness,
+                bounds=(0, 1)),
+        Fitness(name='MajorMediumProportions',
+                f=mame_fitness,
+                bounds=(0, 1)),
+        Fitness(name='MajorMinimumProportions',
+                f=mami_fitness,
+                bounds=(0, 1))
+    ]
+
+    behavior_descriptors = [
+        BehaviorCharacterization(name='Major axis / Medium axis',
+                                 func=mame,
+                                 bounds=(0, 6)),
+        BehaviorCharacterization(name='Major axis / Smallest axis',
+                                 func=mami,
+                                 bounds=(0, 12)),
+        BehaviorCharacterization(name='Average Proportions',
+                                 func=avg_ma,
+                                 bounds=(0, 10)),
+        BehaviorCharacterization(name='Symmetry',
+                                 func=symmetry,
+                                 bounds=(0, 1))
+    ]
+
+    buffer = Buffer(merge_method=mean_merge)
+    mapelites = MAPElites(lsystem=lsystem,
+                          feasible_fitnesses=feasible_fitnesses,
+                          estimator=GaussianEstimator(bound='upper',
+                                                      kernel=DotProduct() + WhiteKernel(),
+                                                      max_f=sum(f.bounds[1] for f in feasible_fitnesses)),
+                          buffer=buffer,
+                          behavior_descriptors=behavior_descriptors,
+                          n_bins=BIN_N,
+                          emitter=ContextualBanditEmitter(estimator='mlp',
+                                                          tau=0.5,
+                                                          sampling_decay=0.05),
+                          allow_aging=False,
+                          hull_builder=HullBuilder(erosion_type='bin',
+                                                   apply_erosion=True,
+                                                   apply_smoothing=False))
+
+    return mapelites
+
+
+def _get_mapelites(mapelites_file: Optional[str] = None) -> 'MAPElites':
+    """Get the MAP-Elites object used by the webapp.
+    If `mapelites_file` exists and was saved from the current sources, the object is unpickled from it;
+    otherwise it is built and, if `mapelites_file` is set, pickled to it.
+    The file is invalidated whenever the `pcgsepy` sources, this launcher, `configs.ini`,
+    the rulesets, the atoms files or the block definitions are modified.
+
+    Args:
+        mapelites_file (Optional[str], optional): The location of the pickled MAP-Elites object. Defaults to None.
+
+    Returns:
+        MAPElites: The MAP-Elites object.
+    """
+    if mapelites_file is None:
+        return _build_mapelites()
+    from pcgsepy.config import COMMON_ATOMS, HL_ATOMS
+
+    try:
+        stamp = tuple(os.path.getmtime(f) for f in [__file__,
+                                                     *sorted(pathlib.Path(curr_folder, 'pcgsepy').rglob('*.py')),
+                                                     os.path.join(curr_folder, 'configs.ini'),
+                                                     os.path.join(curr_folder, 'block_definitions.json'),
+                                                     os.path.join(curr_folder, 'hlrules'),
+                                                     os.path.join(curr_folder, 'hlrules_sm'),
+                                                     os.path.join(curr_folder, 'llrules'),
+                                                     os.path.join(curr_folder, COMMON_ATOMS),
+                                                     os.path.join(curr_folder, HL_ATOMS)])
+    except OSError:
+        # e.g. frozen executable: no source files to check the saved object against
+        logging.getLogger('webapp').warning(f'Could not check {mapelites_file} against the sources, building a new MAP-Elites object.')
+        return _build_mapelites()
+    try:
+        with open(mapelites_file, 'rb') as f:
+            saved_stamp, mapelites = pickle.load(f)
+        if saved_stamp == stamp:
+            from pcgsepy.evo.genops import expander
+            expander.initialize(rules=mapelites.lsystem.hl_solver.parser.rules)
+            return mapelites
+        logging.getLogger('webapp').info(f'{mapelites_file} is outdated, building a new MAP-Elites object.')
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.getLogger('webapp').warning(f'Could not load {mapelites_file} ({e}), building a new MAP-Elites object.')
+    mapelites = _build_mapelites()
+    try:
+        tmp_file = f'{mapelites_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((stamp, mapelites), f)
+        os.replace(tmp_file, mapelites_file)
+    except OSError as e:
+        logging.getLogger('webapp').warning(f'Could not save the MAP-Elites object ({e}).')
+    return mapelites
+
+if __name__ == '__main__':
+    import webbrowser
+
+    from waitress import serve
+
+    args = parser.parse_args()
+
+    from pcgsepy.config import ACTIVE_LOGGERS
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    current_datetime = datetime.now().strftime("%Y%m%d%H%M%S")
+    # the log file is only created on the first record written to it
+    file_handler = logging.FileHandler(filename=pathlib.Path(curr_folder, f'log_{current_datetime}.log'),
+                                       mode='w',
+                                       delay=True)
+    file_handler.setLevel(logging.DEBUG)
+    sysout_handler = logging.StreamHandler(sys.stdout)
+    sysout_handler.setLevel(logging.DEBUG if args.debug else logging.INFO)
+
+    formatter = _CachedTimeFormatter(fmt='[%(asctime)s] %(message)s')
+    file_handler.setFormatter(formatter)
+    sysout_handler.setFormatter(formatter)
+
+    logging.basicConfig(level=logging.WARNING,
+                        handlers=[
+                            sysout_handler,
+                            file_handler
+                        ])
+
+    _set_active_loggers(logger_names=ACTIVE_LOGGERS)
+
+    from pcgsepy.setup_utils import setup_matplotlib
+    setup_matplotlib(larger_fonts=False)
+
+    mapelites = _get_mapelites(mapelites_file=args.mapelites_file)
+
+    from pcgsepy.guis.main_webapp.webapp import app, serve_layout, app_settings
+
+    app_settings.initialize(mapelites=mapelites,
+                            dev_mode=args.dev_mode)
+
+    app.layout = serve_layout
+
+    webapp_url = f'http://{args.host}:{args.port}/'
+    logging.getLogger().info(f'Serving webapp on http://{args.host}:{args.port}/...')
+    # bind and listen before opening the browser, so its first request is queued instead of refused
+    address_family = socket.getaddrinfo(args.host, args.port, type=socket.SOCK_STREAM)[0][0]
+    server_socket = socket.create_server((args.host, args.port),
+                                         family=address_family)
+    webbrowser.open_new(webapp_url)
+
+    # close the splash screen if launched via application
+    try:
+        import pyi_splash
+        if pyi_splash.is_alive():
+            pyi_splash.close()
+    except ModuleNotFoundError as e:
+        pass
+
+    n_threads = _get_n_threads(threads=args.threads)
+    logging.getLogger().info(f'Using {n_threads} threads.')
 
-args = parser.parse_args()
-
-logging.getLogger('werkzeug').setLevel(logging.ERROR)
-
-current_datetime = datetime.now().strftime("%Y%m%d%H%M%S")
-file_handler = logging.FileHandler(filename=os.path.join(curr_folder, f'log_{current_datetime}.log'),
-                                   mode='w+')
-file_handler.addFilter(lambda record: record.levelno >= logging.DEBUG)
-sysout_handler = logging.StreamHandler(sys.stdout)
-sysout_handler.addFilter(lambda record: record.levelno >= (logging.DEBUG if args.debug else logging.INFO))
-
-logging.basicConfig(level=logging.WARNING,
-                    format='[%(asctime)s] %(message)s',
-                    handlers=[
-                        sysout_handler,
-                        file_handler
-                    ])
-
-for logger_name in ACTIVE_LOGGERS:
-    logging.getLogger(logger_name).setLevel(logging.DEBUG)
-
-setup_matplotlib(larger_fonts=False)
-
-used_ll_blocks = [
-    #usable blocks
-    #Cockpits
-    'MyObjectBuilder_Cockpit_OpenCockpitLarge',
-    #Energy Generation
-    'MyObjectBuilder_Reactor_LargeBlockSmallGenerator',
-    #Ship Control
-    'MyObjectBuilder_Gyro_LargeBlockGyro',
-    #Storage
-    'MyObjectBuilder_CargoContainer_LargeBlockSmallContainer',
-    #Thrusters
-    'MyObjectBuilder_Thrust_LargeBlockSmallThrust',
-    #Lights
-    'MyObjectBuilder_InteriorLight_SmallLight',
-    'MyObjectBuilder_InteriorLight_LargeBlockLight_1corner',
-    #Integrity Blocks
-    'MyObjectBuilder_CubeBlock_LargeBlockArmorCornerInv',
-    'MyObjectBuilder_CubeBlock_LargeBlockArmorCorner',
-    'MyObjectBuilder_CubeBlock_LargeBlockArmorSlope',
-    'MyObjectBuilder_CubeBlock_LargeBlockArmorBlock',
-    'MyObjectBuilder_CubeBlock_Window1x1Slope',
-    'MyObjectBuilder_CubeBlock_Window1x1Flat',
-]
-
-lsystem = get_default_lsystem(used_ll_blocks=used_ll_blocks)
-
-expander.initialize(rules=lsystem.hl_solver.parser.rules)
-
-feasible_fitnesses = [
-    Fitness(name='BoxFilling',
-            f=box_filling_fitness,
-            bounds=(0, 1)),
-    Fitness(name='FuncionalBlocks',
-            f=func_blocks_fitness,
-            bounds=(0, 1)),
-    Fitness(name='MajorMediumProportions',
-            f=mame_fitness,
-            bounds=(0, 1)),
-    Fitness(name='MajorMinimumProportions',
-            f=mami_fitness,
-            bounds=(0, 1))
-]
-
-behavior_descriptors = [
-    BehaviorCharacterization(name='Major axis / Medium axis',
-                             func=mame,
-                             bounds=(0, 6)),
-    BehaviorCharacterization(name='Major axis / Smallest axis',
-                             func=mami,
-                             bounds=(0, 12)),
-    BehaviorCharacterization(name='Average Proportions',
-                             func=avg_ma,
-                             bounds=(0, 10)),
-    BehaviorCharacterization(name='Symmetry',
-                             func=symmetry,
-                             bounds=(0, 1))
-]
-
-buffer = Buffer(merge_method=mean_merge)
-mapelites = MAPElites(lsystem=lsystem,
-                      feasible_fitnesses=feasible_fitnesses,
-                      estimator=GaussianEstimator(bound='upper',
-                                                  kernel=DotProduct() + WhiteKernel(),
-                                                  max_f=sum([f.bounds[1] for f in feasible_fitnesses])),
-                      buffer=buffer,
-                      behavior_descriptors=behavior_descriptors,
-                      n_bins=BIN_N,
-                      emitter=ContextualBanditEmitter(estimator='mlp',
-                                                      tau=0.5,
-                                                      sampling_decay=0.05))
-mapelites.allow_aging = False
-
-mapelites.hull_builder.apply_smoothing = False
-
-app_settings.initialize(mapelites=mapelites,
-                        dev_mode=args.dev_mode)
-
-app.layout = serve_layout
-
-webapp_url = f'http://{args.host}:{args.port}/'
-logging.getLogger().info(f'Serving webapp on http://{args.host}:{args.port}/...')
-webbrowser.open_new(webapp_url)
-
-# close the splash screen if launched via application
-try:
-    import pyi_splash
-    if pyi_splash.is_alive():
-        pyi_splash.close()
-except ModuleNotFoundError as e:
-    pass
-
-serve(app.server,
-      threads=16,
-      host=args.host,
-      port=args.port)
+    serve(app.server,
+          threads=n_threads,
+          sockets=[server_socket])
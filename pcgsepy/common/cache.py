@@ -0,0 +1,58 @@
+from collections import OrderedDict
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class LRUCache:
+    def __init__(self,
+                 maxsize: int = 4096) -> None:
+        """Create a bounded cache that evicts the least recently used entries first.
+        The cache can be shared between threads; values are computed outside of the lock.
+
+        Args:
+            maxsize (int, optional): The maximum number of entries. Defaults to 4096.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks cannot be pickled
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_compute(self,
+                       key: Hashable,
+                       f: Callable[[], Any]) -> Any:
+        """Get the value stored for the key, computing (and storing) it if missing.
+
+        Args:
+            key (Hashable): The key.
+            f (Callable[[], Any]): The function computing the value.
+
+        Returns:
+            Any: The value.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+        value = f()
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
@@ -1,5 +1,5 @@
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from multiprocessing.sharedctypes import Value
 from os import stat
 from typing import Any, Dict, Optional, Tuple, Union
@@ -9,6 +9,8 @@ import numpy.typing as npt
 
 
 class Vec:
+    __slots__ = ['x', 'y', 'z']
+
     def __init__(self,
                  x: Union[int, float],
                  y: Union[int, float],
@@ -28,15 +30,23 @@ class Vec:
         return str(self.as_dict())
 
     def __repr__(self) -> str:
-        return str(self.__dict__)
+        return str({'x': self.x, 'y': self.y, 'z': self.z})
 
     def __eq__(self,
                other: 'Vec') -> bool:
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self.x == other.x and self.y == other.y and self.z == other.z
         else:
             return False
 
+    def __setstate__(self,
+                     state: Union[Dict[str, Any], Tuple[None, Dict[str, Any]]]) -> None:
+        # vectors pickled before `__slots__` was introduced have their state as a plain dictionary
+        if isinstance(state, tuple):
+            state = state[1]
+        for k, v in state.items():
+            setattr(self, k, v)
+
     def __hash__(self) -> int:
         return hash(self.as_tuple())
     
@@ -464,12 +474,31 @@ def get_rotation_matrix(forward: Vec,
     Returns:
         npt.NDArray[np.float32]: The rotation matrix.
     """
-    f = forward.as_array()
-    u = up.as_array()
+    return _get_rotation_matrix(forward=forward.as_tuple(),
+                                up=up.as_tuple())
+
+
+@lru_cache(maxsize=1024)
+def _get_rotation_matrix(forward: Tuple[float, float, float],
+                         up: Tuple[float, float, float]) -> npt.NDArray[np.float32]:
+    """Compute the rotation matrix from the forward and up vectors.
+    Blocks only have a handful of orientations, so each matrix is computed once and shared (as read-only array).
+
+    Args:
+        forward (Tuple[float, float, float]): The forward vector.
+        up (Tuple[float, float, float]): The up vector.
+
+    Returns:
+        npt.NDArray[np.float32]: The rotation matrix.
+    """
+    f = np.asarray(forward)
+    u = np.asarray(up)
     z = f / np.sqrt(np.dot(f, f))
     y = u / np.sqrt(np.dot(u, u))
     x = np.cross(z, y)
-    return np.column_stack((x, y, -z))
+    rotation_matrix = np.column_stack((x, y, -z))
+    rotation_matrix.flags.writeable = False
+    return rotation_matrix
 
 
 def rotate(rotation_matrix: npt.NDArray[np.float32],
@@ -1,8 +1,69 @@
-import configparser
 import os
+import re
 import sys
+from typing import Dict, Tuple
+
+# `[SECTION]` headers and `key = value` pairs; comment lines never match either
+SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+KV_RE = re.compile(r'^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+_BOOLEAN_STATES = {'1': True, 'yes': True, 'true': True, 'on': True,
+                   '0': False, 'no': False, 'false': False, 'off': False}
+
+
+class FastConfigParser:
+    # parsed files, keyed by (path, modification time)
+    _cache: Dict[Tuple[str, float], Dict[str, Dict[str, str]]] = {}
+
+    def read(self,
+             path: str) -> Dict[str, Dict[str, str]]:
+        """Parse a `.ini` file into a dictionary of sections.
+        Unlike `configparser`, this only supports single-line `key = value` pairs,
+        which is all `configs.ini` uses. Missing files result in an empty dictionary.
+
+        Args:
+            path (str): The path to the `.ini` file.
+
+        Returns:
+            Dict[str, Dict[str, str]]: The (lowercase) keys and raw values of each section.
+        """
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            return {}
+        if key not in FastConfigParser._cache:
+            data: Dict[str, Dict[str, str]] = {}
+            section = None
+            with open(path, 'r') as f:
+                lines = f.read().splitlines()
+            for line in lines:
+                m = SECTION_RE.match(line)
+                if m:
+                    section = data.setdefault(m.group(1), {})
+                    continue
+                m = KV_RE.match(line)
+                if m and section is not None:
+                    section[m.group(1).lower()] = m.group(2)
+            FastConfigParser._cache[key] = data
+        return FastConfigParser._cache[key]
+
+
+def _to_bool(value: str) -> bool:
+    """Convert a configuration value to a boolean, as `configparser.getboolean` does.
+
+    Args:
+        value (str): The raw value.
+
+    Raises:
+        ValueError: Raised if the value is not a recognized boolean.
+
+    Returns:
+        bool: The boolean value.
+    """
+    if value.lower() not in _BOOLEAN_STATES:
+        raise ValueError(f'Not a boolean: {value}')
+    return _BOOLEAN_STATES[value.lower()]
 
-config = configparser.ConfigParser()
 
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     os.chdir(sys._MEIPASS)
@@ -11,97 +72,97 @@ else:
     curr_dir = sys.path[0]
 
 # curr_dir = os.getcwd()
-config.read(os.path.join(curr_dir, 'configs.ini'))
+config = FastConfigParser().read(os.path.join(curr_dir, 'configs.ini'))
 
-USE_TORCH = config['LIBRARY'].getboolean('use_torch')
-ACTIVE_LOGGERS = [x for x in config['LIBRARY'].get('active_loggers').split(',')]
+USE_TORCH = _to_bool(config['LIBRARY']['use_torch'])
+ACTIVE_LOGGERS = [x for x in config['LIBRARY']['active_loggers'].split(',')]
 
-HOST = config['API'].get('host')
-PORT = config['API'].getint('port')
+HOST = config['API']['host']
+PORT = int(config['API']['port'])
 
 # json file with common atoms and action+args
-COMMON_ATOMS = config['L-SYSTEM'].get('common_atoms')
+COMMON_ATOMS = config['L-SYSTEM']['common_atoms']
 # json file with high level atoms and dimensions
-HL_ATOMS = config['L-SYSTEM'].get('hl_atoms')
+HL_ATOMS = config['L-SYSTEM']['hl_atoms']
 # ranges of parametric l-system
-pl_range = config['L-SYSTEM'].get('pl_range').strip().split(',')
+pl_range = config['L-SYSTEM']['pl_range'].strip().split(',')
 PL_LOW, PL_HIGH = int(pl_range[0]), int(pl_range[1])
 # required tiles for constraint components_constraint
-REQ_TILES = config['L-SYSTEM'].get('req_tiles').split(',')
+REQ_TILES = config['L-SYSTEM']['req_tiles'].split(',')
 # L-system variables
 # number of iterations (high level)
-N_ITERATIONS = config['L-SYSTEM'].getint('n_iterations')
+N_ITERATIONS = int(config['L-SYSTEM']['n_iterations'])
 # number of axioms generated at each expansion step
-N_SPE = config['L-SYSTEM'].getint('n_axioms_generated')
+N_SPE = int(config['L-SYSTEM']['n_axioms_generated'])
 
 # initial mutation probability
-MUTATION_INITIAL_P = config['GENOPS'].getfloat('mutations_initial_p')
+MUTATION_INITIAL_P = float(config['GENOPS']['mutations_initial_p'])
 # mutation decay
-MUTATION_DECAY = config['GENOPS'].getfloat('mutations_decay')
+MUTATION_DECAY = float(config['GENOPS']['mutations_decay'])
 # crossover probability
-CROSSOVER_P = config['GENOPS'].getfloat('crossover_p')
+CROSSOVER_P = float(config['GENOPS']['crossover_p'])
 
 # population size
-POP_SIZE = config['FI2POP'].getint('population_size')
+POP_SIZE = int(config['FI2POP']['population_size'])
 # number of initialization retries
-N_RETRIES = config['FI2POP'].getint('n_initial_retries')
+N_RETRIES = int(config['FI2POP']['n_initial_retries'])
 # number of generations
-N_GENS = config['FI2POP'].getint('n_generations')
+N_GENS = int(config['FI2POP']['n_generations'])
 # maximum string length (-1 for unlimited lenght)
-MAX_STRING_LEN = config['FI2POP'].getint('max_string_len')
+MAX_STRING_LEN = int(config['FI2POP']['max_string_len'])
 # maximum patience when generating new pools
-GEN_PATIENCE = config['FI2POP'].getint('gen_patience')
+GEN_PATIENCE = int(config['FI2POP']['gen_patience'])
 
 # use or don't use the bounding box fitness
-USE_BBOX = config['FITNESS'].get('use_bounding_box')
+USE_BBOX = config['FITNESS']['use_bounding_box']
 if USE_BBOX:
-    bbox = config['FITNESS'].get('bounding_box').split(',')
+    bbox = config['FITNESS']['bounding_box'].split(',')
     # bounding box upper limits
     BBOX_X, BBOX_Y, BBOX_Z = float(bbox[0]), float(bbox[1]), float(bbox[2])
-MAME_MEAN = config['FITNESS'].getfloat('mame_mean')
-MAME_STD = config['FITNESS'].getfloat('mame_std')
-MAMI_MEAN = config['FITNESS'].getfloat('mami_mean')
-MAMI_STD = config['FITNESS'].getfloat('mami_std')
-MAX_X_SIZE = config['MAPELITES'].getint('max_x_size')
-MAX_Y_SIZE = config['MAPELITES'].getint('max_y_size')
-MAX_Z_SIZE = config['MAPELITES'].getint('max_z_size')
+MAME_MEAN = float(config['FITNESS']['mame_mean'])
+MAME_STD = float(config['FITNESS']['mame_std'])
+MAMI_MEAN = float(config['FITNESS']['mami_mean'])
+MAMI_STD = float(config['FITNESS']['mami_std'])
+MAX_X_SIZE = int(config['MAPELITES']['max_x_size'])
+MAX_Y_SIZE = int(config['MAPELITES']['max_y_size'])
+MAX_Z_SIZE = int(config['MAPELITES']['max_z_size'])
 
 # number of solutions per bin
-BIN_POP_SIZE = config['MAPELITES'].getint('bin_population')
-BIN_N = config['MAPELITES'].get('bin_n').split(',')
+BIN_POP_SIZE = int(config['MAPELITES']['bin_population'])
+BIN_N = config['MAPELITES']['bin_n'].split(',')
 BIN_N = tuple([int(x) for x in BIN_N])
 # maximum age of solutions
-CS_MAX_AGE = config['MAPELITES'].getint('max_age')
+CS_MAX_AGE = int(config['MAPELITES']['max_age'])
 # PCA dimensions
-N_DIM_RED = config['MAPELITES'].getint('n_dimensions_reduced')
+N_DIM_RED = int(config['MAPELITES']['n_dimensions_reduced'])
 # maximum number of dimensions PCA can analyze
-MAX_DIMS_RED = config['MAPELITES'].getint('max_possible_dimensions')
+MAX_DIMS_RED = int(config['MAPELITES']['max_possible_dimensions'])
 # minimum fitness assignable
-EPSILON_F = config['MAPELITES'].getfloat('epsilon_fitness')
+EPSILON_F = float(config['MAPELITES']['epsilon_fitness'])
 # interval for realigning infeasible fitnesses
-ALIGNMENT_INTERVAL = config['MAPELITES'].getint('alignment_interval')
+ALIGNMENT_INTERVAL = int(config['MAPELITES']['alignment_interval'])
 # rescale infeasible fitness with reporduction probability
-RESCALE_INFEAS_FITNESS = config['MAPELITES'].getboolean('rescale_infeas_fitness')
+RESCALE_INFEAS_FITNESS = _to_bool(config['MAPELITES']['rescale_infeas_fitness'])
 # minimum subdivision percentage of a bin
-BIN_SMALLEST_PERC = config['MAPELITES'].getfloat('bin_min_resolution')
+BIN_SMALLEST_PERC = float(config['MAPELITES']['bin_min_resolution'])
 # whether to use a linear estimator or a NN estimator in the emitter (if possible)
-USE_LINEAR_ESTIMATOR = config['MAPELITES'].getboolean('use_linear_estimator')
+USE_LINEAR_ESTIMATOR = _to_bool(config['MAPELITES']['use_linear_estimator'])
 
-N_EPOCHS = config['MAPELITES'].getint('n_epochs')
-X_RANGE = tuple([int(x) for x in config['MAPELITES'].get('x_range').split(',')])
-Y_RANGE = tuple([int(x) for x in config['MAPELITES'].get('y_range').split(',')])
-Z_RANGE = tuple([int(x) for x in config['MAPELITES'].get('z_range').split(',')])
+N_EPOCHS = int(config['MAPELITES']['n_epochs'])
+X_RANGE = tuple([int(x) for x in config['MAPELITES']['x_range'].split(',')])
+Y_RANGE = tuple([int(x) for x in config['MAPELITES']['y_range'].split(',')])
+Z_RANGE = tuple([int(x) for x in config['MAPELITES']['z_range'].split(',')])
 
 # number of experiments to run
-N_RUNS = config['EXPERIMENT'].getint('n_runs')
+N_RUNS = int(config['EXPERIMENT']['n_runs'])
 # name of the current experiment
-EXP_NAME = config['EXPERIMENT'].get('exp_name')
+EXP_NAME = config['EXPERIMENT']['exp_name']
 
 # number of automated emitters steps
-N_EMITTER_STEPS = config['USER-STUDY'].getint('n_emitter_steps')
+N_EMITTER_STEPS = int(config['USER-STUDY']['n_emitter_steps'])
 
-CONTEXT_IDXS = config['USER-STUDY'].get('context_idxs').split(',')
+CONTEXT_IDXS = config['USER-STUDY']['context_idxs'].split(',')
 CONTEXT_IDXS = [int(x) for x in CONTEXT_IDXS]
 
-BETA_A = config['USER-STUDY'].getint('beta_a')
-BETA_B = config['USER-STUDY'].getint('beta_b')
+BETA_A = int(config['USER-STUDY']['beta_a'])
+BETA_B = int(config['USER-STUDY']['beta_b'])
@@ -3,6 +3,7 @@ import pickle
 from typing import Any, Callable, Dict, Tuple
 
 import numpy as np
+from pcgsepy.common.cache import LRUCache
 from pcgsepy.config import BBOX_X, BBOX_Y, BBOX_Z
 from pcgsepy.lsystem.solution import CandidateSolution
 from scipy.stats import gaussian_kde
@@ -123,16 +124,19 @@ class Fitness:
         self.f = f
         self.bounds = bounds
         self.weight = weight
+        # fitness values, keyed by structure fingerprint
+        self._cache = LRUCache()
 
     def __repr__(self) -> str:
-        return str(self.__dict__)
+        return str({k: v for k, v in self.__dict__.items() if k != '_cache'})
 
     def __str__(self) -> str:
         return f'Fitness {self.name} (in {self.bounds})'
 
     def __call__(self,
                  cs: CandidateSolution) -> float:
-        return self.f(cs=cs)
+        return self._cache.get_or_compute(key=cs.content.fingerprint,
+                                          f=lambda: self.f(cs=cs))
 
     def to_json(self) -> Dict[str, Any]:
         return {
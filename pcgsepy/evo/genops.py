@@ -18,6 +18,7 @@ class EvoException(Exception):
 
 
 atoms_re = re.compile('corridor[a-z]*\(\d\)')
+digit_re = re.compile(r'\d')
 
 
 def roulette_wheel_selection(pop: List[CandidateSolution],
@@ -49,16 +50,21 @@ class SimplifiedExpander:
     def __init__(self):
         self.rules: StochasticRules = None
         self.compiled_lhs = None
+        self._lhs_key = None
 
     def initialize(self,
                    rules: StochasticRules):
         """Initialize the expander.
+        The LHS regexes are only recompiled if the LHSs differ from the previous initialization.
 
         Args:
             rules (StochasticRules): The set of expansion rules.
         """
         self.rules = rules
-        self.compiled_lhs = [extract_regex(lhs) for lhs in rules.get_lhs()]
+        lhs_key = tuple(rules.get_lhs())
+        if lhs_key != self._lhs_key:
+            self.compiled_lhs = [extract_regex(lhs) for lhs in lhs_key]
+            self._lhs_key = lhs_key
 
 
 # module-scoped uninitialized variable
@@ -116,7 +122,7 @@ def mutate(cs: CandidateSolution,
                     rhs = expander.rules.get_rhs(lhs=match.lhs)
                     # update numerical parameters
                     if '(x)' in rhs or '(X)' in rhs or '(Y)' in rhs:
-                        n = [m for m in re.compile(r'\d').finditer(match.lhs_string)]
+                        n = [m for m in digit_re.finditer(match.lhs_string)]
                         n = int(n[0].group()) if n else None
                         # update rhs to include parameters
                         rhs = rhs.replace('(x)', f'({n})')
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 no_selection_error = "You must choose a spaceship from the grid on the left!"
 
 spaceship_population_help = """
@@ -37,4 +39,8 @@ On the other hand, the evolution will be able to propose a more diverse populati
 
 toggle_safe_rules_on_msg = """
 Do you want to turn on safe mode again? This will reset the current progress of evolution, because the population of spaceships will need to be re-initialized.
-"""
\ No newline at end of file
+"""
+
+
+# all messages, by name
+MODAL_MSGS = MappingProxyType({name: msg for name, msg in list(globals().items()) if isinstance(msg, str) and not name.startswith('_')})
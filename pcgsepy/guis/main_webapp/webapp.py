@@ -1,11 +1,16 @@
+import functools
+import gzip
+import itertools
 import json
 import logging
 import os
+import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
-from zipfile import ZipFile, ZIP_DEFLATED
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 from pcgsepy.config import X_RANGE, Y_RANGE, Z_RANGE
 
 from pcgsepy.guis.voxel import VoxelData
@@ -19,16 +24,20 @@ else:
 import dash
 import dash_bootstrap_components as dbc
 import numpy as np
+import numpy.typing as npt
+import orjson
+import plotly.colors
 import plotly.graph_objects as go
-from dash import ALL, dcc, html
+import plotly.io as pio
+from dash import ALL, Patch, dcc, html
 from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+from joblib import Parallel, delayed
 from pcgsepy.common.api_call import block_definitions
-from pcgsepy.common.jsonifier import json_dumps
+from pcgsepy.common.cache import LRUCache
+from pcgsepy.common.jsonifier import PythonObjectEncoder
 from pcgsepy.common.vecs import Vec
-from pcgsepy.guis.main_webapp.modals_msgs import (no_selection_error,
-                                                  spaceship_population_help,
-                                                  spaceship_preview_help,
-                                                  download_help,
+from pcgsepy.guis.main_webapp.modals_msgs import (MODAL_MSGS,
                                                   toggle_safe_rules_off_msg,
                                                   toggle_safe_rules_on_msg)
 from pcgsepy.guis.utils import AppMode, AppSettings, DashLoggerHandler, Semaphore
@@ -41,13 +50,12 @@ from pcgsepy.mapelites.emitters import (ContextualBanditEmitter, Emitter,
                                         HumanPrefMatrixEmitter, KNEmitter, KernelEmitter,
                                         PreferenceBanditEmitter, RandomEmitter, SimpleTabularEmitter)
 from pcgsepy.mapelites.map import MAPElites, get_elite
-from pcgsepy.structure import _is_base_block, _is_transparent_block
+from pcgsepy.structure import Structure, _is_base_block, _is_transparent_block
 from pcgsepy.xml_conversion import convert_structure_to_xml
-from tqdm import trange
 
 
 dashLoggerHandler = DashLoggerHandler()
-dashLoggerHandler.addFilter(lambda record: record.levelno >= logging.INFO)
+dashLoggerHandler.setLevel(logging.INFO)
 logging.getLogger('webapp').addHandler(dashLoggerHandler)
 
 
@@ -70,8 +78,11 @@ block_to_colour: Dict[str, str] = {
     'Unrecognized': '#ff0000',
     'Air': '#000000'
 }
+# base blocks are drawn with the current base color instead
+fixed_block_colour: Dict[str, str] = {k: v for k, v in block_to_colour.items() if not _is_base_block(k)}
 hidden_style: Dict[str, str] = {
     'visibility': 'hidden', 'height': '0px', 'display': 'none'}
+visible_style: Dict[str, str] = {}
 circle_style: Dict[str, str] = {
     'height': '10px',
     'width': '10px',
@@ -82,6 +93,44 @@ circle_style: Dict[str, str] = {
 struct_sizes: Dict[int, str] = {1: 'Small',
                                 2: 'Normal',
                                 5: 'Large'}
+centered_style: Dict[str, str] = {'text-align': 'center'}
+centered_content_style: Dict[str, str] = {'justify-content': 'center'}
+centered_all_style: Dict[str, str] = {**centered_content_style, **centered_style}
+hidden_centered_content_style: Dict[str, str] = {**centered_content_style, **hidden_style}
+flex_centered_content_style: Dict[str, str] = {**centered_content_style, 'display': 'flex'}
+inline_flex_centered_content_style: Dict[str, str] = {**centered_content_style, 'display': 'inline-flex'}
+wrapping_centered_content_style: Dict[str, str] = {**centered_content_style, 'flex-wrap': 'inherit'}
+justified_text_style: Dict[str, str] = {'text-align': 'justify'}
+large_font_style: Dict[str, str] = {'font-size': 'large'}
+scrollable_style: Dict[str, str] = {'overflow': 'auto'}
+margin_style: Dict[str, str] = {'margin': '1vh 1vh 1vh 1vh'}
+reversed_column_style: Dict[str, str] = {'flex-direction': 'column-reverse'}
+hex_lut: List[str] = [f'{i:02x}' for i in range(256)]
+# an expansion rule is `LHS P RHS`
+rule_re: re.Pattern = re.compile(r'^\s*(\S+) (\S+) (\S+)\s*$')
+dropdown_style: Dict[str, str] = {'min-width': '12em'}
+trigger_pop_names: Dict[str, str] = {
+    'population-feasible': 'Feasible',
+    'population-infeasible': 'Infeasible'
+}
+trigger_metric_names: Dict[str, str] = {
+    'metric-fitness': 'Fitness',
+    'metric-age': 'Age',
+    'metric-coverage': 'Coverage'
+}
+emitter_factories: Dict[str, Callable[[], Emitter]] = {
+    'Human': HumanEmitter,
+    'Random': RandomEmitter,
+    'Greedy': GreedyEmitter,
+    'Preference Matrix': HumanPrefMatrixEmitter,
+    'Preference Bandit': PreferenceBanditEmitter,
+    'Contextual Bandit': ContextualBanditEmitter,
+    'KNN': KNEmitter,
+    'Linear Kernel': KernelEmitter,
+    'RBF Kernel': functools.partial(KernelEmitter, estimator='rbf')
+}
+emitter_names: List[str] = list(emitter_factories.keys())
+symmetry_axes: List[str] = ['None', 'X-axis', 'Z-axis']
 
 
 first_launch: bool = True
@@ -91,9 +140,29 @@ app_settings = AppSettings()
 
 
 download_semaphore = Semaphore(locked=True)
+# renders the blueprint thumbnails while the hull is being built
+thumbnail_executor = ThreadPoolExecutor(max_workers=2,
+                                        thread_name_prefix='thumbnail')
 process_semaphore = Semaphore()
 
 
+# figures already drawn, keyed by everything they depend on
+heatmap_cache = LRUCache(maxsize=64)
+content_cache = LRUCache(maxsize=16)
+# serialized MAP-Elites objects, by version
+mapelites_json_cache = LRUCache(maxsize=1)
+# game blueprints of the downloaded spaceships
+blueprint_cache = LRUCache(maxsize=8)
+# cumulative bin sizes, by MAP-Elites version
+bin_offsets_cache = LRUCache(maxsize=4)
+# indices of the valid bins, by MAP-Elites version
+valid_bins_cache = LRUCache(maxsize=4)
+# heatmap cells labels, by MAP-Elites version
+heatmap_labels_cache = LRUCache(maxsize=4)
+# formatted bins selections, by MAP-Elites version
+formatted_bins_cache = LRUCache(maxsize=8)
+
+
 def resource_path(relative_path: str) -> str:
     """Get the path of the resources. This differs if the app is being launched via script
     or after being compiled to an executable with PyInstaller.
@@ -123,12 +192,94 @@ app = dash.Dash(__name__,
                 update_title=None)
 
 
+# static modals, built once and shared by every layout
+no_bins_selected_modal = dbc.Modal(children=[
+    dbc.ModalHeader(dbc.ModalTitle("⚠ Warning ⚠"),
+                    style=centered_content_style,
+                    close_button=False),
+    dbc.ModalBody(MODAL_MSGS['no_selection_error']),
+    dbc.ModalFooter(children=[dbc.Button("Ok",
+                                         id="nbs-err-btn",
+                                         color="primary",
+                                         className="ms-auto",
+                                         n_clicks=0)]),
+],
+    id='nbs-err-modal',
+    centered=True,
+    backdrop=True,
+    is_open=False)
+
+heatmap_help_modal = dbc.Modal([
+    dbc.ModalHeader(dbc.ModalTitle("Spaceship Population Help"),
+                    style=centered_content_style,
+                    close_button=False),
+    dbc.ModalBody(dcc.Markdown(MODAL_MSGS['spaceship_population_help'],
+                               style=justified_text_style))
+],
+    id='hh-modal',
+    centered=True,
+    backdrop=True,
+    is_open=False,
+    scrollable=True)
+
+content_help_modal = dbc.Modal([
+    dbc.ModalHeader(dbc.ModalTitle("Selected Spaceship Help"),
+                    style=centered_content_style,
+                    close_button=False),
+    dbc.ModalBody(dcc.Markdown(MODAL_MSGS['spaceship_preview_help'],
+                               style=justified_text_style))
+],
+    id='ch-modal',
+    centered=True,
+    backdrop=True,
+    is_open=False,
+    scrollable=True)
+
+download_help_modal = dbc.Modal([
+    dbc.ModalHeader(dbc.ModalTitle("Spaceship Controls Help"),
+                    style=centered_content_style,
+                    close_button=False),
+    dbc.ModalBody(dcc.Markdown(MODAL_MSGS['download_help'],
+                               style=justified_text_style))
+],
+    id='dh-modal',
+    centered=True,
+    backdrop=True,
+    is_open=False,
+    scrollable=True)
+
+
 def get_properties_table(cs: Optional[CandidateSolution] = None) -> dbc.Table:
     """Generate the table with the spaceship properties.
 
     Args:
         cs (Optional[CandidateSolution], optional): The candidate solution. Defaults to None.
 
+    Returns:
+        dbc.Table: The table with the properties.
+    """
+    if cs is None:
+        return _get_empty_properties_table()
+    return _build_properties_table(cs=cs)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_empty_properties_table() -> dbc.Table:
+    """Get the table with the properties when no spaceship is selected.
+    Components are only read when serialized, so the same table is reused.
+
+    Returns:
+        dbc.Table: The table with the properties.
+    """
+    return _build_properties_table(cs=None)
+
+
+def _build_properties_table(cs: Optional[CandidateSolution]) -> dbc.Table:
+    """Build the table with the spaceship properties.
+
+    Args:
+        cs (Optional[CandidateSolution]): The candidate solution.
+
     Returns:
         dbc.Table: The table with the properties.
     """
@@ -141,34 +292,46 @@ def get_properties_table(cs: Optional[CandidateSolution] = None) -> dbc.Table:
         '-', '-')
     cs_unique_blocks = cs.unique_blocks if cs else {}
 
+    properties = [
+        ("Spaceship size", f'{size} m'),
+        ("Grid size", struct_size),
+        ("Number of blocks", nblocks),
+        ("Armor blocks", armor_blocks),
+        ("Non-armor blocks", non_armor_blocks),
+        *cs_unique_blocks.items(),
+        ("Occupied volume", f'{vol} m³'),
+        ("Spaceship mass", f'{mass} kg'),
+    ]
+
     table_header = [
-        html.Thead(html.Tr([html.Th("Property", style={'text-align': 'center'}),
-                            html.Th("Value", style={'text-align': 'center'})]))
+        html.Thead(html.Tr([html.Th("Property", style=centered_style),
+                            html.Th("Value", style=centered_style)]))
     ]
-    table_body = [html.Tbody([
-        html.Tr([html.Td("Spaceship size"), html.Td(
-            f'{size} m', style={'text-align': 'center'})]),
-        html.Tr([html.Td("Grid size"), html.Td(
-            struct_size, style={'text-align': 'center'})]),
-        html.Tr([html.Td("Number of blocks"), html.Td(
-            nblocks, style={'text-align': 'center'})]),
-        html.Tr([html.Td("Armor blocks"), html.Td(
-            armor_blocks, style={'text-align': 'center'})]),
-        html.Tr([html.Td("Non-armor blocks"),
-                html.Td(non_armor_blocks, style={'text-align': 'center'})]),
-        *[html.Tr([html.Td(k), html.Td(v, style={'text-align': 'center'})])
-          for k, v in cs_unique_blocks.items()],
-        html.Tr([html.Td("Occupied volume"), html.Td(
-            f'{vol} m³', style={'text-align': 'center'})]),
-        html.Tr([html.Td("Spaceship mass"), html.Td(
-            f'{mass} kg', style={'text-align': 'center'})]),
-    ])]
+    table_body = [html.Tbody([html.Tr([html.Td(k), html.Td(v, style=centered_style)])
+                              for k, v in properties])]
 
     return table_header + table_body
 
 
-def get_content_legend() -> dbc.Row:
-    """Get the legend of the content. Relies on the blocks specified in `block_to_colour`.
+def _to_hex(color: Vec) -> str:
+    """Get the `#rrggbb` representation of a color.
+
+    Args:
+        color (Vec): The color.
+
+    Returns:
+        str: The hex color string.
+    """
+    # channels are in [0, 1]: 1. would otherwise be scaled to the out-of-range 256
+    return '#' + ''.join([hex_lut[min(round(c * 256), 255)] for c in color.as_tuple()])
+
+
+@functools.lru_cache(maxsize=8)
+def _build_content_legend(base_hex: str) -> dbc.Row:
+    """Build the legend of the content for the given base blocks color.
+
+    Args:
+        base_hex (str): The hex color string of the base blocks.
 
     Returns:
         dbc.Row: The legend.
@@ -177,7 +340,7 @@ def get_content_legend() -> dbc.Row:
         dbc.Col(children=[
             html.Span(children=[
                 html.P('', style={**circle_style,
-                                  **{'background-color': '#%02x%02x%02x' % base_color.scale(256).to_veci().as_tuple() if _is_base_block(block_type) else block_to_colour[block_type]}}),
+                                  **{'background-color': fixed_block_colour.get(block_type, base_hex)}}),
                 dbc.Label(block_type,
                           align='start',
                           #   style={'text-overflow': 'ellipsis', 'text-align': 'left', 'font-size': 'x-small'}
@@ -193,32 +356,56 @@ def get_content_legend() -> dbc.Row:
         justify='start')
 
 
-def serve_layout() -> dbc.Container:
-    """Generate the layout of the application.
+def get_content_legend() -> dbc.Row:
+    """Get the legend of the content. Relies on the blocks specified in `block_to_colour`.
+    The legend is only rebuilt when the color of the base blocks changes.
 
     Returns:
-        dbc.Container: The layout.
+        dbc.Row: The legend.
     """
-    global app_settings
+    return _build_content_legend(base_hex=_to_hex(base_color))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_asset(filename: str) -> str:
+    """Read a text asset file. Files are only read once.
+
+    Args:
+        filename (str): The file name.
+
+    Returns:
+        str: The content of the file.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        return f.read()
 
-    webapp_info_file = './assets/webapp_help_dev.md' if app_settings.app_mode == AppMode.DEV else './assets/webapp_info.md'
-    with open(webapp_info_file, 'r', encoding='utf-8') as f:
-        webapp_info_str = f.read()
+
+@functools.lru_cache(maxsize=None)
+def _build_static_shell(app_mode: AppMode) -> Tuple[html.Div, dbc.Row, html.Div, html.Div, html.Div]:
+    """Build the parts of the layout that only depend on the application mode.
+    These are built once and reused by every call to `serve_layout`.
+
+    Args:
+        app_mode (AppMode): The application mode.
+
+    Returns:
+        Tuple[html.Div, dbc.Row, html.Div, html.Div, html.Div]: The modals, the header, the log, the loading spinner, and the intervals.
+    """
+    webapp_info_file = './assets/webapp_help_dev.md' if app_mode == AppMode.DEV else './assets/webapp_info.md'
+    webapp_info_str = _read_asset(filename=webapp_info_file)
 
     algo_info_file = './assets/algo_info.md'
-    with open(algo_info_file, 'r', encoding='utf-8') as f:
-        algo_info_str = f.read()
+    algo_info_str = _read_asset(filename=algo_info_file)
 
     quickstart_usermode_info_file = './assets/quickstart_usermode.md'
-    with open(quickstart_usermode_info_file, 'r', encoding='utf-8') as f:
-        quickstart_usermode_info_str = f.read()
+    quickstart_usermode_info_str = _read_asset(filename=quickstart_usermode_info_file)
 
     webapp_info_modal = dbc.Modal([
         dbc.ModalHeader(dbc.ModalTitle("App Info"),
-                        style={'flex-direction': 'column-reverse'},
+                        style=reversed_column_style,
                         close_button=True),
         dbc.ModalBody(dcc.Markdown(webapp_info_str,
-                                   style={'text-align': 'justify'}))
+                                   style=justified_text_style))
     ],
         id='webapp-info-modal',
         centered=True,
@@ -229,10 +416,10 @@ def serve_layout() -> dbc.Container:
 
     algo_info_modal = dbc.Modal([
         dbc.ModalHeader(dbc.ModalTitle("AI Info"),
-                        style={'flex-direction': 'column-reverse'},
+                        style=reversed_column_style,
                         close_button=True),
         dbc.ModalBody(dcc.Markdown(algo_info_str,
-                                   style={'text-align': 'justify'},
+                                   style=justified_text_style,
                                    mathjax=True))
     ],
         id='algo-info-modal',
@@ -244,11 +431,11 @@ def serve_layout() -> dbc.Container:
 
     quickstart_usermode_modal = dbc.Modal([
         dbc.ModalHeader(dbc.ModalTitle("Tutorial"),
-                        style={'flex-direction': 'column-reverse'},
+                        style=reversed_column_style,
                         close_button=True),
         dbc.ModalBody(dcc.Markdown(quickstart_usermode_info_str,
                                    link_target="_blank",
-                                   style={'text-align': 'justify'}))
+                                   style=justified_text_style))
     ],
         id='quickstart-usermode-modal',
         centered=True,
@@ -257,70 +444,15 @@ def serve_layout() -> dbc.Container:
         scrollable=True,
         size='lg')
 
-    no_bins_selected_modal = dbc.Modal(children=[
-        dbc.ModalHeader(dbc.ModalTitle("⚠ Warning ⚠"),
-                        style={'justify-content': 'center'},
-                        close_button=False),
-        dbc.ModalBody(no_selection_error),
-        dbc.ModalFooter(children=[dbc.Button("Ok",
-                                             id="nbs-err-btn",
-                                             color="primary",
-                                             className="ms-auto",
-                                             n_clicks=0)]),
-    ],
-        id='nbs-err-modal',
-        centered=True,
-        backdrop=True,
-        is_open=False)
-
-    heatmap_help_modal = dbc.Modal([
-        dbc.ModalHeader(dbc.ModalTitle("Spaceship Population Help"),
-                        style={'justify-content': 'center'},
-                        close_button=False),
-        dbc.ModalBody(dcc.Markdown(spaceship_population_help,
-                                   style={'text-align': 'justify'}))
-    ],
-        id='hh-modal',
-        centered=True,
-        backdrop=True,
-        is_open=False,
-        scrollable=True)
-
-    content_help_modal = dbc.Modal([
-        dbc.ModalHeader(dbc.ModalTitle("Selected Spaceship Help"),
-                        style={'justify-content': 'center'},
-                        close_button=False),
-        dbc.ModalBody(dcc.Markdown(spaceship_preview_help,
-                                   style={'text-align': 'justify'}))
-    ],
-        id='ch-modal',
-        centered=True,
-        backdrop=True,
-        is_open=False,
-        scrollable=True)
-
-    download_help_modal = dbc.Modal([
-        dbc.ModalHeader(dbc.ModalTitle("Spaceship Controls Help"),
-                        style={'justify-content': 'center'},
-                        close_button=False),
-        dbc.ModalBody(dcc.Markdown(download_help,
-                                   style={'text-align': 'justify'}))
-    ],
-        id='dh-modal',
-        centered=True,
-        backdrop=True,
-        is_open=False,
-        scrollable=True)
-
     toggle_unsaferules_modal = dbc.Modal(children=[
         dbc.ModalHeader(dbc.ModalTitle("Turn off safe mode?"),
                         id='sm-modal-title',
-                        style={'justify-content': 'center'},
+                        style=centered_content_style,
                         close_button=True),
         dbc.ModalBody(children=[
             dcc.Markdown(toggle_safe_rules_off_msg,
                          id='sm-modal-body',
-                         style={'text-align': 'justify'}),
+                         style=justified_text_style),
             html.Div(id='tsm-body-loading',
                      children=[])
         ]),
@@ -366,7 +498,7 @@ def serve_layout() -> dbc.Container:
                                    id='webapp-quickstart-btn',
                                    color='info'),
                         width=4,
-                        style=hidden_style if app_settings.app_mode == AppMode.DEV else {}),
+                        style=hidden_style if app_mode == AppMode.DEV else visible_style),
                 dbc.Col(dbc.Button('App Info',
                                    className='button-fullsize',
                                    id='webapp-info-btn',
@@ -384,20 +516,83 @@ def serve_layout() -> dbc.Container:
         className='header',
         style={'content-justify': 'center'})
 
+    log = html.Div(
+        children=[
+            html.H4(children='Log',
+                    className='section-title'),
+            html.Br(),
+            dbc.Textarea(id='console-out',
+                         value='',
+                         wrap=False,
+                         contentEditable=False,
+                         disabled=True,
+                         className='log-area'),
+            # log lines not yet appended to the text area
+            dcc.Store(id='console-new',
+                      data={'seq': 0, 'lines': []})
+        ])
+
+    load_spinner = html.Div(children=[
+        dbc.Row(
+            dbc.Col(children=[
+                dcc.Loading(id='step-spinner',
+                            children='',
+                            fullscreen=False,
+                            color='#eeeeee',
+                            type='circle')
+            ],
+            )
+        )
+
+    ])
+
+    intervals = html.Div(
+        children=[
+            dcc.Interval(id='interval1',
+                         interval=1 * 1000,
+                         n_intervals=0),
+            dcc.Interval(id='interval2',
+                         interval=250,
+                         n_intervals=0),
+            # step progress and generation counter, formatted clientside
+            dcc.Store(id='progress-data',
+                      data=None),
+            # whether a process is running, used to disable components clientside
+            dcc.Store(id='busy-state',
+                      data=None),
+            # whether the spaceship preview is empty, set clientside so the figure is not sent back to the server
+            dcc.Store(id='content-plot-empty',
+                      data=True)
+        ]
+    )
+
+    return modals, header, log, load_spinner, intervals
+
+
+def serve_layout() -> dbc.Container:
+    """Generate the layout of the application.
+
+    Returns:
+        dbc.Container: The layout.
+    """
+    global app_settings
+
+    modals, header, log, load_spinner, intervals = _build_static_shell(app_mode=app_settings.app_mode)
+
     exp_progress = html.Div(
         id='study-progress-div',
         children=[
             dbc.Row(
                 dbc.Col(children=[
                     dbc.Label(f'Current Iteration',
-                              style={'font-size': 'large'}),
+                              style=large_font_style),
                     dbc.Progress(id="gen-progress",
                                  color='success',
                                  striped=False,
                                  animated=False)
                 ],
                     width={'size': 12, 'offset': 0},
-                    style={'text-align': 'center'},
+                    style=centered_style,
                     align='center')
             )
         ])
@@ -412,7 +607,7 @@ def serve_layout() -> dbc.Container:
                            color='info',
                            id='heatmap-help',
                            className='help')],
-                     style={'margin': '1vh 1vh 1vh 1vh'})
+                     style=margin_style)
         ],
             style={
             'display': 'inline-flex',
@@ -446,7 +641,7 @@ def serve_layout() -> dbc.Container:
                                      'z-index': 1}),
                  ])
     ],
-        style={'text-align': 'center'})
+        style=centered_style)
 
     mapelites_controls = html.Div(
         children=[
@@ -483,7 +678,7 @@ def serve_layout() -> dbc.Container:
                            ],
                            value='Population')
         ],
-        style=hidden_style if not app_settings.app_mode == AppMode.DEV else {})
+        style=hidden_style if not app_settings.app_mode == AppMode.DEV else visible_style)
 
     content_plot = html.Div(children=[
 
@@ -495,7 +690,7 @@ def serve_layout() -> dbc.Container:
                            color='info',
                            id='content-help',
                            className='help')],
-                     style={'margin': '1vh 1vh 1vh 1vh'})
+                     style=margin_style)
         ],
             style={
             'display': 'inline-flex',
@@ -517,7 +712,7 @@ def serve_layout() -> dbc.Container:
                   config={
                       'displayModeBar': False,
                       'displaylogo': False},
-                  style={'overflow': 'auto'}),
+                  style=scrollable_style),
         html.Div(children=[
             dbc.Switch(
                 id="voxel-preview-toggle",
@@ -525,7 +720,7 @@ def serve_layout() -> dbc.Container:
                 value=app_settings.voxelised,
             )
         ],
-            style={'display': 'inline-flex', 'justify-content': 'center'}
+            style=inline_flex_centered_content_style
         ),
         html.Br(),
         dbc.Label('Legend',
@@ -541,14 +736,14 @@ def serve_layout() -> dbc.Container:
             'border-style': 'inset'
         })
     ],
-        style={'text-align': 'center'})
+        style=centered_style)
 
     color_and_download = html.Div(
         children=[
             dbc.Row(
                 dbc.Col([
                     dbc.Label("Spaceship Color",
-                              style={'font-size': 'large'}),
+                              style=large_font_style),
                     dbc.Row(children=[
                         dbc.Col(
                             dbc.Input(type="color",
@@ -567,13 +762,13 @@ def serve_layout() -> dbc.Container:
                     ],
                         align='center')],
                     width={'size': 6, 'offset': 3},
-                    style={'text-align': 'center'})
+                    style=centered_style)
             ),
             html.Br(),
             dbc.Row(
                 dbc.Col([
                     dbc.Label("Download Blueprint",
-                              style={'font-size': 'large'}),
+                              style=large_font_style),
                     html.Br(),
                     dbc.Button('Download',
                                id='download-btn',
@@ -586,11 +781,11 @@ def serve_layout() -> dbc.Container:
                                 fullscreen=False,
                                 color='#eeeeee',
                                 type='default',
-                                style={'justify-content': 'center'}),
+                                style=centered_content_style),
                     html.Br()
                 ],
                     width={'size': 6, 'offset': 3},
-                    style={'text-align': 'center', 'justify-content': 'center'})
+                    style=centered_all_style)
             )
         ]
     )
@@ -606,7 +801,7 @@ def serve_layout() -> dbc.Container:
                                    color='info',
                                    id='download-help',
                                    className='help')],
-                     style={'margin': '1vh 1vh 1vh 1vh'})
+                     style=margin_style)
                 ],
                     style={'display': 'inline-flex',
                            'flex-direction': 'row',
@@ -618,7 +813,7 @@ def serve_layout() -> dbc.Container:
                 html.Br(),
                 color_and_download
             ],
-                style={'text-align': 'center'})
+                style=centered_style)
             ]))
 
     content_properties = html.Div(
@@ -642,7 +837,7 @@ def serve_layout() -> dbc.Container:
                                      disabled=True,
                                      class_name='content-string-area')
                     ],
-                        style={} if app_settings.app_mode == AppMode.DEV else hidden_style)
+                        style=visible_style if app_settings.app_mode == AppMode.DEV else hidden_style)
                 ],
                     style={
                     'max-height': '50vh',
@@ -650,19 +845,6 @@ def serve_layout() -> dbc.Container:
                 })],
                 align='center')])
 
-    log = html.Div(
-        children=[
-            html.H4(children='Log',
-                    className='section-title'),
-            html.Br(),
-            dbc.Textarea(id='console-out',
-                         value='',
-                         wrap=False,
-                         contentEditable=False,
-                         disabled=True,
-                         className='log-area'),
-        ])
-
     properties_panel = html.Div(
         children=[
             dbc.Row(
@@ -686,13 +868,17 @@ def serve_layout() -> dbc.Container:
             html.Div(children=[
                  html.Br(),
                     html.Div(children=[
-                        html.P(children=f'Selected bin(s): {app_settings.selected_bins}',
+                        html.P(children=_format_bins(mapelites=app_settings.current_mapelites,
+                                                     bins_idx_list=app_settings.selected_bins,
+                                                     do_switch=True,
+                                                     str_prefix='Selected bin(s):',
+                                                     filter_out_empty=True)[1],
                                id='selected-bin',
-                               style={'text-align': 'center'})
+                               style=centered_style)
                     ]),
                     html.Br(),
                 ],
-                    style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style}),
+                    style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style),
             dbc.InputGroup(children=[
                 dbc.InputGroupText('Feature Descriptors (X, Y):'),
                 dbc.DropdownMenu(label=app_settings.current_mapelites.b_descs[0].name,
@@ -709,7 +895,7 @@ def serve_layout() -> dbc.Container:
                                  id='b1-dropdown')
             ],
                 className="mb-3",
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style}),
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style),
             dbc.InputGroup(children=[
                 dbc.InputGroupText('Toggle L-system Modules:'),
                 dbc.Checklist(id='lsystem-modules',
@@ -720,14 +906,14 @@ def serve_layout() -> dbc.Container:
                               inline=True,
                               switch=True)
             ],
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style},
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style,
                 className="mb-3"),
             dbc.InputGroup(children=[
                 dbc.InputGroupText('Fitness Weights:'),
                 html.Div(children=[
                     html.Div(children=[
                         dbc.Label(children=f.name,
-                                  style={'font-size': 'large'}),
+                                  style=large_font_style),
                         html.Div(children=[
                             dcc.Slider(min=0,
                                        max=1,
@@ -743,7 +929,7 @@ def serve_layout() -> dbc.Container:
                     ]) for i, f in enumerate(app_settings.current_mapelites.feasible_fitnesses)
                 ])
             ],
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style},
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style,
                 className="mb-3"),
             
             dbc.InputGroup(children=[
@@ -767,7 +953,7 @@ def serve_layout() -> dbc.Container:
                                                       step=1))  
                                 ])
                                 ],
-                                    style={'text-align': 'center'})
+                                    style=centered_style)
                         ]),
                         dbc.Row(children=[
                             dbc.Col(children=[
@@ -787,7 +973,7 @@ def serve_layout() -> dbc.Container:
                                                       step=1))  
                                 ])
                                 ],
-                                    style={'text-align': 'center'})
+                                    style=centered_style)
                         ]),
                         dbc.Row(children=[
                             dbc.Col(children=[
@@ -807,59 +993,39 @@ def serve_layout() -> dbc.Container:
                                                       step=1))  
                                 ])
                                 ],
-                                    style={'text-align': 'center'})
+                                    style=centered_style)
                         ]),
                         html.Div(children=[
                             dbc.Button(id='dims-btn',
                                        children='Apply Filtering')
                         ],
-                                 style={'display': 'flex', 'justify-content': 'center'})
+                                 style=flex_centered_content_style)
                     ])
                 ],
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style},
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style,
                 className="mb-3"),
             
             dbc.InputGroup(children=[
                 dbc.InputGroupText('Select Emitter:'),
-                dbc.DropdownMenu(label='Random',
-                                 children=[
-                                     dbc.DropdownMenuItem(
-                                         'Human', id='emitter-human'),
-                                     dbc.DropdownMenuItem(
-                                         'Random', id='emitter-random'),
-                                     dbc.DropdownMenuItem(
-                                         'Greedy', id='emitter-greedy'),
-                                     dbc.DropdownMenuItem(
-                                         'Preference Matrix', id='emitter-prefmatrix'),
-                                     dbc.DropdownMenuItem(
-                                         'Preference Bandit', id='emitter-prefbandit'),
-                                     dbc.DropdownMenuItem(
-                                         'Contextual Bandit', id='emitter-conbandit'),
-                                     dbc.DropdownMenuItem(
-                                         'KNN', id='emitter-knn'),
-                                     dbc.DropdownMenuItem(
-                                         'Linear Kernel', id='emitter-linkernel'),
-                                     dbc.DropdownMenuItem(
-                                         'RBF Kernel', id='emitter-rbfkernel')
-                                 ],
-                                 id='emitter-dropdown')
+                dcc.Dropdown(id='emitter-dropdown',
+                             options=emitter_names,
+                             value='Random',
+                             clearable=False,
+                             searchable=False,
+                             style=dropdown_style)
             ],
                 className="mb-3",
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style}),
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style),
             dbc.InputGroup(children=[
                 dbc.InputGroupText('Enforce Symmetry:'),
-                dbc.DropdownMenu(label='None',
-                                 children=[
-                                     dbc.DropdownMenuItem(
-                                         'None', id='symmetry-none'),
-                                     dbc.DropdownMenuItem(
-                                         'X-axis', id='symmetry-x'),
-                                     dbc.DropdownMenuItem(
-                                         'Z-axis', id='symmetry-z'),
-                                 ],
-                                 id='symmetry-dropdown'),
+                dcc.Dropdown(id='symmetry-dropdown',
+                             options=symmetry_axes,
+                             value='None',
+                             clearable=False,
+                             searchable=False,
+                             style=dropdown_style),
             ],
-                style={'justify-content': 'center'},
+                style=centered_content_style,
                 id='symmetry-div',
                 className="mb-3"),
             dbc.InputGroup(children=[
@@ -874,9 +1040,9 @@ def serve_layout() -> dbc.Container:
                 ),
             ],
                 className="mb-3",
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style})
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style)
         ],
-        style={'justify-content': 'center'},
+        style=centered_content_style,
         id='experiment-settings-div')
 
     experiment_controls = html.Div(
@@ -901,7 +1067,7 @@ def serve_layout() -> dbc.Container:
                     # style={} if app_settings.app_mode == AppMode.USER else hidden_style,
                     width=6)
             ],
-                style={'justify-content': 'center', 'flex-wrap': 'inherit'}),
+                style=wrapping_centered_content_style),
             dbc.Row(children=[
                 dbc.Col(children=[
                     html.Br(),
@@ -910,7 +1076,7 @@ def serve_layout() -> dbc.Container:
                                className='button-fullsize')
                 ],
                     width=6)],
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style}),
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style),
             dbc.Row(children=[
                 dbc.Col(children=[
                     html.Br(),
@@ -919,7 +1085,7 @@ def serve_layout() -> dbc.Container:
                                className='button-fullsize')
                 ],
                     id='reset-btn-div',
-                    style={'justify-content': 'center'},
+                    style=centered_content_style,
                     width={'offset': 3, 'size': 6})]),
             dbc.Row(children=[
                 dbc.Col(children=[
@@ -930,7 +1096,7 @@ def serve_layout() -> dbc.Container:
                 ],
                     width=6)],
                 id='unsafemode-div',
-                style={'justify-content': 'center', 'text-align': 'center'}),
+                style=centered_all_style),
             dbc.Row(children=[
                 dbc.Col(children=[
                     dbc.Label('Evolution Iterations:'),
@@ -952,7 +1118,7 @@ def serve_layout() -> dbc.Container:
                     width=6)
             ],
                     id='emitter-steps-div',
-                    style={'justify-content': 'center', 'text-align': 'center'}),
+                    style=centered_all_style),
             dbc.Row(children=[
                 dbc.Col(children=[
                     html.Br(),
@@ -961,7 +1127,7 @@ def serve_layout() -> dbc.Container:
                                className='button-fullsize')
                 ],
                     width=6)],
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style}),
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style),
             dbc.Row(children=[
                 dbc.Col(children=[
                     html.Br(),
@@ -970,7 +1136,7 @@ def serve_layout() -> dbc.Container:
                                className='button-fullsize')
                 ],
                     width=6)],
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style}),
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style),
             dbc.Row(children=[
                 dbc.Col(children=[
                     html.Br(),
@@ -980,7 +1146,7 @@ def serve_layout() -> dbc.Container:
                     dcc.Download(id='download-mapelites')
                 ],
                     width=6)],
-                style={'justify-content': 'center'} if app_settings.app_mode == AppMode.DEV else {**{'justify-content': 'center'}, **hidden_style}),
+                style=centered_content_style if app_settings.app_mode == AppMode.DEV else hidden_centered_content_style),
         ])
 
     rules = html.Div(
@@ -999,21 +1165,21 @@ def serve_layout() -> dbc.Container:
                         width={'size': 4, 'offset': 4}),
                 align='center')
         ],
-        style={} if app_settings.app_mode == AppMode.DEV else hidden_style)
+        style=visible_style if app_settings.app_mode == AppMode.DEV else hidden_style)
 
     progress = html.Div(
         children=[
             dbc.Row(
                 dbc.Col(children=[
                     dbc.Label('Evolution Progress',
-                              style={'font-size': 'large'}),
+                              style=large_font_style),
                     dbc.Progress(id="step-progress",
                                  color='info',
                                  striped=True,
                                  animated=True)
                 ],
                     align='center',
-                    style={'text-align': 'center'})
+                    style=centered_style)
             )
         ],
         id='step-progress-div',
@@ -1021,31 +1187,6 @@ def serve_layout() -> dbc.Container:
                'display': 'inline-block' if 0 <= app_settings.step_progress <= 100 else 'none',
                'width': '100%'})
 
-    load_spinner = html.Div(children=[
-        dbc.Row(
-            dbc.Col(children=[
-                dcc.Loading(id='step-spinner',
-                            children='',
-                            fullscreen=False,
-                            color='#eeeeee',
-                            type='circle')
-            ],
-            )
-        )
-
-    ])
-
-    intervals = html.Div(
-        children=[
-            dcc.Interval(id='interval1',
-                         interval=1 * 1000,
-                         n_intervals=0),
-            dcc.Interval(id='interval2',
-                         interval=1 * 10,
-                         n_intervals=0)
-        ]
-    )
-
     return dbc.Container(
         children=[
             modals,
@@ -1069,10 +1210,10 @@ def serve_layout() -> dbc.Container:
             html.Br(),
             dbc.Row(children=[
                 dbc.Col(mapelites_heatmap, width={
-                        'size': 3, 'offset': 1}, style={'overflow': 'auto'}),
-                dbc.Col(content_plot, width=4, style={'overflow': 'auto'}),
+                        'size': 3, 'offset': 1}, style=scrollable_style),
+                dbc.Col(content_plot, width=4, style=scrollable_style),
                 dbc.Col(properties_panel, width=3)],
-                align="start", style={'overflow': 'auto'}),
+                align="start", style=scrollable_style),
             html.Br(),
             html.Br(),
             dbc.Row(children=[
@@ -1110,166 +1251,242 @@ loading_data_component = html.Div(children=[
                         size='sm')
         ],
             align='center',
-            style={'justify-content': 'center', 'text-align': 'center'}),
+            style=centered_all_style),
     ])
 ]
 )
 
 
-# clientside callback to autoscroll log textarea
+# clientside callbacks to open the info and help modals
+for modal_id, btn_id in [("webapp-info-modal", "webapp-info-btn"),  # "App Info"
+                         ("algo-info-modal", "ai-info-btn"),  # "AI Info"
+                         ("hh-modal", "heatmap-help"),  # "Spaceship Population Help"
+                         ("ch-modal", "content-help"),  # "Selected Spaceship Help"
+                         ("dh-modal", "download-help"),  # "Download Help"
+                         ("quickstart-usermode-modal", "webapp-quickstart-btn")]:  # "Tutorial"
+    app.clientside_callback(
+        """
+        function openModal(n) {
+            return true;
+        }
+        """,
+        Output(modal_id, "is_open"),
+        Input(btn_id, "n_clicks"),
+        prevent_initial_call=True
+    )
+
+
+# clientside callback to close the warning modal
 app.clientside_callback(
     """
-    function checkTextareaHeight() {
-        var textarea = document.getElementById("console-out");
-        if(textarea.selectionStart == textarea.selectionEnd) {
-            textarea.scrollTop = textarea.scrollHeight;
-        }
-        return "";
+    function closeModal(n) {
+        return false;
     }
     """,
-    Output("hidden-div", "title"),  # super hacky but Dash leaves me no choice
-    Input("interval1", "n_intervals"),
+    Output("nbs-err-modal", "is_open", allow_duplicate=True),
+    Input("nbs-err-btn", "n_clicks"),
     prevent_initial_call=True
 )
 
 
-@app.callback(
-    Output("webapp-info-modal", "is_open"),
-    Input("webapp-info-btn", "n_clicks"),
+# clientside callback to recolor the base blocks of the spaceship preview
+# base blocks are the only ones drawn with an `rgb(...)` color; the server updates the population in `__color`
+app.clientside_callback(
+    """
+    function recolorContent(nClicks, color, figure) {
+        if (!figure || !figure.data || !color) {
+            return dash_clientside.no_update;
+        }
+        // same formatting as the server-side `f'rgb{color.as_tuple()}'`
+        var channels = [1, 3, 5].map(function(i) {
+            var c = String(parseInt(color.substr(i, 2), 16) / 256);
+            return c.indexOf('.') < 0 ? c + '.0' : c;
+        });
+        var rgb = 'rgb(' + channels.join(', ') + ')';
+        var recolor = function(colors) {
+            if (!Array.isArray(colors)) {
+                return colors;
+            }
+            return colors.map(function(c) {
+                return typeof c === 'string' && c.startsWith('rgb(') ? rgb : c;
+            });
+        };
+        var data = figure.data.map(function(trace) {
+            if (trace.type === 'scatter3d') {
+                var marker = Object.assign({}, trace.marker, {color: recolor((trace.marker || {}).color)});
+                return Object.assign({}, trace, {marker: marker});
+            }
+            return Object.assign({}, trace, {facecolor: recolor(trace.facecolor)});
+        });
+        return Object.assign({}, figure, {data: data});
+    }
+    """,
+    Output("content-plot", "figure", allow_duplicate=True),
+    Input("color-picker-btn", "n_clicks"),
+    State("color-picker", "value"),
+    State("content-plot", "figure"),
     prevent_initial_call=True
 )
-def show_webapp_info(n: int) -> bool:
-    """Display the "App Info" modal window.
 
-    Args:
-        n (int): Number of button clicks.
 
-    Returns:
-        bool: `is_open` modal property value.
+# clientside callback to track whether the spaceship preview is empty
+app.clientside_callback(
     """
-    return True
-
-
-@app.callback(
-    Output("algo-info-modal", "is_open"),
-    Input("ai-info-btn", "n_clicks"),
-    prevent_initial_call=True
+    function isContentEmpty(figure) {
+        return !figure || !figure.data || figure.data.length === 0;
+    }
+    """,
+    Output("content-plot-empty", "data"),
+    Input("content-plot", "figure")
 )
-def show_algo_info(n: int) -> bool:
-    """Display the "AI Info" modal window.
 
-    Args:
-        n (int): Number of button clicks.
 
-    Returns:
-        bool: `is_open` modal property value.
+# clientside callback to ask for confirmation before toggling the safe mode
+# the toggle is reverted until the change is confirmed, then the server applies the new rules
+app.clientside_callback(
     """
-    return True
-
-
-@app.callback(
-    Output("hh-modal", "is_open"),
-    Input("heatmap-help", "n_clicks"),
+    function toggleSafeMode(safeMode, nClicks) {
+        var confirmed = dash_clientside.callback_context.triggered.some(function(t) {
+            return t.prop_id === "tsrm-y-btn.n_clicks";
+        });
+        return [!safeMode, confirmed ? dash_clientside.no_update : true];
+    }
+    """,
+    Output("unsaferules-mode-toggle", "value"),
+    Output("sm-modal", "is_open", allow_duplicate=True),
+    Input("unsaferules-mode-toggle", "value"),
+    Input("tsrm-y-btn", "n_clicks"),
     prevent_initial_call=True
 )
-def show_heatmap_help(n: int) -> bool:
-    """Display the "Spaceship Population Help" modal window.
-
-    Args:
-        n (int): Number of button clicks.
 
-    Returns:
-        bool: `is_open` modal property value.
-    """
-    return True
 
-
-@app.callback(
-    Output("ch-modal", "is_open"),
-    Input("content-help", "n_clicks"),
-    prevent_initial_call=True
-)
-def show_content_help(n: int) -> bool:
-    """Display the "Selected Spaceship Help" modal window.
+@app.callback(Output('console-new', 'data'),
+              Input('interval1', 'n_intervals'),
+              State('console-new', 'data'),
+              prevent_initial_call=True)
+def update_output(n: int,
+                  curr_log: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the log lines the `Log` text area does not display yet.
 
     Args:
-        n (int): Number of button clicks.
+        n (int): Interval time.
+        curr_log (Dict[str, Any]): The last log lines sent, with the number of log lines sent so far.
 
     Returns:
-        bool: `is_open` modal property value.
+        Dict[str, Any]: The new log lines, with the number of log lines sent so far.
     """
-    return True
+    seq, lines = dashLoggerHandler.get_since(n=curr_log['seq'])
+    if not lines:
+        return dash.no_update
+    return {'seq': seq, 'lines': lines}
 
 
-@app.callback(
-    Output("dh-modal", "is_open"),
-    Input("download-help", "n_clicks"),
+# clientside callback to append the new log lines to the (bounded) log textarea and autoscroll it
+app.clientside_callback(
+    """
+    function appendLog(newLog, currLog) {
+        var lines = newLog.lines.join("\\n");
+        // scroll once the new value is rendered, unless the user is selecting text
+        setTimeout(function() {
+            var textarea = document.getElementById("console-out");
+            if(textarea.selectionStart == textarea.selectionEnd) {
+                textarea.scrollTop = textarea.scrollHeight;
+            }
+        }, 0);
+        var log = currLog ? currLog + "\\n" + lines : lines;
+        // keep only the most recent lines, like the server-side log queue
+        if(log.length > 65536) {
+            log = log.slice(log.indexOf("\\n", log.length - 65536) + 1);
+        }
+        return log;
+    }
+    """,
+    Output('console-out', 'value'),
+    Input('console-new', 'data'),
+    State('console-out', 'value'),
     prevent_initial_call=True
 )
-def show_download_help(n: int) -> bool:
-    """Display the "Download Help" modal window.
-
-    Args:
-        n (int): Number of button clicks.
 
-    Returns:
-        bool: `is_open` modal property value.
-    """
-    return True
 
-
-@app.callback(Output('console-out', 'value'),
+@app.callback(Output('progress-data', 'data'),
               Input('interval1', 'n_intervals'),
+              State('progress-data', 'data'),
               prevent_initial_call=True)
-def update_output(n: int) -> str:
-    """Update the `Log` text area.
+def update_progress(n: int,
+                    curr_progress: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Update the `Evolution Progress` and `Current Iteration` progress bars data.
 
     Args:
         n (int): Interval time.
+        curr_progress (Optional[Dict[str, Any]]): The progress data currently displayed.
 
     Returns:
-        str: The updated content of the text area.
+        Dict[str, Any]: The current step progress and generation counter.
     """
-    return ('\n'.join(dashLoggerHandler.queue))
+    progress = {'step': app_settings.step_progress, 'gen': app_settings.gen_counter}
+    return dash.no_update if progress == curr_progress else progress
 
 
-@app.callback(
-    [Output("step-progress", "value"),
-     Output("step-progress", "label"),
-     Output('step-progress-div', 'style')],
-    [Input("interval1", "n_intervals")],
+# clientside callback to update the progress bars
+app.clientside_callback(
+    """
+    function formatProgress(progress) {
+        var visible = progress.step >= 0;
+        return [(Math.round(progress.step * 100) / 100) + "%",
+                {"content-visibility": visible ? "visible" : "hidden",
+                 "display": visible ? "inline-block" : "none",
+                 "width": "100%"},
+                100,
+                String(progress.gen)];
+    }
+    """,
+    [Output("step-progress", "label"),
+     Output('step-progress-div', 'style'),
+     Output("gen-progress", "value"),
+     Output("gen-progress", "label")],
+    Input('progress-data', 'data'),
     prevent_initial_call=True
 )
-def update_progress(n: int) -> Tuple[int, str]:
-    """Update the `Evolution Progress` progress bar.
 
-    Args:
-        n (int): Interval time.
 
-    Returns:
-        Tuple[int, str]: The current progress value and string percentage representation.
+# clientside callback to smoothly move the step progress bar towards the last known progress between updates
+app.clientside_callback(
     """
-    return app_settings.step_progress, f"{np.round(app_settings.step_progress, 2)}%", {'content-visibility': 'visible' if app_settings.step_progress >= 0 else 'hidden',
-                                                                                       'display': 'inline-block' if app_settings.step_progress >= 0 else 'none',
-                                                                                       'width': '100%'}
-
-
-@app.callback(
-    [Output("gen-progress", "value"),
-     Output("gen-progress", "label")],
-    [Input("interval1", "n_intervals")],
+    function easeProgress(n, progress, value) {
+        if(!progress) {
+            return dash_clientside.no_update;
+        }
+        var target = Math.max(progress.step, 0);
+        // snap when close enough or when a new step started
+        if(typeof value !== "number" || target < value || target - value < 0.5) {
+            return value === target ? dash_clientside.no_update : target;
+        }
+        return value + (target - value) * 0.25;
+    }
+    """,
+    Output("step-progress", "value"),
+    Input('interval2', 'n_intervals'),
+    State('progress-data', 'data'),
+    State("step-progress", "value"),
     prevent_initial_call=True
 )
-def update_gen_progress(n: int) -> Tuple[int, str]:
-    """Update the `Current Iteration` progress bar.
+
+
+def _json_dumpb(obj: Any) -> bytes:
+    """Dump a Python object to JSON `bytes` with `orjson`, which is faster than `json_dumps` on large objects.
+    Unlike `json_dumps`, dataclasses, `Enum` members, datetimes and NumPy scalars are serialized natively
+    instead of being `pickle`d, so they are not restored as such by `json_loads`.
+    Only use it on objects that do not contain any, as the MAP-Elites object (which is `pickle`d as a whole)
+    and the spaceship properties.
 
     Args:
-        n (int): Interval time.
+        obj (Any): The Python object.
 
     Returns:
-        Tuple[int, str]: The current progress value and string percentage representation.
+        bytes: The UTF-8 encoded JSON.
     """
-    return 100, f"{app_settings.gen_counter}"
+    return orjson.dumps(obj,
+                        default=PythonObjectEncoder().default)
 
 
 @app.callback(
@@ -1279,6 +1496,7 @@ def update_gen_progress(n: int) -> Tuple[int, str]:
 )
 def download_mapelites(n_clicks: int) -> Dict[str, str]:
     """Download the current MAP-Elites object.
+    The object is only serialized again if it changed since the last download.
 
     Args:
         n_clicks (int): Number of button clicks.
@@ -1290,7 +1508,73 @@ def download_mapelites(n_clicks: int) -> Dict[str, str]:
     fname = f'{t}_mapelites_{app_settings.current_mapelites.emitter.name}_gen{app_settings.gen_counter:02}'
     logging.getLogger('webapp').info(
         f'The MAP-Elites object will be downloaded shortly.')
-    return dict(content=json_dumps(app_settings.current_mapelites), filename=f'{fname}.json')
+    mapelites = app_settings.current_mapelites
+    content = mapelites_json_cache.get_or_compute(key=mapelites.version,
+                                                  f=lambda: _json_dumpb(mapelites).decode('utf-8'))
+    return dict(content=content, filename=f'{fname}.json')
+
+
+def _make_blueprint(mapelites: MAPElites,
+                    bin_idx: Tuple[int, int],
+                    symmetry: Optional[str]) -> Tuple[str, bytes]:
+    """Create the game blueprint of the feasible elite in a bin.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+        bin_idx (Tuple[int, int]): The index of the bin.
+        symmetry (Optional[str]): The symmetry axis to enforce, if any.
+
+    Returns:
+        Tuple[str, bytes]: The blueprint `.sbc` and the spaceship string representation (as JSON).
+    """
+    elite = get_elite(mapelites=mapelites,
+                      bin_idx=bin_idx,
+                      pop='feasible')
+    logging.getLogger('webapp').debug(msg=f'[{__name__}._make_blueprint] Loaded elite solution {elite=}.')
+    string = elite.string
+    if symmetry is not None:
+        string = enforce_symmetry(string=string,
+                                  axis=symmetry)
+    tmp = CandidateSolution(string=string)
+    tmp.ll_string = elite.ll_string
+    tmp.base_color = elite.base_color
+    mapelites.lsystem._set_structure(cs=tmp)
+    logging.getLogger('webapp').debug(msg=f'[{__name__}._make_blueprint] Copied threadsafe elite solution, starting hullbuilding...')
+    hullbuilder = HullBuilder(erosion_type=mapelites.hull_builder.erosion_type,
+                              apply_erosion=True,
+                              apply_smoothing=True)
+    hullbuilder.add_external_hull(tmp.content)
+    tmp.content.set_color(tmp.base_color)
+    logging.getLogger('webapp').debug(
+        f'[{__name__}._make_blueprint] {tmp.string=}; {tmp.content=}; {tmp.base_color=}')
+    blueprint = convert_structure_to_xml(structure=tmp.content,
+                                         name=f'My Spaceship ({app_settings.rngseed})')
+    content_properties = {
+        'string': tmp.string,
+        'base_color': tmp.base_color.as_dict()
+    }
+    return blueprint, _json_dumpb(content_properties)
+
+
+def _get_blueprint(mapelites: MAPElites,
+                   bin_idx: Tuple[int, int],
+                   symmetry: Optional[str]) -> Tuple[str, bytes]:
+    """Get the game blueprint of the feasible elite in a bin.
+    The blueprint is only created again if the MAP-Elites state changed.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+        bin_idx (Tuple[int, int]): The index of the bin.
+        symmetry (Optional[str]): The symmetry axis to enforce, if any.
+
+    Returns:
+        Tuple[str, bytes]: The blueprint `.sbc` and the spaceship string representation (as JSON).
+    """
+    key = (mapelites.version, tuple(bin_idx), symmetry, app_settings.rngseed)
+    return blueprint_cache.get_or_compute(key=key,
+                                          f=lambda: _make_blueprint(mapelites=mapelites,
+                                                                    bin_idx=bin_idx,
+                                                                    symmetry=symmetry))
 
 
 @app.callback(
@@ -1318,7 +1602,8 @@ def download_content(curr_content: Dict[str, Any],
     global download_semaphore
 
     def write_archive(bytes_io):
-        with ZipFile(bytes_io, mode="w", compression=ZIP_DEFLATED) as zf:
+        # text entries compress well even at the fastest level
+        with ZipFile(bytes_io, mode="w", compression=ZIP_DEFLATED, compresslevel=1) as zf:
             # with open('./assets/thumb.png', 'rb') as f:
             #     thumbnail_img = f.read()
             logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Started function, writing zip file...')
@@ -1327,44 +1612,23 @@ def download_content(curr_content: Dict[str, Any],
             logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Created thumbnail from plot...')
             content_fig.update_layout(scene_camera=curr_camera.get('scene.camera', None))
             logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Updated thumbnail camera...')
-            thumbnail_img = content_fig.to_image(format="png")
-            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Converted to image...')
-            zf.writestr('thumb.png', thumbnail_img)
-            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Loaded and saved thumbnail.')
-            elite = get_elite(mapelites=app_settings.current_mapelites,
-                              bin_idx=_switch(
-                                  [app_settings.selected_bins[-1]])[0],
-                              pop='feasible')
-            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Loaded elite solution {elite=}.')
-            if app_settings.symmetry is not None:
-                elite.string = enforce_symmetry(string=elite.string,
-                                                    axis=app_settings.symmetry)
-            tmp = CandidateSolution(string=elite.string)
-            tmp.ll_string = elite.ll_string
-            tmp.base_color = elite.base_color
-            app_settings.current_mapelites.lsystem._set_structure(cs=tmp)
-            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Copied threadsafe elite solution, starting hullbuilding...')
-            hullbuilder = HullBuilder(erosion_type=app_settings.current_mapelites.hull_builder.erosion_type,
-                                      apply_erosion=True,
-                                      apply_smoothing=True)
-            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Added external hull, unlocking semaphore...')
+            # the image export runs in a separate process, so it can overlap with the hullbuilding
+            thumbnail_img_future = thumbnail_executor.submit(content_fig.to_image, format="png")
+            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Started converting to image...')
+            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Unlocking semaphore...')
             download_semaphore.unlock()
             download_semaphore._running = 'YES'
             logging.getLogger('webapp').debug(
                 f'[{__name__}.write_archive] {download_semaphore.is_locked=}')
-            hullbuilder.add_external_hull(tmp.content)
-            tmp.content.set_color(tmp.base_color)
-            logging.getLogger('webapp').debug(
-                f'[{__name__}.write_archive] {tmp.string=}; {tmp.content=}; {tmp.base_color=}')
-            zf.writestr('bp.sbc', convert_structure_to_xml(structure=tmp.content,
-                        name=f'My Spaceship ({app_settings.rngseed})'))
+            blueprint, content_properties = _get_blueprint(mapelites=app_settings.current_mapelites,
+                                                           bin_idx=_switch_bin(app_settings.selected_bins[-1]),
+                                                           symmetry=app_settings.symmetry)
+            zf.writestr('bp.sbc', blueprint)
             logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Created game blueprint, saving spaceship string representation...')
-            content_properties = {
-                'string': tmp.string,
-                'base_color': tmp.base_color.as_dict()
-            }
-            zf.writestr(f'spaceship_{app_settings.rngseed}_gen{app_settings.gen_counter}', json.dumps(
-                content_properties))
+            zf.writestr(f'spaceship_{app_settings.rngseed}_gen{app_settings.gen_counter}', content_properties)
+            # PNG data is already compressed
+            zf.writestr('thumb.png', thumbnail_img_future.result(), compress_type=ZIP_STORED)
+            logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Loaded and saved thumbnail.')
             logging.getLogger('webapp').debug(msg=f'[{__name__}.write_archive] Zip file completed and ready to be downloaded.')
             download_semaphore._running = 'NO'
 
@@ -1387,130 +1651,84 @@ def change_emitter_steps(n_steps: int) -> Any:
     return n_steps
 
 
-@app.callback(Output('step-btn', 'disabled'),
-              Output('download-btn', 'disabled'),
-              Output('popdownload-btn', 'disabled'),
-              Output('rand-step-btn', 'disabled'),
-              Output('selection-clr-btn', 'disabled'),
-              Output('selection-btn', 'disabled'),
-              Output('reset-btn', 'disabled'),
-              Output('subdivide-btn', 'disabled'),
-              Output('download-mapelites-btn', 'disabled'),
-              Output('update-rules-btn', 'disabled'),
-              Output('popupload-data', 'disabled'),
-              Output('population-dropdown', 'disabled'),
-              Output('metric-dropdown', 'disabled'),
-              Output('method-radio', 'options'),
-              Output('b0-dropdown', 'disabled'),
-              Output('b1-dropdown', 'disabled'),
-              Output('lsystem-modules', 'options'),
-              Output('emitter-dropdown', 'disabled'),
-              Output('symmetry-dropdown', 'disabled'),
-              Output('color-picker', 'disabled'),
-              Output('heatmap-plot-container', 'style'),
-              Output({'type': 'fitness-sldr', 'index': ALL}, 'disabled'),
-              Output('webapp-quickstart-btn', 'disabled'),
-              Output('webapp-info-btn', 'disabled'),
-              Output('ai-info-btn', 'disabled'),
-              Output('tsrm-y-btn', 'disabled'),
+# components disabled while a process is running
+busy_disabled_ids: List[str] = ['step-btn', 'popdownload-btn', 'rand-step-btn', 'selection-clr-btn', 'selection-btn',
+                                'reset-btn', 'subdivide-btn', 'download-mapelites-btn', 'update-rules-btn', 'popupload-data',
+                                'population-dropdown', 'metric-dropdown', 'b0-dropdown', 'b1-dropdown', 'emitter-dropdown',
+                                'symmetry-dropdown', 'color-picker', 'webapp-quickstart-btn', 'webapp-info-btn', 'ai-info-btn',
+                                'tsrm-y-btn', 'color-picker-btn', 'voxel-preview-toggle', 'unsaferules-mode-toggle',
+                                'evo-iter-sldr', 'mindim-x', 'maxdim-x', 'mindim-y', 'maxdim-y', 'mindim-z', 'maxdim-z',
+                                'dims-btn']
+
+
+@app.callback(Output('busy-state', 'data'),
               Output('tsm-body-loading', 'children'),
-              Output('color-picker-btn', 'disabled'),
-              Output('voxel-preview-toggle', 'disabled'),
-              Output('unsaferules-mode-toggle', 'disabled'),
-              Output('evo-iter-sldr', 'disabled'),
-              Output('mindim-x', 'disabled'),
-              Output('maxdim-x', 'disabled'),
-              Output('mindim-y', 'disabled'),
-              Output('maxdim-y', 'disabled'),
-              Output('mindim-z', 'disabled'),
-              Output('maxdim-z', 'disabled'),
-              Output('dims-btn', 'disabled'),
-
-              State({'type': 'fitness-sldr', 'index': ALL}, 'disabled'),
-              State('method-radio', 'options'),
-              State('lsystem-modules', 'options'),
+              State('busy-state', 'data'),
               State('tsm-body-loading', 'children'),
-
               Input('interval2', 'n_intervals'),
               )
-def interval_updates(fdis: List[Dict[str, bool]],
-                     ms: List[Dict[str, str]],
-                     lsysms: List[Dict[str, str]],
+def interval_updates(curr_busy_state: Optional[Dict[str, bool]],
                      tsm_loading_data_children: List[Any],
-                     ni: int) -> Tuple[Union[bool, Dict[str, Any], List[Any]], ...]:
-    """Update the `disable` property of components at every interval.
+                     ni: int) -> Tuple[Dict[str, bool], List[Any]]:
+    """Check at every interval whether a process is running.
+    The components are disabled clientside, and only when the state changes.
 
     Args:
-        fdis (List[Dict[str, bool]]): The list of fitness sliders.
-        ms (List[Dict[str, str]]): The list of plotting methods.
-        lsysms (List[Dict[str, str]]): The list of L-system modules.
+        curr_busy_state (Optional[Dict[str, bool]]): The last known state.
+        tsm_loading_data_children (List[Any]): The current loading component of the safe mode modal.
         ni (int): The interval value.
 
     Returns:
-        Tuple[Union[bool, Dict[str, Any], List[Any]], ...]: The `disabled` statuses of the components, and other values.
+        Tuple[Dict[str, bool], List[Any]]: The current state and the loading component of the safe mode modal.
     """
     # non-definitive solution, see: https://github.com/plotly/dash-table/issues/925, https://github.com/plotly/dash/issues/1861
     # long_callback and background callback also do not work (infinite redeployment of webapp)
     global process_semaphore
 
     running_something = process_semaphore.is_locked
-
-    for o in ms:
-        o['disabled'] = running_something
-    for o in lsysms:
-        o['disabled'] = running_something
-
-    btns = {
-        'step-btn.disabled': running_something ,
-        'download-btn.disabled': running_something or download_semaphore._running == 'YES',
-        'popdownload-btn.disabled': running_something,
-        'rand-step-btn.disabled': running_something,
-        'selection-clr-btn.disabled': running_something,
-        'selection-btn.disabled': running_something,
-        'reset-btn.disabled': running_something,
-        'subdivide-btn.disabled': running_something,
-        'download-mapelites-btn.disabled': running_something,
-        'update-rules-btn.disabled': running_something,
-        'popupload-data.disabled': running_something,
-        'population-dropdown.disabled': running_something,
-        'metric-dropdown.disabled': running_something,
-        'method-radio.options': ms,
-        'b0-dropdown.disabled': running_something,
-        'b1-dropdown.disabled': running_something,
-        'lsystem-modules.options': lsysms,
-        'emitter-dropdown.disabled': running_something,
-        'symmetry-dropdown.disabled': running_something,
-        'color-picker.disabled': running_something,
-        'heatmap-plot-container.style': {'visibility': 'visible' if running_something else 'hidden',
-                                         'display': 'grid' if running_something else 'none',
-                                         #  'background': '#ffffff11',  # decomment for debugging purposes
-                                         'pointer-events': 'auto',
-                                         'z-index': 1 if running_something else -1},
-        'fitness-sldr.disabled': [running_something] * len(fdis),
-        'webapp-quickstart-btn.disabled': running_something,
-        'webapp-info-btn.disabled': running_something,
-        'ai-info-btn.disabled': running_something,
-        'tsrm-y-btn.disabled': running_something,
-        'tsm-body-loading.children': [],
-        'color-picker-btn.disabled': running_something,
-        'voxel-preview-toggle.disabled': running_something,
-        'unsaferules-mode-toggle.disabled': running_something,
-        'evo-iter-sldr.disabled': running_something,
-        'mindim-x.disabled': running_something,
-        'maxdim-x.disabled': running_something,
-        'mindim-y.disabled': running_something,
-        'maxdim-y.disabled': running_something,
-        'mindim-z.disabled': running_something,
-        'maxdim-z.disabled': running_something,
-        'dims-btn.disabled': running_something
-    }
+    busy_state = {'running': running_something,
+                  'downloading': download_semaphore._running == 'YES'}
 
     if running_something and tsm_loading_data_children == []:
-        btns['tsm-body-loading.children'] = loading_data_component
-    elif running_something and tsm_loading_data_children != []:
-        btns['tsm-body-loading.children'] = dash.no_update
+        tsm_loading_data_children = loading_data_component
+    elif running_something or tsm_loading_data_children == []:
+        tsm_loading_data_children = dash.no_update
+    else:
+        tsm_loading_data_children = []
+
+    return dash.no_update if busy_state == curr_busy_state else busy_state, tsm_loading_data_children
 
-    return tuple(btns.values())
+
+# clientside callback to (un)set the `disabled` property of components when a process starts or ends
+app.clientside_callback(
+    """
+    function updateDisabled(busyState, fdis, ms, lsysms) {
+        var running = busyState.running;
+        var setDisabled = function(options) {
+            return options.map(function(o) { return Object.assign({}, o, {disabled: running}); });
+        };
+        return [running || busyState.downloading,
+                setDisabled(ms),
+                setDisabled(lsysms),
+                {"visibility": running ? "visible" : "hidden",
+                 "display": running ? "grid" : "none",
+                 "pointer-events": "auto",
+                 "z-index": running ? 1 : -1},
+                fdis.map(function() { return running; })].concat(Array(""" + str(len(busy_disabled_ids)) + """).fill(running));
+    }
+    """,
+    Output('download-btn', 'disabled'),
+    Output('method-radio', 'options'),
+    Output('lsystem-modules', 'options'),
+    Output('heatmap-plot-container', 'style'),
+    Output({'type': 'fitness-sldr', 'index': ALL}, 'disabled'),
+    *[Output(component_id, 'disabled') for component_id in busy_disabled_ids],
+    Input('busy-state', 'data'),
+    State({'type': 'fitness-sldr', 'index': ALL}, 'disabled'),
+    State('method-radio', 'options'),
+    State('lsystem-modules', 'options'),
+    prevent_initial_call=True
+)
 
 
 def _switch(ls: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
@@ -1525,6 +1743,52 @@ def _switch(ls: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
     return [(e[1], e[0]) for e in ls]
 
 
+def _switch_bin(b: Tuple[int, int]) -> Tuple[int, int]:
+    """Switch the elements of a bin index.
+
+    Args:
+        b (Tuple[int, int]): The bin index.
+
+    Returns:
+        Tuple[int, int]: The bin index with the elements switched.
+    """
+    return b[1], b[0]
+
+
+def _get_bin_offsets(mapelites: MAPElites) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Get the start of each bin along the two behavior characteristics, as sum of the sizes of the preceding bins.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+
+    Returns:
+        Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]: The offsets along the first and the second behavior characteristic.
+    """
+    def compute_offsets() -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        sizes = np.asarray([b.bin_size for b in mapelites.bins.flat], dtype=np.float64).reshape(*mapelites.bins.shape, 2)
+        offsets0 = np.zeros(mapelites.bins.shape, dtype=np.float64)
+        offsets1 = np.zeros(mapelites.bins.shape, dtype=np.float64)
+        offsets0[1:, :] = sizes[:-1, :, 0].cumsum(axis=0)
+        offsets1[:, 1:] = sizes[:, :-1, 1].cumsum(axis=1)
+        return offsets0, offsets1
+
+    return bin_offsets_cache.get_or_compute(key=mapelites.version,
+                                            f=compute_offsets)
+
+
+def _get_valid_bins(mapelites: MAPElites) -> FrozenSet[Tuple[int, int]]:
+    """Get the indices of the valid bins.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+
+    Returns:
+        FrozenSet[Tuple[int, int]]: The indices of the valid bins.
+    """
+    return valid_bins_cache.get_or_compute(key=mapelites.version,
+                                           f=lambda: frozenset(b.bin_idx for b in mapelites._valid_bins()))
+
+
 def _format_bins(mapelites: MAPElites,
                  bins_idx_list: List[Tuple[int, int]],
                  str_prefix: str,
@@ -1542,35 +1806,170 @@ def _format_bins(mapelites: MAPElites,
     Returns:
         Tuple[List[Tuple[int, int]], str]: The list of selected bins, and the string representation.
     """
-    global app_settings
-    
+    key = (mapelites.version, tuple(bins_idx_list), str_prefix, do_switch, filter_out_empty)
+    bins_idx_tuple, sel_bins_str = formatted_bins_cache.get_or_compute(key=key,
+                                                                      f=lambda: _compute_format_bins(mapelites=mapelites,
+                                                                                                     bins_idx_list=bins_idx_list,
+                                                                                                     str_prefix=str_prefix,
+                                                                                                     do_switch=do_switch,
+                                                                                                     filter_out_empty=filter_out_empty))
+    # callers modify the selection in place
+    return list(bins_idx_tuple), sel_bins_str
+
+
+def _compute_format_bins(mapelites: MAPElites,
+                         bins_idx_list: List[Tuple[int, int]],
+                         str_prefix: str,
+                         do_switch: bool,
+                         filter_out_empty: bool) -> Tuple[Tuple[Tuple[int, int], ...], str]:
+    """Compute the list of currently selected bins and the string representation to display.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+        bins_idx_list (List[Tuple[int, int]]): The list of selected bins.
+        str_prefix (str): The prefix of the string representation.
+        do_switch (bool): Whether to switch the bins index.
+        filter_out_empty (bool): Whether to remove empty bins from the list.
+
+    Returns:
+        Tuple[Tuple[Tuple[int, int], ...], str]: The selected bins, and the string representation.
+    """
     bins_list: List[MAPBin] = [mapelites.bins[j, i]
                                if do_switch else mapelites.bins[i, j] for (i, j) in bins_idx_list]
+    offsets0, offsets1 = _get_bin_offsets(mapelites=mapelites)
     sel_bins_str = f'{str_prefix}'
+    empty_bins = set()
     for b in bins_list:
         i, j = b.bin_idx
         if filter_out_empty:
             if b.non_empty(pop='feasible') or b.non_empty(pop='infeasible'):
                 i, j = (j, i) if do_switch else (i, j)
-                bc1 = np.sum([mbin.bin_size[0]
-                             for mbin in mapelites.bins[:i, j]])
-                bc2 = np.sum([mbin.bin_size[1]
-                             for mbin in mapelites.bins[i, :j]])
+                bc1, bc2 = offsets0[i, j], offsets1[i, j]
                 sel_bins_str += f' {(i, j)} [{bc1}:{bc2}];'
-            elif b.bin_idx in bins_idx_list:
-                bins_idx_list.remove((i, j))
+            else:
+                empty_bins.add((i, j))
         else:
-            bc1 = np.sum([mbin.bin_size[0] for mbin in mapelites.bins[:i, j]])
-            bc2 = np.sum([mbin.bin_size[1] for mbin in mapelites.bins[i, :j]])
+            bc1, bc2 = offsets0[i, j], offsets1[i, j]
             sel_bins_str += f' {(i, j)} [{bc1}:{bc2}];'
-    return bins_idx_list, sel_bins_str
+    return tuple(b for b in bins_idx_list if b not in empty_bins), sel_bins_str
 
 
-def _build_heatmap(mapelites: MAPElites,
-                   pop_name: str,
-                   metric_name: str,
-                   method_name: str) -> go.Figure:
+@functools.lru_cache(maxsize=None)
+def _get_template(name: str,
+                  trace_type: str) -> Dict[str, Any]:
+    """Get a Plotly template as a dictionary.
+    Only the defaults of the given trace type are kept, as the template is sent along with every figure.
+
+    Args:
+        name (str): The name of the template.
+        trace_type (str): The type of traces the template is used for.
+
+    Returns:
+        Dict[str, Any]: The template.
+    """
+    template = pio.templates[name].to_plotly_json()
+    return {'data': {trace_type: template['data'][trace_type]} if trace_type in template['data'] else {},
+            'layout': template['layout']}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_colorscale(name: str) -> List[List[Union[float, str]]]:
+    """Get a named Plotly colorscale as a list of (value, color) pairs.
+
+    Args:
+        name (str): The name of the colorscale.
+
+    Returns:
+        List[List[Union[float, str]]]: The colorscale.
+    """
+    return plotly.colors.get_colorscale(name)
+
+
+def _get_heatmap_labels(mapelites: MAPElites) -> npt.NDArray[np.float64]:
+    """Get the behavior characteristics values at the start of each heatmap cell.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+
+    Returns:
+        npt.NDArray[np.float64]: The (rows, columns, 2) labels of the heatmap cells.
+    """
+    def compute_labels() -> npt.NDArray[np.float64]:
+        x_labels = np.round(np.cumsum(
+            [0] + mapelites.bin_sizes[0][:-1]) + mapelites.b_descs[0].bounds[0], 2)
+        y_labels = np.round(np.cumsum(
+            [0] + mapelites.bin_sizes[1][:-1]) + mapelites.b_descs[1].bounds[0], 2)
+        labels = np.empty(shape=(mapelites.bins.shape[1], mapelites.bins.shape[0], 2))
+        labels[:, :, 0] = x_labels[np.newaxis, :]
+        labels[:, :, 1] = y_labels[:, np.newaxis]
+        labels.flags.writeable = False
+        return labels
+
+    return heatmap_labels_cache.get_or_compute(key=mapelites.version,
+                                               f=compute_labels)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_block_lookup() -> Tuple[npt.NDArray[np.object_], npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.object_]]:
+    """Get the per-block-type lookup tables used to label and color the spaceship preview.
+    Tables are indexed by the 0-based index of the block type in `block_definitions`.
+
+    Returns:
+        Tuple[npt.NDArray[np.object_], npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.object_]]: The blocks labels, whether they are base blocks, whether they are transparent blocks, and their fixed colors.
+    """
+    labels = np.asarray([Structure._clean_label(a=block_type) for block_type in block_definitions.keys()], dtype=object)
+    base_blocks = np.asarray([_is_base_block(block_type=label) for label in labels], dtype=bool)
+    transparent_blocks = np.asarray([_is_transparent_block(block_type=label) for label in labels], dtype=bool)
+    block_colors = np.asarray([fixed_block_colour.get(label, block_to_colour['Unrecognized']) for label in labels], dtype=object)
+    for arr in (labels, base_blocks, transparent_blocks, block_colors):
+        arr.flags.writeable = False
+    return labels, base_blocks, transparent_blocks, block_colors
+
+
+def _update_content_layout(fig: go.Figure,
+                           camera: Optional[Dict[str, Any]] = None) -> None:
+    """Set the layout of a spaceship preview plot.
+
+    Args:
+        fig (go.Figure): The spaceship preview plot.
+        camera (Optional[Dict[str, Any]], optional): The spaceship preview plot camera position. Defaults to None.
+    """
+    camera = camera if camera is not None else dict(up=dict(x=0, y=0, z=1),
+                                                    center=dict(x=0, y=0, z=0),
+                                                    eye=dict(x=2, y=2, z=2))
+    fig.update_layout(scene=dict(aspectmode='data'),
+                      scene_camera=camera,
+                      template='plotly_dark',
+                      #   paper_bgcolor='rgba(0,0,0,0)',
+                      #   plot_bgcolor='rgba(0,0,0,0)',
+                      margin=go.layout.Margin(l=0,
+                                              r=0,
+                                              b=0,
+                                              t=0))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_empty_content() -> go.Figure:
+    """Get the spaceship preview plot shown when no bin is selected, with the default camera position.
+    The figure is shared: copy it before modifying it.
+
+    Returns:
+        go.Figure: The empty spaceship preview plot.
+    """
+    fig = go.Figure()
+    fig.add_mesh3d(x=np.zeros(0, dtype=object),
+                   y=np.zeros(0, dtype=object),
+                   z=np.zeros(0, dtype=object))
+    _update_content_layout(fig=fig)
+    return fig
+
+
+def _draw_heatmap(mapelites: MAPElites,
+                  pop_name: str,
+                  metric_name: str,
+                  method_name: str) -> Dict[str, Any]:
     """Generate the heatmap of the spaceships population.
+    The figure is built as a plain dictionary to skip Plotly's validation of the template and properties.
 
     Args:
         mapelites (MAPElites): The MAP-Elites object.
@@ -1579,99 +1978,83 @@ def _build_heatmap(mapelites: MAPElites,
         method_name (str): The name of the method to use.
 
     Returns:
-        go.Figure: The heatmap figure.
+        Dict[str, Any]: The heatmap figure.
     """
-    valid_bins = [x.bin_idx for x in mapelites._valid_bins()]
+    valid_bins = _get_valid_bins(mapelites=mapelites)
     metric = app_settings.hm_callback_props['metric'][metric_name]
     use_mean = app_settings.hm_callback_props['method'][method_name]
     population = app_settings.hm_callback_props['pop'][pop_name]
     # build heatmap
-    disp_map = np.zeros(shape=mapelites.bins.shape)
-    labels = np.zeros(
-        shape=(mapelites.bins.shape[1], mapelites.bins.shape[0], 2))
-    text = []
-    x_labels = np.round(np.cumsum(
-        [0] + mapelites.bin_sizes[0][:-1]) + mapelites.b_descs[0].bounds[0], 2)
-    y_labels = np.round(np.cumsum(
-        [0] + mapelites.bin_sizes[1][:-1]) + mapelites.b_descs[1].bounds[0], 2)
-    for i in range(mapelites.bins.shape[0]):
-        for j in range(mapelites.bins.shape[1]):
-            v = mapelites.bins[i, j].get_metric(metric=metric['name'],
-                                                use_mean=use_mean,
-                                                population=population)
-            disp_map[i, j] = v if v != 0 else None
-            s = ''
-            if mapelites.bins[i, j].non_empty(pop='feasible'):
-                if (i, j) in valid_bins:
-                    if (j, i) in app_settings.selected_bins:
-                        s = '☑'
-                    elif app_settings.gen_counter > 0 and mapelites.bins[i, j].new_elite[population]:
-                        s = '▣'
-            if j == 0:
-                text.append([s])
-            else:
-                text[-1].append(s)
-            labels[j, i, 0] = x_labels[i]
-            labels[j, i, 1] = y_labels[j]
+    # empty bins are left as gaps without computing their metric
+    populated = np.frompyfunc(lambda b: b.non_empty(pop=population), 1, 1)(mapelites.bins).astype(bool)
+    disp_map = np.full(shape=mapelites.bins.shape, fill_value=np.nan)
+    disp_map[populated] = np.frompyfunc(lambda b: b.get_metric(metric=metric['name'],
+                                                               use_mean=use_mean,
+                                                               population=population), 1, 1)(mapelites.bins[populated]).astype(float)
+    disp_map[disp_map == 0] = np.nan
+    shown = np.frompyfunc(lambda b: b.non_empty(pop='feasible') and b.bin_idx in valid_bins, 1, 1)(mapelites.bins).astype(bool)
+    selected = np.zeros(shape=mapelites.bins.shape, dtype=bool)
+    for (j, i) in app_settings.selected_bins:
+        selected[i, j] = True
+    if app_settings.gen_counter > 0:
+        new_elites = np.frompyfunc(lambda b: b.new_elite[population], 1, 1)(mapelites.bins).astype(bool)
+    else:
+        new_elites = np.zeros(shape=mapelites.bins.shape, dtype=bool)
+    text = np.where(shown & selected, '☑', np.where(shown & new_elites, '▣', '')).tolist()
+    labels = _get_heatmap_labels(mapelites=mapelites)
     # plot
     hovertemplate = f'{mapelites.b_descs[0].name}: X<br>{mapelites.b_descs[1].name}: Y<br>{metric_name}: Z<extra></extra>'
     hovertemplate = hovertemplate.replace('X', '%{customdata[0]}').replace(
         'Y', '%{customdata[1]}').replace('Z', '%{z}')
-    heatmap = go.Figure(
-        data=go.Heatmap(
-            z=disp_map,
-            zmin=0,
-            zmax=app_settings.hm_callback_props['metric'][metric_name]['zmax'][population],
-            x=np.arange(disp_map.shape[0]),
-            y=np.arange(disp_map.shape[1]),
-            hoverongaps=False,
-            colorscale=app_settings.hm_callback_props['metric'][metric_name]['colorscale'],
-            text=text,
-            texttemplate='%{text}',
-            textfont={"color": 'rgba(238, 238, 238, 1.)'},
-            colorbar={"title": {"text": "Fitness",
-                                "side": "right"}, 'orientation': 'v'},
-            customdata=labels,
-        ))
-    heatmap.update_xaxes(title=dict(text=mapelites.b_descs[0].name))
-    heatmap.update_yaxes(title=dict(text=mapelites.b_descs[1].name))
-    heatmap.update_coloraxes(colorbar_title_text=metric_name)
-    heatmap.update_layout(autosize=False,
-                          dragmode='pan',
-                          clickmode='event+select',
-                          paper_bgcolor='rgba(0,0,0,0)',
-                          plot_bgcolor='rgba(0,0,0,1)',
-                          template='plotly_dark',
-                          xaxis_showgrid=False,
-                          yaxis_showgrid=False,
-                          xaxis_zeroline=False,
-                          yaxis_zeroline=False,
-                          margin=go.layout.Margin(
-                              l=0,
-                              r=0,
-                              b=0,
-                              t=0))
-    heatmap.update_traces(hovertemplate=hovertemplate)
-    heatmap.update_traces(selector=dict(type='heatmap'))
-    heatmap.update_layout(
-        xaxis={
-            'tickvals': np.arange(disp_map.shape[0]),
-            'ticktext': x_labels
-        },
-        yaxis={
-            'tickvals': np.arange(disp_map.shape[1]),
-            'ticktext': y_labels
+    heatmap = {
+        'data': [{
+            'type': 'heatmap',
+            'z': disp_map,
+            'zmin': 0,
+            'zmax': metric['zmax'][population],
+            'x': np.arange(disp_map.shape[0]),
+            'y': np.arange(disp_map.shape[1]),
+            'hoverongaps': False,
+            'colorscale': _get_colorscale(name=metric['colorscale']),
+            'text': text,
+            'texttemplate': '%{text}',
+            'textfont': {'color': 'rgba(238, 238, 238, 1.)'},
+            'colorbar': {'title': {'text': 'Fitness',
+                                   'side': 'right'},
+                         'orientation': 'v'},
+            'customdata': labels,
+            'hovertemplate': hovertemplate
+        }],
+        'layout': {
+            'autosize': False,
+            'dragmode': 'pan',
+            'clickmode': 'event+select',
+            'paper_bgcolor': 'rgba(0,0,0,0)',
+            'plot_bgcolor': 'rgba(0,0,0,1)',
+            'template': _get_template(name='plotly_dark', trace_type='heatmap'),
+            'xaxis': {'title': {'text': mapelites.b_descs[0].name},
+                      'showgrid': False,
+                      'zeroline': False,
+                      'tickvals': np.arange(disp_map.shape[0]),
+                      'ticktext': labels[0, :, 0]},
+            'yaxis': {'title': {'text': mapelites.b_descs[1].name},
+                      'showgrid': False,
+                      'zeroline': False,
+                      'tickvals': np.arange(disp_map.shape[1]),
+                      'ticktext': labels[:, 0, 1]},
+            'coloraxis': {'colorbar': {'title': {'text': metric_name}}},
+            'margin': {'l': 0, 'r': 0, 'b': 0, 't': 0}
         }
-    )
+    }
 
     return heatmap
 
 
-def _get_elite_content(mapelites: MAPElites,
-                       bin_idx: Optional[Tuple[int, int]],
-                       pop: str,
-                       camera: Optional[Dict[str, Any]] = None,
-                       show_voxel: bool = False) -> go.Scatter3d:
+def _draw_elite_content(mapelites: MAPElites,
+                        bin_idx: Optional[Tuple[int, int]],
+                        pop: str,
+                        camera: Optional[Dict[str, Any]] = None,
+                        show_voxel: bool = False) -> go.Scatter3d:
     """Generate the spaceship preview plot.
 
     Args:
@@ -1709,31 +2092,30 @@ def _get_elite_content(mapelites: MAPElites,
         x, y, z = arr
         fig = go.Figure()
 
-        cs = [content[i, j, k] for i, j, k in zip(x, y, z)]
-        unique_blocks = {v: structure._clean_label(
-            list(block_definitions.keys())[v - 1]) for v in cs}
+        # block values in `content` are 1-based indices of `block_definitions`
+        labels, base_blocks, transparent_blocks, block_colors = _get_block_lookup()
+        cs = content[x, y, z]
 
         if not show_voxel:
-            ss = [structure._clean_label(
-                list(block_definitions.keys())[v - 1]) for v in cs]
-            custom_colors = []
-            for (i, j, k) in zip(x, y, z):
+            ss = labels[cs - 1]
+            custom_colors = block_colors[cs - 1]
+            # base blocks keep their own color
+            rgb_colors = {}
+            for n in np.flatnonzero(base_blocks[cs - 1]):
                 b = structure._blocks[(
-                    i * structure.grid_size, j * structure.grid_size, k * structure.grid_size)]
-                if _is_base_block(block_type=structure._clean_label(b.block_type)):
-                    custom_colors.append(f'rgb{b.color.as_tuple()}')
-                else:
-                    custom_colors.append(block_to_colour.get(structure._clean_label(
-                        b.block_type), block_to_colour['Unrecognized']))
+                    x[n] * structure.grid_size, y[n] * structure.grid_size, z[n] * structure.grid_size)]
+                color = b.color.as_tuple()
+                if color not in rgb_colors:
+                    rgb_colors[color] = f'rgb{color}'
+                custom_colors[n] = rgb_colors[color]
             # black points for internal air blocks
             air = np.nonzero(structure.air_blocks_gridmask)
             air_x, air_y, air_z = air
-            x = np.asarray(x.tolist() + air_x.tolist())
-            y = np.asarray(y.tolist() + air_y.tolist())
-            z = np.asarray(z.tolist() + air_z.tolist())
-            custom_colors.extend([block_to_colour['Air']
-                                 for _ in range(len(air_x))])
-            ss.extend(['' for _ in range(len(air_x))])
+            x = np.concatenate([x, air_x])
+            y = np.concatenate([y, air_y])
+            z = np.concatenate([z, air_z])
+            custom_colors = np.concatenate([custom_colors, np.full(len(air_x), block_to_colour['Air'], dtype=object)]).tolist()
+            ss = np.concatenate([ss, np.full(len(air_x), '', dtype=object)]).tolist()
             # create scatter 3d plot
             fig.add_scatter3d(x=x,
                               y=y,
@@ -1749,28 +2131,19 @@ def _get_elite_content(mapelites: MAPElites,
                               showlegend=False)
 
         else:
-            transparent_blocks = np.zeros_like(content)
-            opaque_blocks = np.zeros_like(content)
-            for v, block_type in unique_blocks.items():
-                if _is_transparent_block(block_type=block_type):
-                    transparent_blocks[content == v] = v
-                else:
-                    opaque_blocks[content == v] = v
+            # split blocks by transparency; `content` is 0 where there is no block
+            transparent = np.concatenate([[False], transparent_blocks])[content]
+            opaque_content = np.where(transparent, 0, content)
+            transparent_content = np.where(transparent, content, 0)
+
+            # colors by block value
+            base_rgb = f'rgb{base_color.as_tuple()}'
+            voxel_colors = np.where(base_blocks, base_rgb, block_colors)
 
             # add voxel plot
-            voxels = VoxelData(opaque_blocks)
-            ss = [structure._clean_label(list(block_definitions.keys())[
-                                         v - 1]) for v in voxels.intensities]
-            indices = {structure._clean_label(
-                n): i + 1 for i, n in enumerate(list(block_definitions.keys()))}
-            custom_colors = {}
-            for k, v in block_to_colour.items():
-                if k in indices:
-                    if _is_base_block(k):
-                        custom_colors[indices[k]
-                                      ] = f'rgb{base_color.as_tuple()}'
-                    else:
-                        custom_colors[indices[k]] = v
+            voxels = VoxelData(opaque_content)
+            intensities = np.asarray(voxels.intensities, dtype=int) - 1
+            ss = labels[intensities].tolist()
 
             fig.add_mesh3d(x=voxels.vertices[0] - 0.5,
                            y=voxels.vertices[1] - 0.5,
@@ -1778,8 +2151,7 @@ def _get_elite_content(mapelites: MAPElites,
                            i=voxels.triangles[0],
                            j=voxels.triangles[1],
                            k=voxels.triangles[2],
-                           facecolor=[custom_colors[ix]
-                                      for ix in voxels.intensities],
+                           facecolor=voxel_colors[intensities].tolist(),
                            opacity=1.,
                            flatshading=False,
                            showlegend=False,
@@ -1793,19 +2165,9 @@ def _get_elite_content(mapelites: MAPElites,
                                              roughness=0.25,
                                              fresnel=0.25))
 
-            voxels = VoxelData(transparent_blocks)
-            ss = [structure._clean_label(list(block_definitions.keys())[
-                                         v - 1]) for v in voxels.intensities]
-            indices = {structure._clean_label(
-                n): i + 1 for i, n in enumerate(list(block_definitions.keys()))}
-            custom_colors = {}
-            for k, v in block_to_colour.items():
-                if k in indices:
-                    if _is_base_block(k):
-                        custom_colors[indices[k]
-                                      ] = f'rgb{base_color.as_tuple()}'
-                    else:
-                        custom_colors[indices[k]] = v
+            voxels = VoxelData(transparent_content)
+            intensities = np.asarray(voxels.intensities, dtype=int) - 1
+            ss = labels[intensities].tolist()
 
             fig.add_mesh3d(x=voxels.vertices[0] - 0.5,
                            y=voxels.vertices[1] - 0.5,
@@ -1813,8 +2175,7 @@ def _get_elite_content(mapelites: MAPElites,
                            i=voxels.triangles[0],
                            j=voxels.triangles[1],
                            k=voxels.triangles[2],
-                           facecolor=[custom_colors[ix]
-                                      for ix in voxels.intensities],
+                           facecolor=voxel_colors[intensities].tolist(),
                            opacity=0.75,
                            flatshading=False,
                            showlegend=False,
@@ -1829,11 +2190,11 @@ def _get_elite_content(mapelites: MAPElites,
                                              fresnel=0.25))
 
         # fig.update_traces()
-        ux, uy, uz = np.unique(x), np.unique(y), np.unique(z)
         ptg = .2
-        show_x = [v for i, v in enumerate(ux) if i % (1 / ptg) == 0]
-        show_y = [v for i, v in enumerate(uy) if i % (1 / ptg) == 0]
-        show_z = [v for i, v in enumerate(uz) if i % (1 / ptg) == 0]
+        tick_step = max(1, round(1 / ptg))
+        show_x = np.unique(x)[::tick_step]
+        show_y = np.unique(y)[::tick_step]
+        show_z = np.unique(z)[::tick_step]
         fig.update_layout(
             scene=dict(
                 xaxis_title='',
@@ -1854,27 +2215,138 @@ def _get_elite_content(mapelites: MAPElites,
             )
         )
     else:
-        fig = go.Figure()
-        fig.add_mesh3d(x=np.zeros(0, dtype=object),
-                       y=np.zeros(0, dtype=object),
-                       z=np.zeros(0, dtype=object))
+        # copying the validated empty plot is cheaper than building it again
+        fig = go.Figure(_get_empty_content())
+        if camera is not None:
+            fig.update_layout(scene_camera=camera)
+        return fig
 
-    camera = camera if camera is not None else dict(up=dict(x=0, y=0, z=1),
-                                                    center=dict(x=0, y=0, z=0),
-                                                    eye=dict(x=2, y=2, z=2))
-    fig.update_layout(scene=dict(aspectmode='data'),
-                      scene_camera=camera,
-                      template='plotly_dark',
-                      #   paper_bgcolor='rgba(0,0,0,0)',
-                      #   plot_bgcolor='rgba(0,0,0,0)',
-                      margin=go.layout.Margin(l=0,
-                                              r=0,
-                                              b=0,
-                                              t=0))
+    _update_content_layout(fig=fig,
+                           camera=camera)
 
     return fig
 
 
+def _build_heatmap(mapelites: MAPElites,
+                   pop_name: str,
+                   metric_name: str,
+                   method_name: str) -> Dict[str, Any]:
+    """Get the heatmap of the spaceships population.
+    The heatmap is only redrawn if the MAP-Elites state, the selected bins, or the displayed properties changed.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+        pop_name (str): The name of the population to display.
+        metric_name (str): The name of the metric to display.
+        method_name (str): The name of the method to use.
+
+    Returns:
+        Dict[str, Any]: The heatmap figure.
+    """
+    population = app_settings.hm_callback_props['pop'][pop_name]
+    key = (mapelites.version, pop_name, metric_name, method_name,
+           tuple(tuple(b) for b in app_settings.selected_bins), app_settings.gen_counter > 0,
+           app_settings.hm_callback_props['metric'][metric_name]['zmax'][population])
+    return heatmap_cache.get_or_compute(key=key,
+                                        f=lambda: _draw_heatmap(mapelites=mapelites,
+                                                                pop_name=pop_name,
+                                                                metric_name=metric_name,
+                                                                method_name=method_name))
+
+
+def _patch_heatmap_selection(mapelites: MAPElites,
+                             pop_name: str,
+                             prev_selected_bins: List[Tuple[int, int]]) -> Patch:
+    """Get the update of the heatmap plot when only the selected bins changed.
+    Only the text of the bins whose selection changed is sent to the client, without redrawing the heatmap.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+        pop_name (str): The name of the population displayed.
+        prev_selected_bins (List[Tuple[int, int]]): The previously selected bins.
+
+    Returns:
+        Patch: The partial update of the current plot.
+    """
+    population = app_settings.hm_callback_props['pop'][pop_name]
+    valid_bins = _get_valid_bins(mapelites=mapelites)
+    patch = Patch()
+    # same text as in `_draw_heatmap`
+    for (i, j) in set(prev_selected_bins).symmetric_difference(app_settings.selected_bins):
+        b = mapelites.bins[j, i]
+        text = ''
+        if b.non_empty(pop='feasible') and b.bin_idx in valid_bins:
+            if (i, j) in app_settings.selected_bins:
+                text = '☑'
+            elif app_settings.gen_counter > 0 and b.new_elite[population]:
+                text = '▣'
+        patch['data'][0]['text'][j][i] = text
+    return patch
+
+
+def _get_elite_content(mapelites: MAPElites,
+                       bin_idx: Optional[Tuple[int, int]],
+                       pop: str,
+                       camera: Optional[Dict[str, Any]] = None,
+                       show_voxel: bool = False) -> Dict[str, Any]:
+    """Get the spaceship preview plot.
+    The plot is only redrawn if the MAP-Elites state or any of the displayed properties changed.
+    It is cached as a plain figure dict, which is several times faster to serialize than a `go.Figure` when returned again.
+
+    Args:
+        mapelites (MAPElites): The MAP-Elites object.
+        bin_idx (Optional[Tuple[int, int]]): The index of the selected bin.
+        pop (str): The name of the population to pick the elite from.
+        camera (Optional[Dict[str, Any]], optional): The current spaceship preview plot camera position. Defaults to None.
+        show_voxel (bool, optional): Whether to show the voxel or the scatter preview. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: The spaceship preview plot.
+    """
+    key = (mapelites.version, tuple(bin_idx) if bin_idx is not None else None, pop, show_voxel,
+           app_settings.symmetry, _to_hex(base_color), json.dumps(camera, sort_keys=True))
+    return content_cache.get_or_compute(key=key,
+                                        f=lambda: orjson.loads(pio.to_json(_draw_elite_content(mapelites=mapelites,
+                                                                                               bin_idx=bin_idx,
+                                                                                               pop=pop,
+                                                                                               camera=camera,
+                                                                                               show_voxel=show_voxel),
+                                                                           validate=False,
+                                                                           engine='orjson')))
+
+
+def _patch_heatmap(curr_heatmap: Dict[str, Any],
+                   new_heatmap: Dict[str, Any]) -> Union[Patch, Dict[str, Any]]:
+    """Get the update of the heatmap plot.
+    If the traces of the current plot match the new ones, only the trace and layout properties that changed are sent to the client.
+
+    Args:
+        curr_heatmap (Dict[str, Any]): The current heatmap plot.
+        new_heatmap (Dict[str, Any]): The new heatmap plot.
+
+    Returns:
+        Union[Patch, Dict[str, Any]]: The partial update of the current plot, or the new plot if the traces differ.
+    """
+    curr_traces = curr_heatmap.get('data', [])
+    if [t.get('type') for t in curr_traces] != [t['type'] for t in new_heatmap['data']]:
+        return new_heatmap
+    # compare against the new plot as the client receives it
+    new_heatmap = json.loads(pio.to_json(new_heatmap, validate=False))
+    patch = Patch()
+
+    def patch_props(patch_node: Patch, curr: Dict[str, Any], new: Dict[str, Any]) -> None:
+        for k in curr.keys() - new.keys():
+            del patch_node[k]
+        for k, v in new.items():
+            if curr.get(k) != v:
+                patch_node[k] = v
+
+    for i, (curr_trace, new_trace) in enumerate(zip(curr_traces, new_heatmap['data'])):
+        patch_props(patch['data'][i], curr_trace, new_trace)
+    patch_props(patch['layout'], curr_heatmap.get('layout', {}), new_heatmap['layout'])
+    return patch
+
+
 def _apply_step(mapelites: MAPElites,
                 selected_bins: List[Tuple[int, int]],
                 gen_counter: int,
@@ -1898,7 +2370,7 @@ def _apply_step(mapelites: MAPElites,
 
     valid = True
     if mapelites.enforce_qnt:
-        valid_bins = [x.bin_idx for x in mapelites._valid_bins()]
+        valid_bins = _get_valid_bins(mapelites=mapelites)
         for bin_idx in selected_bins:
             valid &= bin_idx in valid_bins
     if valid:
@@ -1920,26 +2392,22 @@ def _apply_step(mapelites: MAPElites,
         if only_emitter:
             tmp_emitter = mapelites.emitter
             mapelites.emitter = RandomEmitter()
-        with trange(app_settings.emitter_steps, desc='Emitter steps: ') as iterations:
-            for _ in iterations:
-                # if not only_human:
-                emitter_time += mapelites.emitter_step(gen=gen_counter)
-                app_settings.step_progress += perc_step
+        # progress is reported to the client through `app_settings.step_progress`
+        for _ in range(app_settings.emitter_steps):
+            # if not only_human:
+            emitter_time += mapelites.emitter_step(gen=gen_counter)
+            app_settings.step_progress += perc_step
         if only_emitter:
             mapelites.emitter = tmp_emitter
         logging.getLogger('webapp').info(
             msg=f'Emitter step(s) completed (created {mapelites.n_new_solutions} solutions).')
         mapelites.n_new_solutions = 0
         logging.getLogger('webapp').debug(f'[{__name__}._apply_step] Started updating elites and reassigning content if needed...')
-        # TODO: Parallelise if possible
         mapelites.update_elites()
-        for (_, _), b in np.ndenumerate(mapelites.bins):
-            for pop in ['feasible', 'infeasible']:
-                if b.non_empty(pop=pop):
-                    e = b.get_elite(population=pop)
-                    if e._content is None:
-                        mapelites.lsystem._set_structure(cs=e, make_graph=False)
-                        mapelites._prepare_cs_content(cs=e)
+        elites = [b.get_elite(population=pop) for (_, _), b in np.ndenumerate(mapelites.bins)
+                  for pop in ['feasible', 'infeasible'] if b.non_empty(pop=pop)]
+        elites = [mapelites.lsystem._set_structure(cs=e, make_graph=False) for e in elites if e._content is None]
+        Parallel(n_jobs=-1, prefer="threads")(delayed(mapelites._prepare_cs_content)(e) for e in elites)
         app_settings.step_progress = -1
         return True
     else:
@@ -1957,11 +2425,12 @@ def _update_base_color(color: Vec) -> None:
     global app_settings
     logging.getLogger('webapp').debug(
         f'[{__name__}._update_base_color] {color=}')
-    for (_, _), b in np.ndenumerate(app_settings.current_mapelites.bins):
-        for cs in [*b._feasible, *b._infeasible]:
+    for b in app_settings.current_mapelites.bins.flat:
+        for cs in itertools.chain(b._feasible, b._infeasible):
             cs.base_color = color
             if cs._content is not None:
                 cs.content.set_color(color)
+    app_settings.current_mapelites.mark_changed()
 
 
 def __apply_step(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
@@ -1977,7 +2446,7 @@ def __apply_step(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
 
     cs_properties = kwargs['cs_properties']
     cs_string = kwargs['cs_string']
-    curr_content = kwargs['curr_content']
+    curr_content = dash.no_update
     curr_heatmap = kwargs['curr_heatmap']
     nbs_err_modal_show = kwargs['nbs_err_modal_show']
     curr_camera = kwargs['curr_camera']
@@ -1996,10 +2465,11 @@ def __apply_step(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
             app_settings.gen_counter += 1
             if app_settings.selected_bins:
                 rem_idxs = []
+                valid_bins = _get_valid_bins(mapelites=app_settings.current_mapelites)
                 for i, b in enumerate(app_settings.selected_bins):
                     # remove preview and properties if last selected bin is now invalid
-                    lb = _switch([b])[0]
-                    if lb not in [b.bin_idx for b in app_settings.current_mapelites._valid_bins()]:
+                    lb = _switch_bin(b)
+                    if lb not in valid_bins:
                         rem_idxs.append(i)
                 for i in reversed(rem_idxs):
                     app_settings.selected_bins.pop(i)
@@ -2010,7 +2480,7 @@ def __apply_step(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
                     cs_string = ''
                     cs_properties = get_properties_table()
                 else:
-                    lb = _switch([app_settings.selected_bins[-1]])[0]
+                    lb = _switch_bin(app_settings.selected_bins[-1])
                     if app_settings.current_mapelites.bins[app_settings.selected_bins[-1]].new_elite[app_settings.hm_callback_props['pop'][kwargs['pop_name']]]:
                         curr_content = _get_elite_content(mapelites=app_settings.current_mapelites,
                                                           bin_idx=lb,
@@ -2061,7 +2531,7 @@ def __reset(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     app_settings.gen_counter = 0
     _update_base_color(color=base_color)
     # app_settings.selected_bins = []
-    valid_bins = [b.bin_idx for b in app_settings.current_mapelites._valid_bins()]
+    valid_bins = sorted(_get_valid_bins(mapelites=app_settings.current_mapelites))
     (j, i) = valid_bins[np.random.choice(len(valid_bins))]
     app_settings.selected_bins = [(i, j)]
     curr_content = _get_elite_content(mapelites=app_settings.current_mapelites,
@@ -2070,7 +2540,7 @@ def __reset(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
                                       camera=None,
                                       show_voxel=voxel_display)
     elite = get_elite(mapelites=app_settings.current_mapelites,
-                      bin_idx=_switch([app_settings.selected_bins[-1]])[0],
+                      bin_idx=_switch_bin(app_settings.selected_bins[-1]),
                       pop='feasible' if kwargs['pop_name'] == 'Feasible' else 'infeasible')
     cs_string = elite.string
     cs_properties = get_properties_table(cs=elite)
@@ -2189,6 +2659,20 @@ def __lsystem_modules(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     return {}
 
 
+@functools.lru_cache(maxsize=2)
+def _get_ruleset(ruleset: str) -> StochasticRules:
+    """Get the expansion rules from a ruleset file.
+    Rules are never modified in place, so the same object is returned for the same file.
+
+    Args:
+        ruleset (str): The ruleset file.
+
+    Returns:
+        StochasticRules: The expansion rules.
+    """
+    return RuleMaker(ruleset=ruleset).get_rules()
+
+
 def __update_rules(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """Update the L-system expansion rules and update the application components.
 
@@ -2199,17 +2683,23 @@ def __update_rules(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
 
     rules = kwargs['rules']
 
-    new_rules = StochasticRules()
-    for rule in rules.split('\n'):
-        lhs, p, rhs = rule.strip().split(' ')
-        new_rules.add_rule(lhs=lhs,
-                           rhs=rhs,
-                           p=float(p))
+    if rules.strip() == str(app_settings.current_mapelites.lsystem.hl_solver.parser.rules):
+        logging.getLogger('webapp').info(msg=f'L-system rules unchanged.')
+        return {}
+
     try:
+        parsed = []
+        for rule in rules.split('\n'):
+            match = rule_re.match(rule)
+            assert match is not None, f'Malformed rule: `{rule}`.'
+            lhs, p, rhs = match.groups()
+            parsed.append((lhs, rhs, float(p)))
+        new_rules = StochasticRules.from_iterable(rules=parsed)
         new_rules.validate()
         app_settings.current_mapelites.lsystem.hl_solver.parser.rules = new_rules
+        app_settings.current_mapelites.mark_changed()
         logging.getLogger('webapp').info(msg=f'L-system rules updated.')
-    except AssertionError as e:
+    except (AssertionError, ValueError) as e:
         logging.getLogger('webapp').info(
             msg=f'Failed updating L-system rules ({e}).')
 
@@ -2289,16 +2779,8 @@ def __update_heatmap(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     metric_name = kwargs['metric_name']
     method_name = kwargs['method_name']
 
-    if event_trig == 'population-feasible':
-        pop_name = 'Feasible'
-    elif event_trig == 'population-infeasible':
-        pop_name = 'Infeasible'
-    elif event_trig == 'metric-fitness':
-        metric_name = 'Fitness'
-    elif event_trig == 'metric-age':
-        metric_name = 'Age'
-    elif event_trig == 'metric-coverage':
-        metric_name = 'Coverage'
+    pop_name = trigger_pop_names.get(event_trig, pop_name)
+    metric_name = trigger_metric_names.get(event_trig, metric_name)
     logging.getLogger('webapp').debug(
         msg=f'[{__name__}.__update_heatmap] {pop_name=}; {metric_name=}; {method_name=}')
 
@@ -2321,16 +2803,10 @@ def __apply_symmetry(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
     global app_settings
 
-    event_trig = kwargs['event_trig']
+    symm_axis = kwargs['symm_axis']
 
     logging.getLogger('webapp').info(
         msg=f'Updating all solutions to enforce symmetry...')
-    if event_trig == 'symmetry-none':
-        symm_axis = 'None'
-    elif event_trig == 'symmetry-x':
-        symm_axis = 'X-axis'
-    elif event_trig == 'symmetry-z':
-        symm_axis = 'Z-axis'
     logging.getLogger('webapp').debug(
         msg=f'[{__name__}.__apply_symmetry] {symm_axis=}')
 
@@ -2349,7 +2825,6 @@ def __apply_symmetry(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
         'content-plot.figure': curr_content,
         'heatmap-plot.figure': curr_heatmap,
         'content-string.value': '',
-        'symmetry-dropdown.label': symm_axis,
         'spaceship-properties.children': get_properties_table()
     }
 
@@ -2363,19 +2838,20 @@ def __update_content(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     global app_settings
 
     curr_heatmap = kwargs['curr_heatmap']
-    curr_content = kwargs['curr_content']
+    curr_content = dash.no_update
     cs_string = kwargs['cs_string']
     cs_properties = kwargs['cs_properties']
     voxel_display = kwargs['curr_voxel_display']
 
     i, j = kwargs['clickData']['points'][0]['x'], kwargs['clickData']['points'][0]['y']
     if app_settings.current_mapelites.bins[j, i].non_empty(pop='feasible' if kwargs['pop_name'] == 'Feasible' else 'infeasible'):
-        if (j, i) in [b.bin_idx for b in app_settings.current_mapelites._valid_bins()]:
+        if (j, i) in _get_valid_bins(mapelites=app_settings.current_mapelites):
             curr_content = _get_elite_content(mapelites=app_settings.current_mapelites,
                                               bin_idx=(j, i),
                                               pop='feasible' if kwargs['pop_name'] == 'Feasible' else 'infeasible',
                                               camera=None,
                                               show_voxel=voxel_display)
+            prev_selected_bins = app_settings.selected_bins.copy()
             if not app_settings.current_mapelites.enforce_qnt and app_settings.selected_bins != []:
                 if (i, j) not in app_settings.selected_bins:
                     app_settings.selected_bins.append((i, j))
@@ -2387,15 +2863,13 @@ def __update_content(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
             cs_properties = get_properties_table()
             if len(app_settings.selected_bins) > 0:
                 elite = get_elite(mapelites=app_settings.current_mapelites,
-                                  bin_idx=_switch(
-                                      [app_settings.selected_bins[-1]])[0],
+                                  bin_idx=_switch_bin(app_settings.selected_bins[-1]),
                                   pop='feasible' if kwargs['pop_name'] == 'Feasible' else 'infeasible')
                 cs_string = elite.string
                 cs_properties = get_properties_table(cs=elite)
-                curr_heatmap = _build_heatmap(mapelites=app_settings.current_mapelites,
-                                              pop_name=kwargs['pop_name'],
-                                              metric_name=kwargs['metric_name'],
-                                              method_name=kwargs['method_name'])
+            curr_heatmap = _patch_heatmap_selection(mapelites=app_settings.current_mapelites,
+                                                    pop_name=kwargs['pop_name'],
+                                                    prev_selected_bins=prev_selected_bins)
     else:
         logging.getLogger('webapp').error(
             msg=f'[{__name__}.__update_content] Empty bin selected: {(i, j)=}')
@@ -2416,13 +2890,13 @@ def __toggle_voxelization(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
     global app_settings
 
-    curr_content = kwargs['curr_content']
+    curr_content = dash.no_update
     curr_camera = kwargs['curr_camera']
     voxel_display = kwargs['curr_voxel_display']
     app_settings.voxelised = voxel_display
 
     if app_settings.selected_bins:
-        lb = _switch([app_settings.selected_bins[-1]])[0]
+        lb = _switch_bin(app_settings.selected_bins[-1])
         curr_content = _get_elite_content(mapelites=app_settings.current_mapelites,
                                         bin_idx=lb,
                                         pop='feasible' if kwargs['pop_name'] == 'Feasible' else 'infeasible',
@@ -2444,6 +2918,7 @@ def __selection(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     global app_settings
 
     app_settings.current_mapelites.enforce_qnt = not app_settings.current_mapelites.enforce_qnt
+    app_settings.current_mapelites.mark_changed()
     logging.getLogger('webapp').info(
         msg=f'MAP-Elites single bin selection set to {app_settings.current_mapelites.enforce_qnt}.')
     if app_settings.current_mapelites.enforce_qnt and app_settings.selected_bins:
@@ -2480,51 +2955,20 @@ def __emitter(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
     global app_settings
 
-    emitter_name = {
-        'emitter-human': 'Human',
-        'emitter-random': 'Random',
-        'emitter-greedy': 'Greedy',
-        'emitter-prefmatrix': 'Preference Matrix',
-        'emitter-prefbandit': 'Preference Bandit',
-        'emitter-conbandit': 'Contextual Bandit',
-        'emitter-knn': 'KNN',
-        'emitter-linkernel': 'Linear Kernel',
-        'emitter-rbfkernel': 'RBF Kernel'
-    }[kwargs['event_trig']]
-
-    if emitter_name == 'Random':
-        app_settings.current_mapelites.emitter = RandomEmitter()
-        logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
-    if emitter_name == 'Greedy':
-        app_settings.current_mapelites.emitter = GreedyEmitter()
-        logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
-    elif emitter_name == 'Preference-matrix':
-        app_settings.current_mapelites.emitter = HumanPrefMatrixEmitter()
-        app_settings.current_mapelites.emitter._build_pref_matrix(
-            bins=app_settings.current_mapelites.bins)
-        logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
-    elif emitter_name == 'Contextual Bandit':
-        app_settings.current_mapelites.emitter = ContextualBanditEmitter()
-        logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
-    elif emitter_name == 'Preference Bandit':
-        app_settings.current_mapelites.emitter = PreferenceBanditEmitter()
-        logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
-    elif emitter_name == 'KNN':
-        app_settings.current_mapelites.emitter = KNEmitter()
-        logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
-    elif emitter_name == 'Linear Kernel':
-        app_settings.current_mapelites.emitter = KernelEmitter()
-        logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
-    elif emitter_name == 'Human':
-        app_settings.current_mapelites.emitter = HumanEmitter()
+    emitter_name = kwargs['emitter_name']
+
+    if emitter_name in emitter_factories:
+        mapelites = app_settings.current_mapelites
+        mapelites.emitter = emitter_factories[emitter_name]()
+        if isinstance(mapelites.emitter, HumanPrefMatrixEmitter):
+            mapelites.emitter._build_pref_matrix(bins=mapelites.bins)
+            mapelites.mark_changed()
         logging.getLogger('webapp').info(msg=f'Emitter set to {emitter_name}')
     else:
         logging.getLogger('webapp').error(
             msg=f'[{__name__}.__emitter] Unrecognized {emitter_name=}')
 
-    return {
-        'emitter-dropdown.label': emitter_name
-    }
+    return {}
 
 
 def __population_download(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
@@ -2535,8 +2979,11 @@ def __population_download(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
     global app_settings
 
-    content_dl = dict(content=json.dumps([b.to_json() for b in app_settings.current_mapelites.bins.flatten().tolist()]),
-                      filename=f'population_{app_settings.rngseed}_exp{app_settings.gen_counter}_{app_settings.current_mapelites.emitter.name}.json')
+    # the JSON is highly redundant: a fast compression already shrinks the transfer several times
+    content_dl = dcc.send_bytes(src=gzip.compress(orjson.dumps([b.to_json() for b in app_settings.current_mapelites.bins.flat],
+                                                               option=orjson.OPT_SERIALIZE_NUMPY),
+                                                  compresslevel=1),
+                                filename=f'population_{app_settings.rngseed}_exp{app_settings.gen_counter}_{app_settings.current_mapelites.emitter.name}.json.gz')
     logging.getLogger('webapp').info(
         f'The population will be downloaded shortly.')
     return {
@@ -2573,59 +3020,32 @@ def __population_upload(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def __close_error(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
-    """Close the error modal and update the application components.
-
-    Returns:
-        Dict[str, Any]: The updated application components.
-    """
-    return {'nbs-err-modal.is_open': False}
-
-
 def __color(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """Update the spaceships base blocks color and update the application components.
+    The spaceship preview is recolored clientside.
 
     Returns:
         Dict[str, Any]: The updated application components.
     """
-    global app_settings
     global base_color
 
     color = kwargs['color']
-    curr_content = kwargs['curr_content']
-    curr_camera = kwargs['curr_camera']
-    voxel_display = kwargs['curr_voxel_display']
 
-    r, g, b = tuple(int(color.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
+    v = int(color.lstrip('#'), 16)
+    r, g, b = (v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff
     new_color = Vec.v3f(r, g, b).scale(1 / 256)
+    # repeated clicks with the same color have nothing to update
+    if new_color == base_color:
+        return {}
     base_color = new_color
     logging.getLogger('webapp').debug(
         msg=f'[{__name__}.__color] {base_color=}')
     _update_base_color(color=base_color)
-    if app_settings.selected_bins:
-        curr_content = _get_elite_content(mapelites=app_settings.current_mapelites,
-                                          bin_idx=_switch(
-                                              [app_settings.selected_bins[-1]])[0],
-                                          pop='feasible' if kwargs['pop_name'] == 'Feasible' else 'infeasible',
-                                          camera=curr_camera.get(
-                                              'scene.camera', None),
-                                          show_voxel=voxel_display)
     return {
-        'content-plot.figure': curr_content,
         'content-legend-div.children': get_content_legend()
     }
 
 
-def __show_quickstart_modal(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
-    """Show the quickstart modal and update the application components.
-    Returns:
-        Dict[str, Any]: The updated application components.
-    """
-    return {
-        'quickstart-usermode-modal.is_open': True
-    }
-
-
 def __default(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """Fallback callback execution method.
 
@@ -2634,35 +3054,26 @@ def __default(**kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """
     global app_settings
 
+    # the layout already shows the current heatmap, selection and an empty preview
+    if not app_settings.selected_bins:
+        raise PreventUpdate
     return {
-        'heatmap-plot.figure': _build_heatmap(mapelites=app_settings.current_mapelites,
-                                              pop_name=kwargs['pop_name'],
-                                              metric_name=kwargs['metric_name'],
-                                              method_name=kwargs['method_name']),
         'content-plot.figure': _get_elite_content(mapelites=app_settings.current_mapelites,
-                                                  bin_idx=_switch([app_settings.selected_bins[-1]])[0] if app_settings.selected_bins else None,
+                                                  bin_idx=_switch_bin(app_settings.selected_bins[-1]),
                                                   pop='feasible' if kwargs['pop_name'] == 'Feasible' else 'infeasible')
     }
 
 
-def __show_toggle_unsafe_mode_modal(**kwargs) -> Dict[str, Any]:
-    curr_unsafemode = kwargs['curr_unsafemode']
-    
-    return {
-        'sm-modal.is_open': True,
-        'unsaferules-mode-toggle.value': not curr_unsafemode
-    }
-
-
 def __toggle_unsafe_mode(**kwargs) -> Dict[str, Any]:
-    curr_unsafemode = kwargs['curr_unsafemode']
+    curr_unsafemode = app_settings.safe_mode
     logging.getLogger('webapp').info(msg=f'Toggling safe mode to {not curr_unsafemode}')
     logging.getLogger('webapp').debug(msg=f'[{__name__}.__toggle_unsafe_mode] Current safe mode is {curr_unsafemode}')
     ruleset = os.path.join(curr_folder, 'hlrules') if curr_unsafemode else os.path.join(curr_folder, 'hlrules_sm')
     logging.getLogger('webapp').debug(msg=f'[{__name__}.__toggle_unsafe_mode] New HL ruleset is {ruleset}')
     try:
-        new_rules = RuleMaker(ruleset=ruleset).get_rules()
+        new_rules = _get_ruleset(ruleset=ruleset)
         app_settings.current_mapelites.lsystem.hl_solver.parser.rules = new_rules
+        app_settings.current_mapelites.mark_changed()
         logging.getLogger('webapp').info(msg=f'L-system rules updated.')
     except AssertionError as e:
         logging.getLogger('webapp').warn(msg=f'Failed updating L-system rules ({e}).')
@@ -2676,7 +3087,6 @@ def __toggle_unsafe_mode(**kwargs) -> Dict[str, Any]:
     
     return {
         'sm-modal.is_open': False,
-        'unsaferules-mode-toggle.value': not curr_unsafemode,
         'sm-modal-title.children': dbc.ModalTitle("Turn on safe mode?") if curr_unsafemode else dbc.ModalTitle("Turn off safe mode?"),
         'sm-modal-body.children': toggle_safe_rules_on_msg if curr_unsafemode else toggle_safe_rules_off_msg,
         'hl-rules.value': str(app_settings.current_mapelites.lsystem.hl_solver.parser.rules),
@@ -2713,34 +3123,40 @@ triggers_map = {
     'metric-age': __update_heatmap,
     'metric-coverage': __update_heatmap,
     'method-radio': __update_heatmap,
-    'symmetry-none': __apply_symmetry,
-    'symmetry-x': __apply_symmetry,
-    'symmetry-z': __apply_symmetry,
+    'symmetry-dropdown': __apply_symmetry,
     'heatmap-plot': __update_content,
     'population_dropdown': __update_content,
     'selection-btn': __selection,
     'selection-clr-btn': __clear_selection,
-    'emitter-human': __emitter,
-    'emitter-random': __emitter,
-    'emitter-greedy': __emitter,
-    'emitter-prefmatrix': __emitter,
-    'emitter-prefbandit': __emitter,
-    'emitter-conbandit': __emitter,
-    'emitter-knn': __emitter,
-    'emitter-linkernel': __emitter,
-    'emitter-rbfkernel': __emitter,
+    'emitter-dropdown': __emitter,
     'popdownload-btn': __population_download,
     'popupload-data': __population_upload,
-    'nbs-err-btn': __close_error,
     'color-picker-btn': __color,
     'fitness-sldr': __fitness_weights,
-    'webapp-quickstart-btn': __show_quickstart_modal,
     'voxel-preview-toggle': __toggle_voxelization,
-    'unsaferules-mode-toggle': __show_toggle_unsafe_mode_modal,
     'tsrm-y-btn': __toggle_unsafe_mode,
     'dims-btn': __apply_dimensions_filtering,
     None: __default
 }
+# triggers that only change settings: the selected bins and the spaceship preview are left as they are
+selection_preserving_triggers: FrozenSet[str] = frozenset(['update-rules-btn', 'emitter-dropdown', 'popdownload-btn',
+                                                           'color-picker-btn', 'fitness-sldr'])
+
+
+@functools.lru_cache(maxsize=64)
+def _get_pattern_trigger(prop_id: str) -> str:
+    """Get the type of a pattern-matching component from its ID.
+
+    Args:
+        prop_id (str): The JSON ID of the component.
+
+    Raises:
+        ValueError: Raised if the ID is not valid JSON.
+
+    Returns:
+        str: The component type.
+    """
+    return json.loads(prop_id)['type']
 
 
 @app.callback(Output('heatmap-plot', 'figure'),
@@ -2756,15 +3172,11 @@ triggers_map = {
               Output('metric-dropdown', 'label'),
               Output('b0-dropdown', 'label'),
               Output('b1-dropdown', 'label'),
-              Output('symmetry-dropdown', 'label'),
-              Output("quickstart-usermode-modal", "is_open"),
               Output("nbs-err-modal", "is_open"),
               Output("rand-step-btn-div", "style"),
               Output("reset-btn-div", "style"),
               Output('content-legend-div', 'children'),
-              Output('emitter-dropdown', 'label'),
               Output('sm-modal', 'is_open'),
-              Output("unsaferules-mode-toggle", "value"),
               Output('unsafemode-div', 'style'),
               Output('sm-modal-title', 'children'),
               Output('sm-modal-body', 'children'),
@@ -2774,16 +3186,13 @@ triggers_map = {
 
               State('heatmap-plot', 'figure'),
               State('hl-rules', 'value'),
-              State('content-plot', 'figure'),
+              State('content-plot-empty', 'data'),
               State('content-string', 'value'),
               State('spaceship-properties', 'children'),
               State('population-dropdown', 'label'),
               State('metric-dropdown', 'label'),
               State('b0-dropdown', 'label'),
               State('b1-dropdown', 'label'),
-              State('symmetry-dropdown', 'label'),
-              State('emitter-dropdown', 'label'),
-              State("quickstart-usermode-modal", "is_open"),
               State("nbs-err-modal", "is_open"),
               State("rand-step-btn-div", "style"),
               State("reset-btn-div", "style"),
@@ -2791,7 +3200,6 @@ triggers_map = {
               State('color-picker', 'value'),
               State("content-plot", "relayoutData"),
               State("voxel-preview-toggle", "value"),
-              State("unsaferules-mode-toggle", "value"),
               State('unsafemode-div', 'style'),
               State('sm-modal-title', 'children'),
               State('sm-modal-body', 'children'),
@@ -2827,40 +3235,24 @@ triggers_map = {
               Input('heatmap-plot', 'clickData'),
               Input('selection-btn', 'n_clicks'),
               Input('selection-clr-btn', 'n_clicks'),
-              Input('emitter-human', 'n_clicks'),
-              Input('emitter-random', 'n_clicks'),
-              Input('emitter-greedy', 'n_clicks'),
-              Input('emitter-prefmatrix', 'n_clicks'),
-              Input('emitter-prefbandit', 'n_clicks'),
-              Input('emitter-conbandit', 'n_clicks'),
-              Input('emitter-knn', 'n_clicks'),
-              Input('emitter-linkernel', 'n_clicks'),
-              Input('emitter-rbfkernel', 'n_clicks'),
+              Input('emitter-dropdown', 'value'),
               Input('popdownload-btn', 'n_clicks'),
               Input('popupload-data', 'filename'),
-              Input('symmetry-none', 'n_clicks'),
-              Input('symmetry-x', 'n_clicks'),
-              Input('symmetry-z', 'n_clicks'),
-              Input("nbs-err-btn", "n_clicks"),
+              Input('symmetry-dropdown', 'value'),
               Input('color-picker-btn', 'n_clicks'),
-              Input('webapp-quickstart-btn', 'n_clicks'),
               Input("voxel-preview-toggle", "value"),
-              Input("unsaferules-mode-toggle", "value"),
               Input("tsrm-y-btn", "n_clicks"),
               Input('dims-btn', 'n_clicks'),
               )
 def general_callback(curr_heatmap: Dict[str, Any],
                      rules: str,
-                     curr_content: Dict[str, Any],
+                     content_is_empty: bool,
                      cs_string: str,
                      cs_properties: List[Any],
                      pop_name: str,
                      metric_name: str,
                      b0: str,
                      b1: str,
-                     symm_axis: str,
-                     emitter_name: str,
-                     qs_um_modal_show: bool,
                      nbs_err_modal_show: bool,
                      rand_step_btn_style: Dict[str, str],
                      reset_btn_style: Dict[str, str],
@@ -2868,7 +3260,6 @@ def general_callback(curr_heatmap: Dict[str, Any],
                      color: str,
                      curr_camera: Dict[str, str],
                      curr_voxel_display: bool,
-                     curr_unsafemode: bool,
                      curr_unsafemode_div_style: Dict[str, str],
                      curr_unsafemode_title: str,
                      curr_unsafemode_body: str,
@@ -2904,25 +3295,12 @@ def general_callback(curr_heatmap: Dict[str, Any],
                      clickData: Dict[str, Any],
                      selection_btn: int,
                      clear_btn: int,
-                     emitter1_nclicks: int,
-                     emitter2_nclicks: int,
-                     emitter3_nclicks: int,
-                     emitter4_nclicks: int,
-                     emitter5_nclicks: int,
-                     emitter6_nclicks: int,
-                     emitter7_nclicks: int,
-                     emitter8_nclicks: int,
-                     emitter9_nclicks: int,
+                     emitter_name: str,
                      n_clicks_popdownload: int,
                      upload_filename: str,
-                     symm_none: int,
-                     symm_x: int,
-                     symm_z: int,
-                     nbs_btn: int,
+                     symm_axis: str,
                      color_btn: int,
-                     qs_btn: int,
                      switch_voxel_display: bool,
-                     switch_unsafemode: bool,
                      confirm_unsafemode_switch: int,
                      filter_dimensions: int,
                      prevent_initial_call=False) -> Tuple[Any, ...]:
@@ -2931,17 +3309,14 @@ def general_callback(curr_heatmap: Dict[str, Any],
     Args:
         curr_heatmap (Dict[str, Any]): The current spaceships population heatmap.
         rules (str): The current L-system rules.
-        curr_content (Dict[str, Any]): The current spaceship preview plot.
+        content_is_empty (bool): Whether the spaceship preview plot is empty.
         cs_string (str): The current spaceship string.
         cs_properties (List[Any]): The current spaceship properties.
         pop_name (str): The current population name to display.
         metric_name (str): The current metric name to display.
         b0 (str): The current first behavior characteristic (X axis).
         b1 (str): The current second behavior characteristic (Y axis).
-        symm_axis (str): The current symmetry axis.
-        emitter_name (str): The current emitter name.
         qs_modal_show (bool): Whether the "Quickstart" modal is currently displayed.
-        qs_um_modal_show (bool): Whether the "Quickstart" modal (for the user mode) is currently displayed.
         cm_modal_show (bool): Whether the "Privacy Policy" modal is currently displayed.
         nbs_err_modal_show (bool): Whether the "Warning" modal is currently displayed.
         rand_step_btn_style (Dict[str, str]): The CSS style of the "Evolve from Random Spaceship" button.
@@ -2974,28 +3349,15 @@ def general_callback(curr_heatmap: Dict[str, Any],
         clickData (Dict[str, Any]): The heatmap click data.
         selection_btn (int): The number of button clicks.
         clear_btn (int): The number of button clicks.
-        emitter1_nclicks (int): The number of button clicks.
-        emitter2_nclicks (int): The number of button clicks.
-        emitter3_nclicks (int): The number of button clicks.
-        emitter4_nclicks (int): The number of button clicks.
-        emitter5_nclicks (int): The number of button clicks.
-        emitter6_nclicks (int): The number of button clicks.
-        emitter7_nclicks (int): The number of button clicks.
-        emitter8_nclicks (int): The number of button clicks.
-        emitter9_nclicks (int): The number of button clicks.
+        emitter_name (str): The selected emitter name.
         n_clicks_cs_download (int): The number of button clicks.
         n_clicks_popdownload (int): The number of button clicks.
         upload_filename (str): The filename.
-        symm_none (int): The number of button clicks.
-        symm_x (int): The number of button clicks.
-        symm_y (int): The number of button clicks.
-        symm_z (int): The number of button clicks.
+        symm_axis (str): The selected symmetry axis.
         symm_orientation (str): The new value.
         nclicks_yes (int): The number of button clicks.
         nclicks_no (int): The number of button clicks.
-        nbs_btn (int): The number of button clicks.
         color_btn (int): The number of button clicks.
-        qs_btn (int): The number of button clicks.
         switch_voxel_display (bool): The new value.
 
     Returns:
@@ -3017,73 +3379,102 @@ def general_callback(curr_heatmap: Dict[str, Any],
     
     if event_trig not in triggers_map:
         try:
-            import ast
-            event_trig = ast.literal_eval(event_trig)
-            event_trig = event_trig['type']
+            event_trig = _get_pattern_trigger(prop_id=event_trig)
         except ValueError:
             logging.getLogger('webapp').error(
                 msg=f'[{__name__}.general_callback] Unrecognized {event_trig=}. No operations have been applied!')
     
     vars = locals()    
     
+    # handlers only return the components they changed, all others are left untouched
     output = {
-        'heatmap-plot.figure': curr_heatmap,
-        'content-plot.figure': curr_content,
-        'hl-rules.value': rules,
-        'selected-bin.children': '',
-        'content-string.value': cs_string,
-        'spaceship-properties.children': cs_properties,
-        'step-spinner.children': '',
-        'download-population.data': None,
-        'download-metrics.data': None,
-        'population-dropdown.label': pop_name,
-        'metric-dropdown.label': metric_name,
-        'b0-dropdown.label': b0,
-        'b1-dropdown.label': b1,
-        'symmetry-dropdown.label': symm_axis,
-        'quickstart-usermode-modal.is_open': qs_um_modal_show,
-        'nbs-err-modal.is_open': nbs_err_modal_show,
-        'rand-step-btn-div.style': rand_step_btn_style,
-        'reset-btn-div.style': reset_btn_style,
-        'content-legend-div.children': curr_legend,
-        'emitter-dropdown.label': emitter_name,
-        'sm-modal.is_open': False,
-        'unsaferules-mode-toggle.value': curr_unsafemode,
-        'unsafemode-div.style': curr_unsafemode_div_style,
-        'sm-modal-title.children': curr_unsafemode_title,
-        'sm-modal-body.children': curr_unsafemode_body,
-        'emitter-steps-div.style': curr_emittersteps_style,
+        'heatmap-plot.figure': dash.no_update,
+        'content-plot.figure': dash.no_update,
+        'hl-rules.value': dash.no_update,
+        'selected-bin.children': dash.no_update,
+        'content-string.value': dash.no_update,
+        'spaceship-properties.children': dash.no_update,
+        'step-spinner.children': dash.no_update,
+        'download-population.data': dash.no_update,
+        'download-metrics.data': dash.no_update,
+        'population-dropdown.label': dash.no_update,
+        'metric-dropdown.label': dash.no_update,
+        'b0-dropdown.label': dash.no_update,
+        'b1-dropdown.label': dash.no_update,
+        'nbs-err-modal.is_open': dash.no_update,
+        'rand-step-btn-div.style': dash.no_update,
+        'reset-btn-div.style': dash.no_update,
+        'content-legend-div.children': dash.no_update,
+        'sm-modal.is_open': dash.no_update,
+        'unsafemode-div.style': dash.no_update,
+        'sm-modal-title.children': dash.no_update,
+        'sm-modal-body.children': dash.no_update,
+        'emitter-steps-div.style': dash.no_update,
         'symmetry-div.style': dash.no_update,
         'experiment-settings-div.style': dash.no_update
     }
 
-    logging.getLogger('webapp').debug(
-        f'[{__name__}.general_callback] {event_trig=}; {app_settings.gen_counter=}; {app_settings.selected_bins=}; {app_settings.current_mapelites.emitter=}; {process_semaphore.is_locked=}')
+    # runs on every event: only formatted if debug logging is enabled
+    logging.getLogger('webapp').debug('[%s.general_callback] event_trig=%r; app_settings.gen_counter=%r; app_settings.selected_bins=%r; app_settings.current_mapelites.emitter=%r; process_semaphore.is_locked=%r',
+                                      __name__, event_trig, app_settings.gen_counter, app_settings.selected_bins, app_settings.current_mapelites.emitter, process_semaphore.is_locked)
 
-    if not process_semaphore.is_locked:
-        process_semaphore.lock(name=event_trig)
-
-        u = triggers_map[event_trig](**vars)
-        for k in u.keys():
-            output[k] = u[k]
+    if process_semaphore.lock(name=event_trig):
+        try:
+            u = triggers_map[event_trig](**vars)
+            for k in u.keys():
+                output[k] = u[k]
+
+            if event_trig in selection_preserving_triggers:
+                return _finalize_output(output=output,
+                                        curr_heatmap=curr_heatmap,
+                                        cs_string=cs_string)
+
+            app_settings.selected_bins, selected_bins_str = _format_bins(mapelites=app_settings.current_mapelites,
+                                                                         bins_idx_list=app_settings.selected_bins,
+                                                                         do_switch=True,
+                                                                         str_prefix='Selected bin(s):',
+                                                                         filter_out_empty=True)
+
+            output['selected-bin.children'] = selected_bins_str
+
+            if app_settings.selected_bins and content_is_empty:
+                output['content-plot.figure'] = _get_elite_content(mapelites=app_settings.current_mapelites,
+                                                                   bin_idx=_switch_bin(app_settings.selected_bins[-1]),
+                                                                   pop='feasible',
+                                                                   camera=curr_camera.get(
+                                                                       'scene.camera', None),
+                                                                   show_voxel=curr_voxel_display)
+        finally:
+            # always release, or a failing step would leave the UI disabled
+            process_semaphore.unlock()
+    else:
+        logging.getLogger('webapp').info(msg=f'Another operation is running: {event_trig} was ignored.')
 
-        app_settings.selected_bins, selected_bins_str = _format_bins(mapelites=app_settings.current_mapelites,
-                                                                     bins_idx_list=app_settings.selected_bins,
-                                                                     do_switch=True,
-                                                                     str_prefix='Selected bin(s):',
-                                                                     filter_out_empty=True)
+    return _finalize_output(output=output,
+                            curr_heatmap=curr_heatmap,
+                            cs_string=cs_string)
 
-        output['selected-bin.children'] = selected_bins_str
 
-        if app_settings.selected_bins and len(curr_content['data']) == 0:
-            output['content-plot.figure'] = _get_elite_content(mapelites=app_settings.current_mapelites,
-                                                               bin_idx=_switch(
-                                                                   [app_settings.selected_bins[-1]])[0],
-                                                               pop='feasible',
-                                                               camera=curr_camera.get(
-                                                                   'scene.camera', None),
-                                                               show_voxel=curr_voxel_display)
+def _finalize_output(output: Dict[str, Any],
+                     curr_heatmap: Dict[str, Any],
+                     cs_string: str) -> Tuple[Any, ...]:
+    """Drop the unchanged components from the output of the general callback.
 
-        process_semaphore.unlock()
+    Args:
+        output (Dict[str, Any]): The updated application components.
+        curr_heatmap (Dict[str, Any]): The current heatmap plot.
+        cs_string (str): The current spaceship string.
 
+    Returns:
+        Tuple[Any, ...]: The values of the updated application components.
+    """
+    # the spaceship string can be long: only send it back if it changed
+    if output['content-string.value'] == cs_string:
+        output['content-string.value'] = dash.no_update
+    # the heatmap is large: only send it back if it was replaced (handlers never modify it in place)
+    if output['heatmap-plot.figure'] is curr_heatmap:
+        output['heatmap-plot.figure'] = dash.no_update
+    elif curr_heatmap and output['heatmap-plot.figure'] is not dash.no_update and not isinstance(output['heatmap-plot.figure'], Patch):
+        output['heatmap-plot.figure'] = _patch_heatmap(curr_heatmap=curr_heatmap,
+                                                       new_heatmap=output['heatmap-plot.figure'])
     return tuple(output.values())
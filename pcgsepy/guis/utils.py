@@ -1,6 +1,9 @@
+from collections import deque
 from datetime import datetime
 from enum import Enum
+import itertools
 import logging
+import threading
 import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -13,6 +16,8 @@ from pcgsepy.mapelites.map import MAPElites
 
 
 class Semaphore:
+    __slots__ = ['_lock', '_running']
+
     def __init__(self,
                  locked: bool = False) -> None:
         """Create a `Semamphore` object.
@@ -20,7 +25,9 @@ class Semaphore:
         Args:
             locked (bool, optional): Initial locked value. Defaults to False.
         """
-        self._is_locked = locked
+        self._lock = threading.Lock()
+        if locked:
+            self._lock.acquire()
         self._running = ''
     
     @property
@@ -30,30 +37,42 @@ class Semaphore:
         Returns:
             bool: The locked value.
         """
-        return self._is_locked
+        return self._lock.locked()
     
     def lock(self,
-             name: Optional[str] = '') -> None:
-        """Lock the semaphore.
+             name: Optional[str] = '') -> bool:
+        """Lock the semaphore, unless it is already locked.
+        Checking and locking is atomic, so only one of concurrent requests can lock it.
 
         Args:
             name (Optional[str], optional): The locking process name. Defaults to ''.
+
+        Returns:
+            bool: Whether the semaphore was locked by this call.
         """
-        self._is_locked = True
+        if not self._lock.acquire(blocking=False):
+            return False
         self._running = name
+        return True
     
     def unlock(self) -> None:
         """Unlock the semaphore"""
-        self._is_locked = False
         self._running = ''
+        if self._lock.locked():
+            self._lock.release()
 
 
 class DashLoggerHandler(logging.StreamHandler):
-    def __init__(self):
+    def __init__(self,
+                 maxlen: int = 1000):
         """Create a new logging handler.
+
+        Args:
+            maxlen (int, optional): The maximum number of log lines kept. Defaults to 1000.
         """
         logging.StreamHandler.__init__(self)
-        self.queue = []
+        self.queue = deque(maxlen=maxlen)
+        self.n_records = 0
 
     def emit(self,
              record: Any) -> None:
@@ -65,6 +84,24 @@ class DashLoggerHandler(logging.StreamHandler):
         t = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         msg = self.format(record)
         self.queue.append(f'[{t}]\t{msg}')
+        self.n_records += 1
+
+    def get_since(self,
+                  n: int) -> Tuple[int, List[str]]:
+        """Get the log lines recorded after the first `n` ones.
+
+        Args:
+            n (int): The number of log lines already read.
+
+        Returns:
+            Tuple[int, List[str]]: The number of log lines recorded so far, and the new (still available) log lines.
+        """
+        self.acquire()
+        try:
+            n_new = min(self.n_records - n, len(self.queue))
+            return self.n_records, list(itertools.islice(self.queue, len(self.queue) - n_new, None))
+        finally:
+            self.release()
 
 
 class AppMode(Enum):
@@ -74,6 +111,10 @@ class AppMode(Enum):
 
 
 class AppSettings:
+    __slots__ = ['current_mapelites', 'gen_counter', 'hm_callback_props', 'behavior_descriptors', 'rngseed',
+                 'selected_bins', 'step_progress', 'use_custom_colors', 'app_mode', 'emitter_steps', 'symmetry',
+                 'safe_mode', 'voxelised']
+
     def __init__(self) -> None:
         """Generate a new `AppSettings` object."""
         self.current_mapelites: Optional[MAPElites] = None
@@ -7,91 +7,44 @@ class VoxelData():
 
     def __init__(self, data):
         self.data = data
-        self.intensities = []
-        self.triangles = np.zeros((np.size(np.shape(self.data)), 1))
         self.xyz = self.get_coords()
         self.x_length = np.size(data, 0)
         self.y_length = np.size(data, 1)
         self.z_length = np.size(data, 2)
-        self.vert_count = 0
-        self.vertices = self.make_edge_verts()
-        self.triangles = np.delete(self.triangles, 0, 1)
+        self.vertices, self.triangles, self.intensities = self.make_edge_verts()
+        self.vert_count = np.size(self.vertices, 1)
 
     def get_coords(self):
         indices = np.nonzero(self.data)
         indices = np.stack((indices[0], indices[1], indices[2]))
         return indices
 
-    def has_voxel(self, neighbor_coord):
-        return self.data[neighbor_coord[0], neighbor_coord[1], neighbor_coord[2]]
-
-    def get_neighbor(self, voxel_coords, direction):
-        x = voxel_coords[0]
-        y = voxel_coords[1]
-        z = voxel_coords[2]
-        offset_to_check = CubeData.offsets[direction]
-        neighbor_coord = [x + offset_to_check[0], y +
-                          offset_to_check[1], z+offset_to_check[2]]
-
-        # return 0 if neighbor out of bounds or nonexistent
-        if (any(np.less(neighbor_coord, 0)) | (neighbor_coord[0] >= self.x_length) | (neighbor_coord[1] >= self.y_length) | (neighbor_coord[2] >= self.z_length)):
-            return 0
-        else:
-            return self.has_voxel(neighbor_coord)
-
-    def make_face(self, voxel, direction):
-        voxel_coords = self.xyz[:, voxel]
-        explicit_dir = CubeData.direction[direction]
-        vert_order = CubeData.face_triangles[explicit_dir]
-
-        next_i = [self.vert_count, self.vert_count]
-        next_j = [self.vert_count+1, self.vert_count+2]
-        next_k = [self.vert_count+2, self.vert_count+3]
-
-        next_tri = np.vstack((next_i, next_j, next_k))
-        self.triangles = np.hstack((self.triangles, next_tri))
-
-        face_verts = np.zeros((len(voxel_coords), len(vert_order)))
-        for i in range(len(vert_order)):
-            face_verts[:, i] = voxel_coords + \
-                CubeData.cube_verts[vert_order[i]]
-
-        self.vert_count = self.vert_count+4
-
-        return face_verts
-
-    def make_cube_verts(self, voxel):
-        voxel_coords = self.xyz[:, voxel]
-        cube = np.zeros((len(voxel_coords), 1))
-
-        # only make a new face if there's no neighbor in that direction
-        dirs_no_neighbor = []
-        for direction in range(len(CubeData.direction)):
-            if np.any(self.get_neighbor(voxel_coords, direction)):
-                continue
-            else:
-                dirs_no_neighbor = np.append(dirs_no_neighbor, direction)
-                face = self.make_face(voxel, direction)
-                cube = np.append(cube, face, axis=1)
-
-            m, n, p = voxel_coords
-            self.intensities.extend([self.data[m, n, p]] * 2)
-
-        # remove cube initialization
-        cube = np.delete(cube, 0, 1)
-
-        return cube
-
     def make_edge_verts(self):
-        # make only outer vertices
-        edge_verts = np.zeros((np.size(self.xyz, 0), 1))
-        num_voxels = np.size(self.xyz, 1)
-        for voxel in range(num_voxels):
-            # passing voxel num rather than
-            cube = self.make_cube_verts(voxel)
-            edge_verts = np.append(edge_verts, cube, axis=1)
-        edge_verts = np.delete(edge_verts, 0, 1)
-        return edge_verts
+        # make only outer faces, i.e. faces with no neighbor in their direction
+        # all voxels are processed at once; faces are ordered by voxel, then by direction
+        padded = np.pad(self.data, 1)
+        voxel_ids, directions = [], []
+        for direction, offset in enumerate(CubeData.offsets):
+            nx, ny, nz = self.xyz + 1 + np.asarray(offset)[:, np.newaxis]
+            exposed = np.flatnonzero(padded[nx, ny, nz] == 0)
+            voxel_ids.append(exposed)
+            directions.append(np.full_like(exposed, direction))
+        voxel_ids, directions = np.concatenate(voxel_ids), np.concatenate(directions)
+        order = np.lexsort((directions, voxel_ids))
+        voxel_ids, directions = voxel_ids[order], directions[order]
+
+        # 4 vertices per face
+        face_verts = CubeData.cube_verts_arr[CubeData.face_verts_arr[directions]]
+        edge_verts = (self.xyz[:, voxel_ids].T[:, np.newaxis, :] + face_verts).reshape(-1, 3).T.astype(float)
+        # 2 triangles per face
+        first = 4 * np.arange(len(voxel_ids))
+        triangles = np.vstack((np.repeat(first, 2),
+                               np.stack((first + 1, first + 2), axis=1).ravel(),
+                               np.stack((first + 2, first + 3), axis=1).ravel())).astype(float)
+        m, n, p = self.xyz[:, voxel_ids]
+        intensities = np.repeat(self.data[m, n, p], 2).tolist()
+
+        return edge_verts, triangles, intensities
 
 
 class CubeData:
@@ -141,3 +94,6 @@ class CubeData:
         [0, 0, 1],
         [0, 0, -1],
     ]
+
+    cube_verts_arr = np.asarray(cube_verts)
+    face_verts_arr = np.asarray(list(map(face_triangles.get, direction)))
@@ -1,6 +1,6 @@
 import logging
 from scipy.spatial import ConvexHull, Delaunay
-from scipy.ndimage import grey_erosion, binary_erosion, binary_dilation
+from scipy.ndimage import grey_erosion, binary_erosion, binary_dilation, label
 import numpy as np
 import numpy.typing as npt
 from pcgsepy.common.str_utils import get_matching_brackets
@@ -260,7 +260,6 @@ class HullBuilder:
             npt.NDArray[np.float32]: The modified hull array.
         """
         structure_arr = structure.as_grid_array
-        structure_shape = Vec.from_tuple(structure_arr.shape)
         # mask of all blocks
         mask = np.zeros_like(structure_arr, dtype=np.uint8)
         mask[np.nonzero(hull)] = BlockValue.BASE_BLOCK
@@ -269,21 +268,12 @@ class HullBuilder:
         pivot_position = [x for x in structure._blocks.values() if x.block_type == pivot_blocktype][0].position
         pivot_idx = pivot_position.scale(1 / structure.grid_size).to_veci().as_tuple()
         # get the region to keep defined by blocks connected to pivot position
-        connected_blocks = set()
-        to_check = [pivot_idx]
-        while to_check:
-            to_add = set()
-            for block_position in to_check:
-                if mask[block_position] == BlockValue.BASE_BLOCK:
-                    connected_blocks.add(block_position)
-                    for direction in _orientations:
-                        dpos = Vec.from_tuple(block_position).sum(direction.value)
-                        if 0 <= dpos.x < structure_shape.x and 0 <= dpos.y < structure_shape.y and 0 <= dpos.z < structure_shape.z:
-                            to_add.add(dpos.as_tuple())
-            to_add = to_add.difference(to_add.intersection(connected_blocks))
-            to_check = list(to_add)
-        # disconnected blocks are the difference between all blocks and blocks connected to pivot block
-        disconnected_blocks = set(self._blocks_set.keys()) - connected_blocks
+        # (default structuring element: face-connected blocks only, same as `_orientations`)
+        regions, _ = label(mask)
+        pivot_region = regions[pivot_idx]
+        connected = regions == pivot_region if pivot_region != 0 else np.zeros_like(mask, dtype=bool)
+        # disconnected blocks are all blocks not connected to pivot block
+        disconnected_blocks = [idx for idx in self._blocks_set.keys() if not connected[idx]]
         # remove disconnected blocks
         for block_idx in disconnected_blocks:
             hull[block_idx] = BlockValue.AIR_BLOCK
@@ -662,13 +652,12 @@ class HullBuilder:
         logging.getLogger('hullbuilder').debug(f'[{__name__}.add_external_hull] Applied erosion.')
                 
         # add blocks to self._blocks_set
-        for (i, j, k), _ in np.ndenumerate(hull):
-            if hull[i, j, k] != BlockValue.AIR_BLOCK:
-                self._add_block(block_type=self.base_block,
-                                idx=(i, j, k),
-                                pos=Vec.v3i(i, j, k).scale(v=structure.grid_size),
-                                orientation_forward=Orientation.FORWARD,
-                                orientation_up=Orientation.UP)
+        for i, j, k in np.argwhere(hull != BlockValue.AIR_BLOCK).tolist():
+            self._add_block(block_type=self.base_block,
+                            idx=(i, j, k),
+                            pos=Vec.v3i(i, j, k).scale(v=structure.grid_size),
+                            orientation_forward=Orientation.FORWARD,
+                            orientation_up=Orientation.UP)
         
         # remove all blocks that obstruct target block type
         hull = self._remove_obstructing_blocks(hull=hull,
@@ -753,7 +742,7 @@ def enforce_symmetry(string: str,
             return rot.replace('c', '', 1)
     
     brackets = get_matching_brackets(string=string)
-    symm_points, to_remove = [], []
+    symm_points, to_remove, removed = [], [], set()
     logging.getLogger('hullbuilder').debug(f'[{__name__}.enforce_symmetry] {string=}; {brackets=}')
     
     if axis == 'x':
@@ -765,20 +754,23 @@ def enforce_symmetry(string: str,
     
     for b0, b1 in brackets:
         for rotation in rotations:
-            if string[b0 + 1:b0 + 1 + len(rotation)].startswith(rotation) or string[b0 + 1:b0 + 1 + len(rotation)].startswith(rotation):
+            if string.startswith(rotation, b0 + 1):
                 symm_points.append(((b0, b1), rotation))
     logging.getLogger('hullbuilder').debug(f'[{__name__}.enforce_symmetry] (pre) {symm_points=}')
     
+    log_pairs = logging.getLogger('hullbuilder').isEnabledFor(logging.DEBUG)
     for i, ((b00, b01), rotation0) in enumerate(symm_points):
         for j, ((b10, b11), rotation1) in enumerate(symm_points[i:]):
-            if j + i not in to_remove:
-                logging.getLogger('hullbuilder').debug(f'[{__name__}.enforce_symmetry] {((b00, b01), rotation0)}-{((b10, b11), rotation1)}; {b10 == b01 + 1=}; {rotation0 == __inverse(rotation1)=}; {b00 < b10 < b11 < b01=}')
+            if j + i not in removed:
+                if log_pairs:
+                    logging.getLogger('hullbuilder').debug(f'[{__name__}.enforce_symmetry] {((b00, b01), rotation0)}-{((b10, b11), rotation1)}; {b10 == b01 + 1=}; {rotation0 == __inverse(rotation1)=}; {b00 < b10 < b11 < b01=}')
                 if b10 == b01 + 1 and rotation0 == __inverse(rotation1):
-                    to_remove.append(i)
-                    to_remove.append(j + i)
+                    to_remove.extend([i, j + i])
+                    removed.update([i, j + i])
                     break
                 if b00 < b10 < b11 < b01:
                     to_remove.append(j + i)
+                    removed.add(j + i)
     logging.getLogger('hullbuilder').debug(f'[{__name__}.enforce_symmetry] {to_remove=}')
     
     for i in reversed(sorted(to_remove)):
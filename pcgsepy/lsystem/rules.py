@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 import numpy as np
 
@@ -75,6 +75,24 @@ class StochasticRules:
             'lhs_alphabet': list(self.lhs_alphabet)
         }
 
+    @staticmethod
+    def from_iterable(rules: Iterable[Tuple[str, str, float]]) -> 'StochasticRules':
+        """Create a ruleset from a sequence of rules.
+
+        Args:
+            rules (Iterable[Tuple[str, str, float]]): The `(lhs, rhs, p)` rules.
+
+        Returns:
+            StochasticRules: The ruleset.
+        """
+        sr = StochasticRules()
+        for lhs, rhs, p in rules:
+            rhss, ps = sr._rules.setdefault(lhs, ([], []))
+            rhss.append(rhs)
+            ps.append(p)
+        sr.lhs_alphabet = {lhs.replace('(x)', '').replace(']', '') for lhs in sr._rules}
+        return sr
+
     @staticmethod
     def from_json(my_args: Dict[str, Any]) -> 'StochasticRules':
         sr = StochasticRules()
@@ -100,14 +118,13 @@ class RuleMaker:
         Returns:
             StochasticRules: The ruleset.
         """
-        rules = StochasticRules()
+        parsed = []
         for rule in self.ruleset:
             if rule.startswith('#'):  # comment in configuration file
                 pass
             else:
                 lhs, p, rhs = rule.strip().split(' ')
-                rules.add_rule(lhs=lhs,
-                               rhs=rhs,
-                               p=float(p))
+                parsed.append((lhs, rhs, float(p)))
+        rules = StochasticRules.from_iterable(rules=parsed)
         rules.validate()
         return rules
@@ -1,3 +1,4 @@
+from collections import Counter
 from functools import cached_property
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -87,12 +88,9 @@ class CandidateSolution:
             'Thrusters': ['MyObjectBuilder_Thrust_LargeBlockSmallThrust'],
             'Lights': ['MyObjectBuilder_InteriorLight_SmallLight', 'MyObjectBuilder_InteriorLight_LargeBlockLight_1corner']
         }
-        counts = {}
-        for k, vs in unique_blocks_dict.items():
-            counts[k] = 0
-            for v in vs:
-                counts[k] = counts[k] + self._content.unique_blocks_count(block_type=v)
-        return counts
+        # count all block types in a single pass over the blocks
+        block_types_count = Counter(b.block_type for b in self._content._blocks.values())
+        return {k: sum(block_types_count[v] for v in vs) for k, vs in unique_blocks_dict.items()}
     
     def to_json(self) -> Dict[str, Any]:
         return {
@@ -1,6 +1,7 @@
 from typing import Any, Dict, Tuple
 import numpy as np
 
+from pcgsepy.common.cache import LRUCache
 from pcgsepy.lsystem.solution import CandidateSolution
 
 
@@ -19,10 +20,13 @@ class BehaviorCharacterization:
         self.name = name
         self.bounds = bounds
         self.f = func
+        # behavior values, keyed by structure fingerprint
+        self._cache = LRUCache()
 
     def __call__(self,
                  cs: CandidateSolution) -> float:
-        return self.f(cs)
+        return self._cache.get_or_compute(key=cs.content.fingerprint,
+                                          f=lambda: self.f(cs))
 
     def to_json(self) -> Dict[str, Any]:
         return {
@@ -90,24 +94,12 @@ def symmetry(cs: CandidateSolution):
     pivot_blocktype = 'MyObjectBuilder_Cockpit_OpenCockpitLarge'
     midpoint = [x for x in structure._blocks.values() if x.block_type == pivot_blocktype][0].position.scale(1 / structure.grid_size).to_veci()
     arr = structure.as_grid_array
+    # the error along an axis is the difference between the masses of the two halves
+    # on either side of the pivot, so each half is summed directly without copying it
+    # sums are signed: the grid is unsigned, so their difference would otherwise wrap around
+    err_x = abs(np.sum(arr[midpoint.x:, :, :], dtype=np.int64) - np.sum(arr[:midpoint.x - 1, :, :], dtype=np.int64))
+    err_z = abs(np.sum(arr[:, :, midpoint.z:], dtype=np.int64) - np.sum(arr[:, :, :midpoint.z - 1], dtype=np.int64))
     
-    # along x
-    x_shape = max(midpoint.x, arr.shape[0] - midpoint.x)
-    upper = np.zeros((x_shape, arr.shape[1], arr.shape[2]))
-    lower = np.zeros((x_shape, arr.shape[1], arr.shape[2]))
-    upper[np.nonzero(np.flip(arr[midpoint.x:, :, :], 1))] = np.flip(arr[midpoint.x:, :, :], 1)[np.nonzero(np.flip(arr[midpoint.x:, :, :], 1))]
-    lower[np.nonzero(arr[:midpoint.x - 1, :, :])] = arr[np.nonzero(arr[:midpoint.x - 1, :, :])]
-    err_x = abs(np.sum(upper - lower))
-    
-    # along z
-    z_shape = max(midpoint.z, arr.shape[2] - midpoint.z)
-    upper = np.zeros((arr.shape[0], arr.shape[1], z_shape))
-    lower = np.zeros((arr.shape[0], arr.shape[1], z_shape))
-    tmp = np.flip(arr[:, :, midpoint.z:], 2)
-    upper[np.nonzero(np.flip(arr[:, :, midpoint.z:], 2))] = np.flip(arr[:, :, midpoint.z:], 2)[np.nonzero(np.flip(arr[:, :, midpoint.z:], 2))]
-    lower[np.nonzero(arr[:, :, :midpoint.z - 1])] = arr[np.nonzero(arr[:, :, :midpoint.z - 1])]
-    err_z = abs(np.sum(upper - lower))
-        
     return 1 - (min(err_x, err_z) / np.sum(arr))
 
 
@@ -66,8 +66,23 @@ class Buffer:
             merge_method (Callable[[Any, Any], Any], optional): The merging method. Defaults to `mean_merge`.
         """
         self._xs, self._ys = [], []
+        self._idxs: Dict[Tuple[Tuple[int, ...], bytes], int] = {}
         self._merge = merge_method
 
+    @staticmethod
+    def _key(x: Any) -> Tuple[Tuple[int, ...], bytes]:
+        """Get the lookup key of an element. Elements that are `np.array_equal` share the same key.
+
+        Args:
+            x (Any): The element.
+
+        Returns:
+            Tuple[Tuple[int, ...], bytes]: The key.
+        """
+        # adding 0. maps -0. to 0.
+        x = np.asarray(x, dtype=np.float64) + 0.
+        return x.shape, x.tobytes()
+
     def _contains(self,
                   x: Any) -> int:
         """Check whether the element is present in the buffer. If it is, the index of the element is returned, otherwise `-1` is returned.
@@ -78,10 +93,7 @@ class Buffer:
         Returns:
             int: The index of the element if it is present, otherwise `-1`.
         """
-        for i, _x in enumerate(self._xs):
-            if np.array_equal(x, _x):
-                return i
-        return -1
+        return self._idxs.get(self._key(x), -1)
 
     def insert(self,
                x: Any,
@@ -97,6 +109,7 @@ class Buffer:
             y0 = self._ys[i]
             self._ys[i] = self._merge(y0, y)
         else:
+            self._idxs[self._key(x)] = len(self._xs)
             self._xs.append(np.asarray(x))
             self._ys.append(y)
 
@@ -110,9 +123,7 @@ class Buffer:
             Tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]: The input data and label data as NumPy arrays.
         """
         if len(self._xs) > 0:
-            xs = np.empty((len(self._xs), len(self._xs[0])))
-            for i, X in enumerate(self._xs):
-                xs[i, :] = X
+            xs = np.asarray(self._xs, dtype=np.float64)
             ys = np.asarray(self._ys)
             return xs, ys
         else:
@@ -121,6 +132,7 @@ class Buffer:
     def clear(self) -> None:
         """Clear the buffer."""
         self._xs, self._ys = [], []
+        self._idxs = {}
 
     def to_json(self) -> Dict[str, Any]:
         return {
@@ -134,4 +146,5 @@ class Buffer:
         b = Buffer(merge_method=merge_methods[my_args['merge_method']])
         b._xs = [np.asarray(x) for x in my_args['xs']]
         b._ys = [np.asarray(y) for y in my_args['ys']]
+        b._idxs = {b._key(x): i for i, x in enumerate(b._xs)}
         return b
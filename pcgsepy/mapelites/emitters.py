@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 import logging
 
 import numpy as np
@@ -17,17 +17,9 @@ from sklearn.neighbors import KNeighborsRegressor
 
 logging.getLogger('emitter').info(msg=f'PyTorch set to {USE_TORCH}')
 
-if USE_TORCH:
-    from pcgsepy.nn.estimators import NonLinearEstimator, train_estimator
-else:
-    class NonLinearEstimator():
-        def __init__(self,
-                     xshape,
-                     yshape):
-            raise NotImplementedError('This object should never be instantiated')
-
-        def train_estimator(estimator, xs, ys, n_epochs):
-            raise NotImplementedError('This function should never be called')
+if TYPE_CHECKING:
+    # only needed for annotations: importing it at runtime would load PyTorch
+    from pcgsepy.nn.estimators import NonLinearEstimator
 
 
 class Emitter(ABC):
@@ -308,9 +300,8 @@ class HumanPrefMatrixEmitter(Emitter):
         Args:
             bins (np.ndarray[MAPBin]): The MAP-Elites bins.
         """
-        self._prefs = np.zeros(shape=bins.shape, dtype=np.float16)
-        for (i, j), b in np.ndenumerate(bins):
-            self._prefs[i, j] = self._delta if b.non_empty(pop='feasible') or b.non_empty(pop='infeasbile') else 0.
+        non_empty = np.frompyfunc(lambda b: b.non_empty(pop='feasible') or b.non_empty(pop='infeasible'), 1, 1)(bins).astype(bool)
+        self._prefs = np.where(non_empty, self._delta, 0.).astype(np.float16)
         
     def _get_n_new_bins(self,
                         bins: 'np.ndarray[MAPBin]') -> int:
@@ -486,7 +477,7 @@ class ContextualBanditEmitter(Emitter):
         self._n_features_context: int = n_features_context
         self._buffer: Buffer = Buffer(merge_method=mean_merge)
         self._estimator: str = estimator
-        self.estimator: Union[LinearRegression, Ridge, NonLinearEstimator, MLPRegressor] = None
+        self.estimator: Union[LinearRegression, Ridge, 'NonLinearEstimator', MLPRegressor] = None
         self._fitted: bool = False
         
         self.sampling_strategy: str = sampling_strategy
@@ -701,7 +692,7 @@ class PreferenceBanditEmitter(Emitter):
         
         self._buffer: Buffer = Buffer(merge_method=mean_merge)
         self._estimator: str = estimator
-        self.estimator: Union[LinearRegression, Ridge, NonLinearEstimator, MLPRegressor] = None
+        self.estimator: Union[LinearRegression, Ridge, 'NonLinearEstimator', MLPRegressor] = None
         self._fitted: bool = False
         
         self.sampling_strategy: str = sampling_strategy
@@ -1213,7 +1204,7 @@ class SimpleTabularEmitter(Emitter):
         
         self._buffer: Buffer = Buffer(merge_method=mean_merge)
         self._estimator: str = estimator
-        self.estimator: Union[LinearRegression, Ridge, NonLinearEstimator, MLPRegressor] = None
+        self.estimator: Union[LinearRegression, Ridge, 'NonLinearEstimator', MLPRegressor] = None
         self._fitted: bool = False
         
         self.sampling_strategy: str = sampling_strategy
@@ -1,4 +1,6 @@
 from http.client import GATEWAY_TIMEOUT
+import functools
+import itertools
 import random
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -88,6 +90,28 @@ agent_rewards = {
 }
 
 
+# versions are unique across all MAPElites objects
+_versions = itertools.count()
+
+
+def _changes_state(f: Callable) -> Callable:
+    """Decorate a `MAPElites` method that modifies its state: the `version` is updated once the method returns.
+
+    Args:
+        f (Callable): The method.
+
+    Returns:
+        Callable: The decorated method.
+    """
+    @functools.wraps(f)
+    def wrapper(self: 'MAPElites', *args, **kwargs):
+        try:
+            return f(self, *args, **kwargs)
+        finally:
+            self.version = next(_versions)
+    return wrapper
+
+
 class MAPElites:
     def __init__(self,
                  lsystem: LSystem,
@@ -98,7 +122,9 @@ class MAPElites:
                  estimator: Optional[Union[GaussianEstimator, MLPEstimator, QuantileEstimator]] = None,
                  emitter: Optional[Emitter] = RandomEmitter(),
                  agent: Optional[EpsilonGreedyAgent] = None,
-                 agent_rewards: Optional[List[Callable[[Self], float]]] = []):
+                 agent_rewards: Optional[List[Callable[[Self], float]]] = [],
+                 allow_aging: bool = True,
+                 hull_builder: Optional[HullBuilder] = None):
         """Create a MAP-Elites object.
 
         Args:
@@ -111,6 +137,8 @@ class MAPElites:
             emitter (Optional[Emitter], optional): The emitter. Defaults to `RandomEmitter()`.
             agent (Optional[EpsilonGreedyAgent], optional): The selection agent. Defaults to `None`.
             agent_rewards (Optional[List[Callable[[Self], float]]], optional): The rewards for the selection agent. Defaults to `[]`.
+            allow_aging (bool, optional): Whether solutions in the bins age. Defaults to `True`.
+            hull_builder (Optional[HullBuilder], optional): The hull builder. Defaults to a binary-erosion `HullBuilder` without smoothing.
 
         Raises:
             AssertionError: Raised if an invalid configuration of properties is passed.
@@ -144,21 +172,23 @@ class MAPElites:
                                      bin_size=(self.bin_sizes[0][i], self.bin_sizes[1][j]))
         # enforce choosing only one bin at the time
         self.enforce_qnt = True
-        # default hull builder
-        self.hull_builder = HullBuilder(erosion_type='bin',
-                                        apply_erosion=True,
-                                        apply_smoothing=False)
+        # hull builder
+        self.hull_builder = hull_builder if hull_builder is not None else HullBuilder(erosion_type='bin',
+                                                                                      apply_erosion=True,
+                                                                                      apply_smoothing=False)
         # fitness bounds
-        self.max_f_fitness = sum([f.bounds[1] for f in self.feasible_fitnesses])
+        self.max_f_fitness = sum(f.bounds[1] for f in self.feasible_fitnesses)
         self.max_i_fitness = len(self.lsystem.all_hl_constraints) if not self.estimator else 1
         self.infeas_fitness_idx = 1  # 0: min, 1: median, 2: max
         # MAP-Elites properties
         self.allow_res_increase = True
-        self.allow_aging = True
+        self.allow_aging = allow_aging
         # tracking properties
         self.n_new_solutions = 0
         
         self.x_range, self.y_range, self.z_range = X_RANGE, Y_RANGE, Z_RANGE
+        # changes whenever the state of the object changes
+        self.version = next(_versions)
         
     def show_metric(self,
                     metric: str,
@@ -309,6 +339,7 @@ class MAPElites:
         """
         cs.b_descs = (self.b_descs[0](cs), self.b_descs[1](cs))
 
+    @_changes_state
     def subdivide_range(self,
                         bin_idx: Tuple[int, int]) -> None:
         """Subdivide the chosen bin range.
@@ -354,6 +385,7 @@ class MAPElites:
         if isinstance(self.emitter, HumanPrefMatrixEmitter):
             self.emitter._increase_preferences_res(idx=bin_idx)
 
+    @_changes_state
     def _update_bins(self,
                      lcs: List[CandidateSolution]) -> None:
         """Update the bins by assigning new solutions.
@@ -373,6 +405,7 @@ class MAPElites:
             for (_, _), b in np.ndenumerate(self.bins):
                 b.remove_old()
 
+    @_changes_state
     def _age_bins(self,
                   diff: int = -1) -> None:
         """Age all bins.
@@ -434,6 +467,7 @@ class MAPElites:
         logging.getLogger('mapelites').debug(msg=f'[{__name__}._process_expanded_idxs] post {processed_idxs=}')
         return processed_idxs
 
+    @_changes_state
     def update_behavior_descriptors(self,
                                     bs: Tuple[BehaviorCharacterization]) -> None:
         """Update the behavior descriptors used in the MAP-Elites.
@@ -450,6 +484,7 @@ class MAPElites:
             Parallel(n_jobs=-1, prefer="threads")(delayed(self._set_behavior_descriptors)(cs) for cs in lcs)
         self.reset(lcs=lcs)
 
+    @_changes_state
     def toggle_module_mutability(self,
                                  module: str) -> None:
         """Toggle the mutability of the module.
@@ -464,6 +499,7 @@ class MAPElites:
         ms = [x.name for x in self.lsystem.modules]
         self.lsystem.modules[ms.index(module)].active = not self.lsystem.modules[ms.index(module)].active
 
+    @_changes_state
     def update_fitness_weights(self,
                                weights: List[float]) -> None:
         """Update the weights of the Feasible fitnesses.
@@ -476,9 +512,13 @@ class MAPElites:
         for w, f in zip(weights, self.feasible_fitnesses):
             f.weight = w
         # update solutions fitnesses
-        for (_, _), cbin in np.ndenumerate(self.bins):
-            for cs in cbin._feasible:
-                cs.c_fitness = sum([self.feasible_fitnesses[i].weight * cs.fitness[i] for i in range(len(cs.fitness))]) + (self.nsc - cs.ncv)
+        feasible = [cs for cbin in self.bins.flat for cs in cbin._feasible]
+        if feasible:
+            fitnesses = np.asarray([cs.fitness for cs in feasible], dtype=np.float64)
+            ncvs = np.fromiter((cs.ncv for cs in feasible), dtype=np.float64, count=len(feasible))
+            c_fitnesses = fitnesses @ np.asarray(weights[:fitnesses.shape[1]], dtype=np.float64) + (self.nsc - ncvs)
+            for cs, c_fitness in zip(feasible, c_fitnesses.tolist()):
+                cs.c_fitness = c_fitness
 
     def _within_range(self,
                       cs: CandidateSolution) -> bool:
@@ -493,6 +533,7 @@ class MAPElites:
         cs_dims = cs.content._max_dims if cs._content else cs.content_size
         return self.x_range[0] <= cs_dims[0] <= self.x_range[1] and self.y_range[0] <= cs_dims[1] <= self.y_range[1] and self.z_range[0] <= cs_dims[2] <= self.z_range[1]
     
+    @_changes_state
     def generate_initial_populations(self,
                                      pop_size: int = POP_SIZE,
                                      n_retries: int = N_RETRIES) -> None:
@@ -538,6 +579,7 @@ class MAPElites:
         if self.emitter is not None and self.emitter.requires_init:
             self.emitter.init_emitter(bins=self.bins)
 
+    @_changes_state
     def _step(self,
               populations: List[List[CandidateSolution]],
               gen: int) -> List[CandidateSolution]:
@@ -618,6 +660,7 @@ class MAPElites:
         self.n_new_solutions += len(generated)
         return generated
 
+    @_changes_state
     def rand_step(self,
                   gen: int = 0) -> None:
         """Apply a random step.
@@ -674,6 +717,7 @@ class MAPElites:
         logging.getLogger('mapelites').debug(msg=f'[{__name__}.seek_nearest_valid] {new_pop=}')
         return new_pop
     
+    @_changes_state
     def interactive_step(self,
                          bin_idxs: List[List[int]],
                          gen: int = 0) -> float:
@@ -719,6 +763,7 @@ class MAPElites:
                                   bounds=[b.bounds for b in self.b_descs])
         return time.perf_counter() - s
         
+    @_changes_state
     def emitter_step(self,
                      gen: int = 0) -> None:
         """Apply a step according to the emitter.
@@ -795,6 +840,7 @@ class MAPElites:
                                          reward=sum([f(self) for f in self.agent_rewards]))
         return emitter_time
 
+    @_changes_state
     def update_valid_ranges(self,
                             x_range: Tuple[int, int],
                             y_range: Tuple[int, int],
@@ -812,6 +858,7 @@ class MAPElites:
             b._infeasible = list(filter(self._within_range, b._infeasible))
     
     
+    @_changes_state
     def reset(self,
               lcs: Optional[List[CandidateSolution]] = None) -> None:
         """Reset the current MAP-Elites.
@@ -853,6 +900,32 @@ class MAPElites:
         else:
             self.generate_initial_populations()
 
+    @property
+    def emitter(self) -> Optional[Emitter]:
+        """The emitter of the MAP-Elites object.
+
+        Returns:
+            Optional[Emitter]: The emitter.
+        """
+        return self._emitter
+
+    @emitter.setter
+    def emitter(self, emitter: Optional[Emitter]) -> None:
+        self._emitter = emitter
+        self.version = next(_versions)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # objects pickled before `emitter` became a property store it as a plain attribute
+        if 'emitter' in state:
+            state['_emitter'] = state.pop('emitter')
+        self.__dict__.update(state)
+        # a version from another process may clash with the ones created in this process
+        self.version = next(_versions)
+
+    def mark_changed(self) -> None:
+        """Update the `version` after the state has been modified outside of this object."""
+        self.version = next(_versions)
+
     def save_population(self,
                         filename: str = './population.pop') -> None:
         all_cs = []
@@ -862,6 +935,7 @@ class MAPElites:
         with open(filename, 'w') as f:
             f.write(json_dumps(all_cs))
        
+    @_changes_state
     def load_population(self,
                         filename: str = './population.pop') -> None:
         all_cs = []
@@ -871,17 +945,15 @@ class MAPElites:
         self._update_bins(lcs=all_cs)
         # update bins for elites
         self.update_elites()
-        for (_, _), b in np.ndenumerate(self.bins):
-            for pop in ['feasible', 'infeasible']:
-                if b.non_empty(pop=pop):
-                    e = b.get_elite(population=pop)
-                    if e._content is None:
-                        self.lsystem._set_structure(cs=e, make_graph=False)
-                        self._prepare_cs_content(cs=e)
+        elites = [b.get_elite(population=pop) for (_, _), b in np.ndenumerate(self.bins)
+                  for pop in ['feasible', 'infeasible'] if b.non_empty(pop=pop)]
+        elites = [self.lsystem._set_structure(cs=e, make_graph=False) for e in elites if e._content is None]
+        Parallel(n_jobs=-1, prefer="threads")(delayed(self._prepare_cs_content)(e) for e in elites)
         # initialise emitter if needed
         if self.emitter is not None and self.emitter.requires_init:
                 self.emitter.init_emitter(bins=self.bins)
     
+    @_changes_state
     def update_elites(self,
                       reset: bool = False):
         """Update the elite tracking for the MAPElites bins.
@@ -922,7 +994,7 @@ class MAPElites:
         Returns:
             int: The total number of solutions in the archive for the selected population.
         """
-        return np.sum([b.get_metric(metric='size', population=pop) for (_, _), b in np.ndenumerate(self.bins)])
+        return sum(b.get_metric(metric='size', population=pop) for b in self.bins.flat)
     
     
     def to_json(self) -> Dict[str, Any]:
@@ -956,11 +1028,11 @@ class MAPElites:
                        estimator=None,
                        emitter=RandomEmitter(),
                        agent=None,
-                       agent_rewards=None)
+                       agent_rewards=None,
+                       allow_aging=my_args['allow_aging'])
         me._initial_n_bins = my_args['initial_n_bins']
         me.enforce_qnt = my_args['enforce_qnt']
         me.allow_res_increase = my_args['allow_res_increase']
-        me.allow_aging = my_args['allow_aging']
         if my_args['emitter']:
             me.emitter = emitters[my_args['emitter']
                                   ['name']].from_json(my_args['emitter'])
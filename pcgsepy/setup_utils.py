@@ -2,7 +2,7 @@ import copy
 import json
 import os
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable
 
 import matplotlib
 from matplotlib import pyplot as plt
@@ -46,15 +46,16 @@ def setup_matplotlib(type3_fix: bool = True,
         plt.rc('figure', titlesize=BIGGER_SIZE)  # fontsize of the figure title
 
 
-def get_default_lsystem(used_ll_blocks: List[str]) -> LSystem:
+def get_default_lsystem(used_ll_blocks: Iterable[str]) -> LSystem:
     """Get the default L-system.
 
     Args:
-        used_ll_blocks (List[str]): List of game blocks used.
+        used_ll_blocks (Iterable[str]): The game blocks used.
 
     Returns:
         LSystem: The default L-system.
     """
+    used_ll_blocks = frozenset(used_ll_blocks)
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         os.chdir(sys._MEIPASS)
         curr_dir = os.path.dirname(sys.executable)
@@ -86,7 +87,7 @@ def get_default_lsystem(used_ll_blocks: List[str]) -> LSystem:
     # create the low-level alphabet
     ll_alphabet = {k: v for k, v in common_alphabet.items()}
     ll_alphabet.update({k: {"action": AtomAction.PLACE, "args": [k]}
-                       for k in used_ll_blocks})
+                       for k in sorted(used_ll_blocks)})
     # create the rulesets
     hl_rules = RuleMaker(ruleset=os.path.join(curr_dir, 'hlrules_sm')).get_rules()
     ll_rules = RuleMaker(ruleset=os.path.join(curr_dir, 'llrules')).get_rules()
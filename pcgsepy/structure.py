@@ -193,7 +193,7 @@ def _is_transparent_block(block_type: str) -> bool:
 
 class Structure:
     __slots__ = ['origin_coords', 'orientation_forward', 'orientation_up', 'grid_size', '_blocks',
-                 '_has_intersections', '_scaled_arr', '_air_gridmask', '_arr']
+                 '_has_intersections', '_scaled_arr', '_air_gridmask', '_arr', '_fingerprint']
     
     def __init__(self, origin: Vec,
                  orientation_forward: Vec,
@@ -217,6 +217,7 @@ class Structure:
         self._scaled_arr: npt.NDArray[np.uint16] = None
         self._air_gridmask: npt.NDArray[np.bool8] = None
         self._arr: npt.NDArray[np.uint16] = None
+        self._fingerprint: int = None
 
     def __repr__(self) -> str:
         return f'{self.grid_size}x Structure with {len(self._blocks.keys())} blocks'
@@ -321,6 +322,18 @@ class Structure:
                 self._arr[r] = list(block_definitions.keys()).index(block.block_type) + 1
         return self._arr
 
+    @property
+    def fingerprint(self) -> int:
+        """Get a hash of the structure's blocks layout, used to memoize computations on the structure.
+
+        Returns:
+            int: The hash of the structure's grid array.
+        """
+        if self._fingerprint is None:
+            arr = self.as_grid_array
+            self._fingerprint = hash((self.grid_size, arr.shape, arr.tobytes()))
+        return self._fingerprint
+
     @property
     def has_intersections(self) -> bool:
         """Check if the Structure contains an intersection between blocks.
@@ -429,6 +442,7 @@ class Structure:
         self._scaled_arr = None
         self._arr = None
         self._air_gridmask = None
+        self._fingerprint = None
 
     def update(self, origin: Vec,
                orientation_forward: Vec,
@@ -499,8 +513,8 @@ class Structure:
         else:
             return all_blocks
 
-    def _clean_label(self,
-                     a: str) -> str:
+    @staticmethod
+    def _clean_label(a: str) -> str:
         """Remove prefix block type from label.
 
         Args:
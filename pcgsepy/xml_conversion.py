@@ -281,12 +281,16 @@ def convert_structure_to_xml(structure: Structure,
             str: The XML string.
     """
     builder_id = '0'
+    # most blocks share the same few colors
+    hsv_masks = {}
 
     def armour_blocks(block: Block) -> str:
         builder, xsi, block_type = block.block_type.split('_')
         pos = block.position.scale(v=1 / structure.grid_size).to_veci()
-        hsv = rgb_to_hsv(rgb=block.color)
-        hsv = rescale_hsv(hsv=hsv)
+        rgb = block.color.as_tuple()
+        hsv = hsv_masks.get(rgb)
+        if hsv is None:
+            hsv = hsv_masks[rgb] = rescale_hsv(hsv=rgb_to_hsv(rgb=block.color))
         return f"""<MyObjectBuilder_CubeBlock xsi:type="{builder}_{xsi}">
 			<SubtypeName>{block_type}</SubtypeName>
 			<Min x = "{pos.x}" y="{pos.y}" z="{pos.z}" />
@@ -11,7 +11,7 @@ USE_TORCH = config['LIBRARY'].getboolean('use_torch')
 
 base_dependencies = [
     "bs4 >= 0.0.1",
-    "dash >= 2.4.0",
+    "dash >= 2.9.0",
     "dash-bootstrap-components >= 1.2.1",
     "dash-core-components >= 2.0.0",
     "dash-html-components >= 2.0.0",
@@ -19,6 +19,7 @@ base_dependencies = [
     "joblib == 1.2.0",
     "matplotlib >= 3.5.1",
     "numpy >= 1.22.3",
+    "orjson >= 3.6.0",
     "pandas >= 1.4.2",
     "plotly == 5.5.0",
     # "plotly-orca == 1.3.1",
@@ -0,0 +1,34 @@
+import unittest
+
+from pcgsepy.common.vecs import Vec
+from pcgsepy.lsystem.solution import CandidateSolution
+from pcgsepy.mapelites.behaviors import symmetry
+from pcgsepy.structure import Block, Structure
+
+
+class TestSymmetry(unittest.TestCase):
+    def test_asymmetric_structure_is_in_unit_range(self):
+        # 6x2x6 grid with the cockpit at (3,0,3) and the bulk of the grid values below the pivot on both axes,
+        # so the difference between the two halves is negative along X and Z
+        structure = Structure(origin=Vec.v3f(0., 0., 0.),
+                              orientation_forward=Vec.v3f(0., 0., 1.),
+                              orientation_up=Vec.v3f(0., 1., 0.),
+                              grid_size=5)
+        structure.add_block(block=Block(block_type='MyObjectBuilder_Cockpit_OpenCockpitLarge'),
+                            grid_position=(15, 0, 15))
+        for i in range(2):
+            for j in range(2):
+                for k in range(2):
+                    structure.add_block(block=Block(block_type='MyObjectBuilder_CubeBlock_LargeArmorHalfSlopedPanelHeavy'),
+                                        grid_position=(i * 5, j * 5, k * 5))
+        structure.add_block(block=Block(block_type='MyObjectBuilder_CubeBlock_LargeBlockArmorBlock'),
+                            grid_position=(25, 5, 25))
+        self.assertEqual(structure.as_grid_array.shape, (6, 2, 6))
+
+        value = symmetry(CandidateSolution(string='', content=structure))
+        self.assertGreaterEqual(value, 0.)
+        self.assertLess(value, 1.)
+
+
+if __name__ == '__main__':
+    unittest.main()